@@ -2,6 +2,64 @@
 """
 Queen's Blood Python Engine package.
 
-For now this just marks qb_engine as a Python package.
-We'll fill it out step by step.
+Importing the package is cheap: the public names below are resolved on
+first attribute access (PEP 562), so `import qb_engine` loads no engine
+module, and `qb_engine.get_effect_engine()` (see qb_engine.runtime) loads
+the card DB and effect registry only when first called.
 """
+
+from importlib import import_module
+
+# Not imported from typing: that alone would double the import time
+TYPE_CHECKING = False
+
+# Public name -> defining module
+_LAZY_ATTRS = {
+    "BoardState": "qb_engine.board_state",
+    "Card": "qb_engine.models",
+    "CardDestructionEngine": "qb_engine.destruction",
+    "CardHydrator": "qb_engine.card_hydrator",
+    "EffectEngine": "qb_engine.effect_engine",
+    "EventDispatcher": "qb_engine.triggers",
+    "Move": "qb_engine.moves",
+    "MoveRanker": "qb_engine.move_ranker",
+    "PredictorEngine": "qb_engine.search",
+    "SharedCardTables": "qb_engine.shared_tables",
+    "generate_legal_moves": "qb_engine.legality",
+    "get_card_hydrator": "qb_engine.runtime",
+    "get_effect_engine": "qb_engine.runtime",
+    "make_move": "qb_engine.moves",
+    "score_board": "qb_engine.scoring",
+    "unmake_move": "qb_engine.moves",
+}
+
+__all__ = sorted(_LAZY_ATTRS)
+
+if TYPE_CHECKING:
+    from qb_engine.board_state import BoardState
+    from qb_engine.card_hydrator import CardHydrator
+    from qb_engine.destruction import CardDestructionEngine
+    from qb_engine.effect_engine import EffectEngine
+    from qb_engine.legality import generate_legal_moves
+    from qb_engine.models import Card
+    from qb_engine.move_ranker import MoveRanker
+    from qb_engine.moves import Move, make_move, unmake_move
+    from qb_engine.runtime import get_card_hydrator, get_effect_engine
+    from qb_engine.scoring import score_board
+    from qb_engine.search import PredictorEngine
+    from qb_engine.shared_tables import SharedCardTables
+    from qb_engine.triggers import EventDispatcher
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'qb_engine' has no attribute '{name}'")
+    value = getattr(import_module(module_name), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
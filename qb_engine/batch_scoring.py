@@ -0,0 +1,113 @@
+# qb_engine/batch_scoring.py
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from qb_engine.bitboard import NUM_COLS, NUM_LANES
+from qb_engine.board_state import BoardState
+from qb_engine.effect_engine import EffectEngine
+
+
+# Side codes used in the stacked arrays
+SIDE_YOU = 1
+SIDE_ENEMY = -1
+SIDE_NONE = 0
+
+
+@dataclass
+class BoardBatch:
+    """
+    N boards as stacked (N, 3, 5) arrays:
+
+    - power:      base power of the occupant (0 on empty tiles)
+    - side:       SIDE_YOU / SIDE_ENEMY for the occupant's side, SIDE_NONE
+                  for empty tiles (and cards on neutral tiles, which score
+                  for nobody)
+    - aura_delta: net power change from active effects on the occupant
+    """
+    power: np.ndarray
+    side: np.ndarray
+    aura_delta: np.ndarray
+
+    def __len__(self) -> int:
+        return self.power.shape[0]
+
+
+@dataclass
+class BatchScores:
+    """
+    Rules-level scores (qb_rules §9) for every board in a batch.
+
+    - lane_scores:  (N, 2, 3)  [:, 0] = YOU, [:, 1] = ENEMY, per lane
+    - lane_winners: (N, 3)     SIDE_YOU / SIDE_ENEMY / SIDE_NONE (tie)
+    - match_scores: (N, 2)     [:, 0] = YOU, [:, 1] = ENEMY
+    - winners:      (N,)       SIDE_YOU / SIDE_ENEMY / SIDE_NONE (tie)
+    """
+    lane_scores: np.ndarray
+    lane_winners: np.ndarray
+    match_scores: np.ndarray
+    winners: np.ndarray
+
+    @property
+    def margins(self) -> np.ndarray:
+        """matchScore(YOU) - matchScore(ENEMY) per board."""
+        return self.match_scores[:, 0] - self.match_scores[:, 1]
+
+
+def empty_batch(n: int) -> BoardBatch:
+    shape = (n, NUM_LANES, NUM_COLS)
+    return BoardBatch(
+        power=np.zeros(shape, dtype=np.int32),
+        side=np.zeros(shape, dtype=np.int8),
+        aura_delta=np.zeros(shape, dtype=np.int32),
+    )
+
+
+def boards_to_batch(boards: Sequence[BoardState], effect_engine: EffectEngine) -> BoardBatch:
+    """
+    Convert BoardStates into a BoardBatch, resolving effects once per board
+    with EffectEngine.compute_board_powers.
+    """
+    batch = empty_batch(len(boards))
+    hydrator = effect_engine.card_hydrator
+
+    for n, board in enumerate(boards):
+        powers = effect_engine.compute_board_powers(board).powers
+        for lane_index, row in enumerate(board.tiles):
+            for col_index, tile in enumerate(row):
+                if tile.card_id is None:
+                    continue
+                base = hydrator.get_card(tile.card_id).power
+                batch.power[n, lane_index, col_index] = base
+                batch.aura_delta[n, lane_index, col_index] = powers[lane_index][col_index] - base
+                if tile.owner == "Y":
+                    batch.side[n, lane_index, col_index] = SIDE_YOU
+                elif tile.owner == "E":
+                    batch.side[n, lane_index, col_index] = SIDE_ENEMY
+
+    return batch
+
+
+def score_batch(batch: BoardBatch) -> BatchScores:
+    """
+    Lane scores, lane winners, match scores and match winners for all N
+    boards at once, using only vectorized array operations.
+    """
+    effective = batch.power.astype(np.int64) + batch.aura_delta
+
+    you = np.where(batch.side == SIDE_YOU, effective, 0).sum(axis=2)      # (N, 3)
+    enemy = np.where(batch.side == SIDE_ENEMY, effective, 0).sum(axis=2)  # (N, 3)
+
+    lane_winners = np.sign(you - enemy).astype(np.int8)                   # (N, 3)
+
+    match_you = np.where(lane_winners == SIDE_YOU, you, 0).sum(axis=1)
+    match_enemy = np.where(lane_winners == SIDE_ENEMY, enemy, 0).sum(axis=1)
+
+    return BatchScores(
+        lane_scores=np.stack([you, enemy], axis=1),
+        lane_winners=lane_winners,
+        match_scores=np.stack([match_you, match_enemy], axis=1),
+        winners=np.sign(match_you - match_enemy).astype(np.int8),
+    )
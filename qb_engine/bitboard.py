@@ -0,0 +1,134 @@
+# qb_engine/bitboard.py
+
+from dataclasses import dataclass, field
+from typing import Iterator, List, Tuple
+
+
+# Board geometry (3 lanes x 5 columns)
+NUM_LANES = 3
+NUM_COLS = 5
+NUM_TILES = NUM_LANES * NUM_COLS
+
+MAX_RANK = 3
+
+# Every tile set
+ALL_TILES_MASK = (1 << NUM_TILES) - 1
+
+# One mask per lane: TOP, MID, BOT
+LANE_MASKS: Tuple[int, ...] = tuple(
+    ((1 << NUM_COLS) - 1) << (lane_index * NUM_COLS)
+    for lane_index in range(NUM_LANES)
+)
+
+
+def tile_index(lane_index: int, col_index: int) -> int:
+    """
+    Map (lane_index, col_index) to a bit position:
+
+        index = lane_index * 5 + col_index
+    """
+    return lane_index * NUM_COLS + col_index
+
+
+def tile_bit(lane_index: int, col_index: int) -> int:
+    """
+    Return the single-bit mask for a tile.
+    """
+    return 1 << (lane_index * NUM_COLS + col_index)
+
+
+def index_to_tile(index: int) -> Tuple[int, int]:
+    """
+    Inverse of tile_index: bit position -> (lane_index, col_index).
+    """
+    return divmod(index, NUM_COLS)
+
+
+def iter_indices(mask: int) -> Iterator[int]:
+    """
+    Yield the bit positions set in `mask`, lowest first (row-major order).
+    """
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def iter_tiles(mask: int) -> Iterator[Tuple[int, int]]:
+    """
+    Yield (lane_index, col_index) for every tile set in `mask`, row-major.
+    """
+    for index in iter_indices(mask):
+        yield divmod(index, NUM_COLS)
+
+
+def popcount(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+@dataclass
+class BoardMasks:
+    """
+    Bitmask view of the board's tile state.
+
+    Each attribute is a 15-bit int with one bit per tile (see tile_index):
+      - owner_y:  tiles owned by YOU
+      - owner_e:  tiles owned by ENEMY
+      - occupied: tiles holding a card
+      - aura:     tiles with at least one effect aura
+      - rank[r]:  tiles whose visible rank is exactly r (r = 0..3)
+
+    Neutral tiles are those in neither owner mask.
+    """
+
+    owner_y: int = 0
+    owner_e: int = 0
+    occupied: int = 0
+    aura: int = 0
+    rank: List[int] = field(default_factory=lambda: [0] * (MAX_RANK + 1))
+
+    def owner_mask(self, side: str) -> int:
+        """
+        Return the owner mask for "Y" or "E" (neutral tiles for "N").
+        """
+        if side == "Y":
+            return self.owner_y
+        if side == "E":
+            return self.owner_e
+        return ALL_TILES_MASK & ~(self.owner_y | self.owner_e)
+
+    def rank_at_least(self, rank: int) -> int:
+        """
+        Return all tiles whose visible rank is >= rank.
+        """
+        if rank <= 0:
+            return ALL_TILES_MASK
+        mask = 0
+        for r in range(rank, MAX_RANK + 1):
+            mask |= self.rank[r]
+        return mask
+
+    def set_tile(self, index: int, owner: str, rank: int) -> None:
+        """
+        Record owner/rank for one tile, clearing whatever bits it had before.
+        """
+        bit = 1 << index
+        clear = ~bit
+
+        self.owner_y &= clear
+        self.owner_e &= clear
+        if owner == "Y":
+            self.owner_y |= bit
+        elif owner == "E":
+            self.owner_e |= bit
+
+        for r in range(MAX_RANK + 1):
+            self.rank[r] &= clear
+        self.rank[min(max(rank, 0), MAX_RANK)] |= bit
+
+    def legal_tiles(self, side: str, cost: int) -> int:
+        """
+        Tiles where `side` may legally play a card of the given cost:
+        empty, owned by `side`, and visible rank >= cost.
+        """
+        return self.owner_mask(side) & ~self.occupied & self.rank_at_least(cost)
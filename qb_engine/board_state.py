@@ -1,11 +1,21 @@
 # qb_engine/board_state.py
 
+from bisect import insort
 from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 
+from qb_engine.bitboard import NUM_COLS, NUM_TILES, BoardMasks, tile_bit, tile_index
 from qb_engine.models import Card
 from qb_engine.pawn_delta import PawnDelta
 from qb_engine.effect_aura import EffectAura
+from qb_engine.zobrist import (
+    SIDE_TO_MOVE_KEY,
+    aura_key,
+    occupant_key,
+    pawn_delta_key,
+    power_bonus_key,
+    tile_state_key,
+)
 
 
 # Mapping from human lane names to indices
@@ -15,6 +25,22 @@ LANE_NAME_TO_INDEX = {
     "BOT": 2,
 }
 
+# Undo trail entry kinds (see BoardState.push_undo_frame)
+_UNDO_OCCUPANT = 0       # (kind, lane_index, col_index, previous_card_id)
+_UNDO_DELTA_ADDED = 1    # (kind, delta, previous_owner, previous_rank)
+_UNDO_DELTA_REMOVED = 2  # (kind, delta, log_pos, card_pos, previous_owner, previous_rank)
+_UNDO_AURA_ADDED = 3     # (kind, aura)
+_UNDO_AURA_REMOVED = 4   # (kind, aura, log_pos, tile_pos, card_pos)
+_UNDO_SIDE_TO_MOVE = 5   # (kind, previous_side)
+_UNDO_POWER_BONUS = 6    # (kind, lane_index, col_index, previous_bonus)
+
+# Compact, picklable board encoding (see BoardState.encode):
+#   (side_to_move,
+#    ((owner, rank, card_id, base_influence, power_bonus), ...)    15 tiles, row-major
+#    ((lane, col, card_id, delta, src_lane, src_col), ...)         pawn_deltas, in order
+#    ((lane, col, card_id, description, src_lane, src_col), ...))  effect_auras, in order
+BoardEncoding = Tuple[str, tuple, tuple, tuple]
+
 
 @dataclass
 class Tile:
@@ -29,12 +55,16 @@ class Tile:
         +1 = your side
          0 = neutral
         -1 = enemy side
+    - power_bonus: permanent power change applied to the occupant by
+      triggered effects (on_play, on_destroy, reactive); cleared when the
+      card leaves the tile
     """
 
     owner: str         # "Y", "E", or "N"
     rank: int          # visible rank (0..3)
     card_id: Optional[str] = None
     base_influence: int = 0
+    power_bonus: int = 0
 
     def __str__(self) -> str:
         """
@@ -57,11 +87,66 @@ class BoardState:
     T [Y1]  [N0]   [N0]   [N0]   [E1]
     M [Y1]  [N0]   [N0]   [N0]   [E1]
     B [Y1]  [N0]   [N0]   [N0]   [E1]
+
+    Alongside the Tile objects, the board keeps a BoardMasks view
+    (owner / rank / occupancy / aura bitmasks) in sync, so hot paths like
+    legality can answer with a few integer ANDs. Tiles should therefore be
+    mutated through BoardState methods rather than directly.
+
+    Effect auras are additionally indexed per tile and per source card, so
+    auras_at() only touches the auras on that tile.
+
+    Influence (base_influence + PawnDeltas) is kept as a running per-tile
+    total with a per-card index of contributions, so adding or removing one
+    card's deltas only re-derives owner/rank on the tiles it touched.
+
+    Occupants are indexed card_id -> [(lane_index, col_index), ...] (one
+    entry per copy, row-major), so side lookups never scan the board.
+
+    While an undo frame is open (push_undo_frame), every mutation records
+    its inverse on a trail, and pop_undo_frame reverts exactly those
+    changes in O(changes). qb_engine.moves builds make/unmake on top.
+
+    zobrist_hash is a 64-bit position key (see qb_engine.zobrist) covering
+    occupants, owner/rank per tile, pawn deltas, auras, power bonuses and
+    side_to_move. Every mutation above XORs its features in or out, so the
+    key is always current.
     """
 
     tiles: List[List[Tile]] = field(default_factory=list)
     pawn_deltas: List[PawnDelta] = field(default_factory=list)
     effect_auras: List[EffectAura] = field(default_factory=list)
+    side_to_move: str = "Y"
+    masks: BoardMasks = field(
+        default_factory=BoardMasks, init=False, repr=False, compare=False
+    )
+    _auras_by_tile: List[List[EffectAura]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _auras_by_card: Dict[str, List[EffectAura]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _influence: List[int] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _deltas_by_card: Dict[str, List[PawnDelta]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _card_locations: Dict[str, List[Tuple[int, int]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _trail: Optional[List[tuple]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _undo_depth: int = field(default=0, init=False, repr=False, compare=False)
+    zobrist_hash: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.rebuild_card_index()
+        self.rebuild_aura_index()
+        self.rebuild_delta_index()
+        self.rebuild_masks()
+        self.zobrist_hash = self.compute_zobrist_hash()
 
     # ------------------------------------------------------------------ #
     # Construction & visualization
@@ -114,8 +199,7 @@ class BoardState:
             rendered_row: List[str] = []
             for col_index, tile in enumerate(row):
                 base = str(tile)  # [CARD] or [Y1]/[N0]/[E1]
-                auras = self.auras_at(lane_index, col_index)
-                if auras:
+                if self.masks.aura & tile_bit(lane_index, col_index):
                     if base.endswith("]"):
                         base = base[:-1] + "★]"
                     else:
@@ -135,39 +219,241 @@ class BoardState:
         col_index = col_number - 1
         return self.tile_at(lane_index, col_index)
 
+    # ------------------------------------------------------------------ #
+    # Bitmask view
+    # ------------------------------------------------------------------ #
+
+    def rebuild_masks(self) -> None:
+        """
+        Rebuild the BoardMasks view from scratch using the Tile objects
+        and the current effect auras.
+        """
+        masks = BoardMasks()
+        for lane_index, row in enumerate(self.tiles):
+            for col_index, tile in enumerate(row):
+                index = tile_index(lane_index, col_index)
+                masks.set_tile(index, tile.owner, tile.rank)
+                if tile.card_id is not None:
+                    masks.occupied |= 1 << index
+        for aura in self.effect_auras:
+            masks.aura |= tile_bit(aura.lane_index, aura.col_index)
+        self.masks = masks
+
+    def is_occupied(self, lane_index: int, col_index: int) -> bool:
+        return bool(self.masks.occupied & tile_bit(lane_index, col_index))
+
+    def legal_tiles_mask(self, cost: int, side: str = "Y") -> int:
+        """
+        Bitmask of tiles where `side` may play a card of the given cost
+        (empty, owned by `side`, visible rank >= cost).
+        """
+        return self.masks.legal_tiles(side, cost)
+
     # ------------------------------------------------------------------ #
     # Placing cards
     # ------------------------------------------------------------------ #
 
     def place_card(self, lane_name: str, col_number: int, card: Card) -> None:
-        tile = self.tile_at_name(lane_name, col_number)
-        tile.card_id = card.id
+        lane_index = LANE_NAME_TO_INDEX[lane_name.upper()]
+        col_index = col_number - 1
+        self.place_card_at(lane_index, col_index, card.id)
+
+    def place_card_at(self, lane_index: int, col_index: int, card_id: str) -> None:
+        """
+        Put `card_id` on a tile by index, keeping masks and the card-location
+        index in sync. Any previous occupant is replaced.
+        """
+        tile = self.tile_at(lane_index, col_index)
+        if self._trail is not None:
+            self._trail.append((_UNDO_OCCUPANT, lane_index, col_index, tile.card_id))
+        index = tile_index(lane_index, col_index)
+        if tile.card_id is not None:
+            self._unindex_card(tile.card_id, lane_index, col_index)
+            self.zobrist_hash ^= occupant_key(index, tile.card_id)
+        tile.card_id = card_id
+        self.zobrist_hash ^= occupant_key(index, card_id)
+        insort(self._card_locations.setdefault(card_id, []), (lane_index, col_index))
+        self.masks.occupied |= tile_bit(lane_index, col_index)
         # owner/rank are derived from influence; we don't change them here.
 
+    def remove_card(self, lane_index: int, col_index: int) -> Optional[str]:
+        """
+        Clear the occupant of a tile and return its card id (None if empty).
+
+        Only the occupant (and its power bonus) is removed; the card's
+        PawnDeltas and auras are left for the caller to clean up.
+        """
+        tile = self.tile_at(lane_index, col_index)
+        card_id = tile.card_id
+        if card_id is None:
+            return None
+        if self._trail is not None:
+            self._trail.append((_UNDO_OCCUPANT, lane_index, col_index, card_id))
+        tile.card_id = None
+        self._unindex_card(card_id, lane_index, col_index)
+        if tile.power_bonus:
+            self._set_power_bonus(lane_index, col_index, 0)
+        self.zobrist_hash ^= occupant_key(tile_index(lane_index, col_index), card_id)
+        self.masks.occupied &= ~tile_bit(lane_index, col_index)
+        return card_id
+
+    def locate_card(self, card_id: str) -> List[Tuple[int, int]]:
+        """
+        Return every (lane_index, col_index) holding `card_id`, row-major.
+        """
+        return list(self._card_locations.get(card_id, ()))
+
+    def rebuild_card_index(self) -> None:
+        """
+        Rebuild the card_id -> tiles index from the Tile objects.
+        """
+        self._card_locations = {}
+        for lane_index, row in enumerate(self.tiles):
+            for col_index, tile in enumerate(row):
+                if tile.card_id is not None:
+                    self._card_locations.setdefault(tile.card_id, []).append(
+                        (lane_index, col_index)
+                    )
+
+    def _unindex_card(self, card_id: str, lane_index: int, col_index: int) -> None:
+        locations = self._card_locations[card_id]
+        locations.remove((lane_index, col_index))
+        if not locations:
+            del self._card_locations[card_id]
+
     # ------------------------------------------------------------------ #
     # PawnDelta helpers
     # ------------------------------------------------------------------ #
 
+    def add_pawn_delta(
+        self,
+        lane_index: int,
+        col_index: int,
+        card_id: str,
+        amount: int,
+        source_lane_index: Optional[int] = None,
+        source_col_index: Optional[int] = None,
+    ) -> PawnDelta:
+        """
+        Log a pawn influence change at a tile and apply it immediately.
+
+        Positive amounts push the tile towards YOU, negative towards ENEMY.
+        Only this tile's owner/rank is re-derived.
+        """
+        delta = PawnDelta(
+            lane_index=lane_index,
+            col_index=col_index,
+            card_id=card_id,
+            delta=amount,
+            source_lane_index=source_lane_index,
+            source_col_index=source_col_index,
+        )
+        index = tile_index(lane_index, col_index)
+        if self._trail is not None:
+            tile = self.tiles[lane_index][col_index]
+            self._trail.append((_UNDO_DELTA_ADDED, delta, tile.owner, tile.rank))
+
+        self.pawn_deltas.append(delta)
+        self._deltas_by_card.setdefault(card_id, []).append(delta)
+        self.zobrist_hash ^= _pawn_delta_hash(delta)
+
+        self._influence[index] += amount
+        self._refresh_tile(index)
+        return delta
+
     def add_pawn_delta_for_you(
         self,
         lane_index: int,
         col_index: int,
         card_id: str,
         amount: int = 1,
-    ) -> None:
+        source_lane_index: Optional[int] = None,
+        source_col_index: Optional[int] = None,
+    ) -> PawnDelta:
         """
         Log a pawn influence change for YOU at a tile.
         Positive amount increases your influence.
         """
-        self.pawn_deltas.append(
-            PawnDelta(
-                lane_index=lane_index,
-                col_index=col_index,
-                card_id=card_id,
-                delta=amount,
-            )
+        return self.add_pawn_delta(
+            lane_index,
+            col_index,
+            card_id,
+            amount,
+            source_lane_index=source_lane_index,
+            source_col_index=source_col_index,
         )
 
+    def remove_pawn_delta(self, delta: PawnDelta) -> None:
+        """
+        Remove one specific PawnDelta (by identity) and revert its influence.
+        """
+        log_pos = _remove_identity(self.pawn_deltas, delta)
+
+        by_card = self._deltas_by_card[delta.card_id]
+        card_pos = _remove_identity(by_card, delta)
+        if not by_card:
+            del self._deltas_by_card[delta.card_id]
+
+        if self._trail is not None:
+            tile = self.tiles[delta.lane_index][delta.col_index]
+            self._trail.append(
+                (_UNDO_DELTA_REMOVED, delta, log_pos, card_pos, tile.owner, tile.rank)
+            )
+
+        index = tile_index(delta.lane_index, delta.col_index)
+        self._influence[index] -= delta.delta
+        self.zobrist_hash ^= _pawn_delta_hash(delta)
+        self._refresh_tile(index)
+
+    def remove_pawn_deltas_for_card(
+        self,
+        card_id: str,
+        source_lane_index: Optional[int] = None,
+        source_col_index: Optional[int] = None,
+    ) -> List[PawnDelta]:
+        """
+        Remove every PawnDelta contributed by `card_id` and return them
+        (e.g. when that card is destroyed).
+
+        If a source tile is given, only the deltas from the copy on that
+        tile are removed.
+        """
+        removed = [
+            delta
+            for delta in self._deltas_by_card.get(card_id, ())
+            if source_lane_index is None
+            or (
+                delta.source_lane_index == source_lane_index
+                and delta.source_col_index == source_col_index
+            )
+        ]
+        for delta in removed:
+            self.remove_pawn_delta(delta)
+        return removed
+
+    def pawn_deltas_from_card(self, card_id: str) -> List[PawnDelta]:
+        """
+        Return all PawnDeltas contributed by a given card id.
+        """
+        return list(self._deltas_by_card.get(card_id, ()))
+
+    def influence_at(self, lane_index: int, col_index: int) -> int:
+        """
+        Current influence of a tile: base_influence + its PawnDeltas.
+        """
+        return self._influence[tile_index(lane_index, col_index)]
+
+    def rebuild_delta_index(self) -> None:
+        """
+        Rebuild the running influence totals and the per-card delta index
+        from base_influence and pawn_deltas. Tile owner/rank are left as-is.
+        """
+        self._influence = [tile.base_influence for row in self.tiles for tile in row]
+        self._deltas_by_card = {}
+        for delta in self.pawn_deltas:
+            self._influence[tile_index(delta.lane_index, delta.col_index)] += delta.delta
+            self._deltas_by_card.setdefault(delta.card_id, []).append(delta)
+
     def recompute_influence_from_deltas(self) -> None:
         """
         Recompute tile owner/rank from:
@@ -177,26 +463,26 @@ class BoardState:
           influence > 0  -> owner="Y", rank=min(influence, 3)
           influence < 0  -> owner="E", rank=min(-influence, 3)
           influence == 0 -> owner="N", rank=0
-        """
-        influences: List[List[int]] = [
-            [tile.base_influence for tile in row] for row in self.tiles
-        ]
 
-        for delta in self.pawn_deltas:
-            influences[delta.lane_index][delta.col_index] += delta.delta
+        PawnDelta changes are already applied incrementally; this full pass
+        is kept for boards whose tiles were edited by hand.
+        """
+        self.rebuild_delta_index()
+        for index in range(len(self._influence)):
+            self._refresh_tile(index)
 
-        for lane_index, row in enumerate(self.tiles):
-            for col_index, tile in enumerate(row):
-                influence = influences[lane_index][col_index]
-                if influence > 0:
-                    tile.owner = "Y"
-                    tile.rank = min(influence, 3)
-                elif influence < 0:
-                    tile.owner = "E"
-                    tile.rank = min(-influence, 3)
-                else:
-                    tile.owner = "N"
-                    tile.rank = 0
+    def _refresh_tile(self, index: int) -> None:
+        """
+        Re-derive one tile's owner/rank (and masks) from its influence.
+        """
+        influence = self._influence[index]
+        lane_index, col_index = divmod(index, NUM_COLS)
+        if influence > 0:
+            self._set_tile_state(lane_index, col_index, "Y", min(influence, 3))
+        elif influence < 0:
+            self._set_tile_state(lane_index, col_index, "E", min(-influence, 3))
+        else:
+            self._set_tile_state(lane_index, col_index, "N", 0)
 
     # ------------------------------------------------------------------ #
     # Effect aura helpers
@@ -208,28 +494,284 @@ class BoardState:
         col_index: int,
         card_id: str,
         description: str,
-    ) -> None:
+        source_lane_index: Optional[int] = None,
+        source_col_index: Optional[int] = None,
+    ) -> EffectAura:
         """
         Register an effect aura on a tile for a given source card.
         """
-        self.effect_auras.append(
-            EffectAura(
-                lane_index=lane_index,
-                col_index=col_index,
-                card_id=card_id,
-                description=description,
-            )
+        aura = EffectAura(
+            lane_index=lane_index,
+            col_index=col_index,
+            card_id=card_id,
+            description=description,
+            source_lane_index=source_lane_index,
+            source_col_index=source_col_index,
         )
+        self.effect_auras.append(aura)
+        self._index_aura(aura)
+        self.zobrist_hash ^= _aura_hash(aura)
+        if self._trail is not None:
+            self._trail.append((_UNDO_AURA_ADDED, aura))
+        return aura
+
+    def remove_effect_aura(self, aura: EffectAura) -> None:
+        """
+        Remove one specific aura (by identity) from the board and its indexes.
+        """
+        log_pos = _remove_identity(self.effect_auras, aura)
+
+        index = tile_index(aura.lane_index, aura.col_index)
+        bucket = self._auras_by_tile[index]
+        tile_pos = _remove_identity(bucket, aura)
+        if not bucket:
+            self.masks.aura &= ~(1 << index)
+
+        by_card = self._auras_by_card[aura.card_id]
+        card_pos = _remove_identity(by_card, aura)
+        if not by_card:
+            del self._auras_by_card[aura.card_id]
+
+        self.zobrist_hash ^= _aura_hash(aura)
+        if self._trail is not None:
+            self._trail.append((_UNDO_AURA_REMOVED, aura, log_pos, tile_pos, card_pos))
+
+    def remove_auras_for_card(
+        self,
+        card_id: str,
+        source_lane_index: Optional[int] = None,
+        source_col_index: Optional[int] = None,
+    ) -> List[EffectAura]:
+        """
+        Remove every aura projected by `card_id` and return them.
+
+        If a source tile is given, only auras from the copy on that tile are
+        removed (other copies of the same card keep theirs).
+        """
+        removed = [
+            aura
+            for aura in self._auras_by_card.get(card_id, ())
+            if source_lane_index is None
+            or (
+                aura.source_lane_index == source_lane_index
+                and aura.source_col_index == source_col_index
+            )
+        ]
+        for aura in removed:
+            self.remove_effect_aura(aura)
+        return removed
 
     def auras_at(self, lane_index: int, col_index: int) -> List[EffectAura]:
         """
         Return all effect auras currently affecting a given tile.
         """
-        return [
-            aura
-            for aura in self.effect_auras
-            if aura.lane_index == lane_index and aura.col_index == col_index
+        return list(self._auras_by_tile[tile_index(lane_index, col_index)])
+
+    def auras_from_card(self, card_id: str) -> List[EffectAura]:
+        """
+        Return all effect auras projected by a given source card id.
+        """
+        return list(self._auras_by_card.get(card_id, ()))
+
+    def rebuild_aura_index(self) -> None:
+        """
+        Rebuild the per-tile and per-card aura indexes from effect_auras.
+        """
+        self._auras_by_tile = [[] for _ in range(NUM_TILES)]
+        self._auras_by_card = {}
+        for aura in self.effect_auras:
+            self._index_aura(aura)
+
+    def _index_aura(self, aura: EffectAura) -> None:
+        index = tile_index(aura.lane_index, aura.col_index)
+        self._auras_by_tile[index].append(aura)
+        self._auras_by_card.setdefault(aura.card_id, []).append(aura)
+        self.masks.aura |= 1 << index
+
+    # ------------------------------------------------------------------ #
+    # Power bonuses (triggered effects)
+    # ------------------------------------------------------------------ #
+
+    def add_power_bonus(self, lane_index: int, col_index: int, amount: int) -> None:
+        """
+        Permanently change the power of the card on a tile by `amount`
+        (e.g. an on_play debuff or a reactive self-buff).
+        """
+        tile = self.tiles[lane_index][col_index]
+        self._set_power_bonus(lane_index, col_index, tile.power_bonus + amount)
+
+    def _set_power_bonus(self, lane_index: int, col_index: int, bonus: int) -> None:
+        tile = self.tiles[lane_index][col_index]
+        if self._trail is not None:
+            self._trail.append((_UNDO_POWER_BONUS, lane_index, col_index, tile.power_bonus))
+        index = tile_index(lane_index, col_index)
+        self.zobrist_hash ^= power_bonus_key(index, tile.power_bonus)
+        tile.power_bonus = bonus
+        self.zobrist_hash ^= power_bonus_key(index, bonus)
+
+    # ------------------------------------------------------------------ #
+    # Undo trail
+    # ------------------------------------------------------------------ #
+
+    def push_undo_frame(self) -> int:
+        """
+        Open an undo frame and return its mark (the current trail length).
+
+        Frames nest; they must be closed in LIFO order with pop_undo_frame.
+        """
+        if self._trail is None:
+            self._trail = []
+        self._undo_depth += 1
+        return len(self._trail)
+
+    def pop_undo_frame(self, mark: int) -> None:
+        """
+        Revert every change recorded since `mark` and close the frame.
+        """
+        trail = self._trail
+        if trail is None or mark > len(trail):
+            raise ValueError("No open undo frame for this mark.")
+
+        # Suspend recording while the inverse operations run
+        self._trail = None
+        try:
+            while len(trail) > mark:
+                self._revert(trail.pop())
+        finally:
+            self._undo_depth -= 1
+            self._trail = trail if self._undo_depth > 0 else None
+
+    def _revert(self, entry: tuple) -> None:
+        kind = entry[0]
+
+        if kind == _UNDO_OCCUPANT:
+            _, lane_index, col_index, previous_card_id = entry
+            if previous_card_id is None:
+                self.remove_card(lane_index, col_index)
+            else:
+                self.place_card_at(lane_index, col_index, previous_card_id)
+
+        elif kind == _UNDO_DELTA_ADDED:
+            _, delta, owner, rank = entry
+            self.remove_pawn_delta(delta)
+            self._set_tile_state(delta.lane_index, delta.col_index, owner, rank)
+
+        elif kind == _UNDO_DELTA_REMOVED:
+            _, delta, log_pos, card_pos, owner, rank = entry
+            self.pawn_deltas.insert(log_pos, delta)
+            self._deltas_by_card.setdefault(delta.card_id, []).insert(card_pos, delta)
+            self._influence[tile_index(delta.lane_index, delta.col_index)] += delta.delta
+            self.zobrist_hash ^= _pawn_delta_hash(delta)
+            self._set_tile_state(delta.lane_index, delta.col_index, owner, rank)
+
+        elif kind == _UNDO_AURA_ADDED:
+            self.remove_effect_aura(entry[1])
+
+        elif kind == _UNDO_AURA_REMOVED:
+            _, aura, log_pos, tile_pos, card_pos = entry
+            index = tile_index(aura.lane_index, aura.col_index)
+            self.effect_auras.insert(log_pos, aura)
+            self._auras_by_tile[index].insert(tile_pos, aura)
+            self._auras_by_card.setdefault(aura.card_id, []).insert(card_pos, aura)
+            self.masks.aura |= 1 << index
+            self.zobrist_hash ^= _aura_hash(aura)
+
+        elif kind == _UNDO_SIDE_TO_MOVE:
+            self.set_side_to_move(entry[1])
+
+        elif kind == _UNDO_POWER_BONUS:
+            _, lane_index, col_index, previous_bonus = entry
+            self._set_power_bonus(lane_index, col_index, previous_bonus)
+
+    def _set_tile_state(self, lane_index: int, col_index: int, owner: str, rank: int) -> None:
+        tile = self.tiles[lane_index][col_index]
+        index = tile_index(lane_index, col_index)
+        self.zobrist_hash ^= tile_state_key(index, tile.owner, tile.rank)
+        tile.owner = owner
+        tile.rank = rank
+        self.zobrist_hash ^= tile_state_key(index, owner, rank)
+        self.masks.set_tile(index, owner, rank)
+
+    # ------------------------------------------------------------------ #
+    # Compact encoding
+    # ------------------------------------------------------------------ #
+
+    def encode(self) -> BoardEncoding:
+        """
+        Flat tuple of plain values describing the board exactly, cheap to
+        pickle (e.g. to hand positions to worker processes).
+        """
+        return (
+            self.side_to_move,
+            tuple(
+                (tile.owner, tile.rank, tile.card_id, tile.base_influence, tile.power_bonus)
+                for row in self.tiles
+                for tile in row
+            ),
+            tuple(
+                (d.lane_index, d.col_index, d.card_id, d.delta,
+                 d.source_lane_index, d.source_col_index)
+                for d in self.pawn_deltas
+            ),
+            tuple(
+                (a.lane_index, a.col_index, a.card_id, a.description,
+                 a.source_lane_index, a.source_col_index)
+                for a in self.effect_auras
+            ),
+        )
+
+    @staticmethod
+    def decode(encoding: BoardEncoding) -> "BoardState":
+        """
+        Rebuild a BoardState (with all indexes and the hash) from encode().
+        """
+        side_to_move, tiles, deltas, auras = encoding
+        grid = [
+            [Tile(*tiles[lane_index * NUM_COLS + col_index]) for col_index in range(NUM_COLS)]
+            for lane_index in range(len(tiles) // NUM_COLS)
         ]
+        return BoardState(
+            tiles=grid,
+            pawn_deltas=[PawnDelta(*d) for d in deltas],
+            effect_auras=[EffectAura(*a) for a in auras],
+            side_to_move=side_to_move,
+        )
+
+    # ------------------------------------------------------------------ #
+    # Side to move & position hashing
+    # ------------------------------------------------------------------ #
+
+    def set_side_to_move(self, side: str) -> None:
+        """
+        Set whose turn it is ("Y" or "E"), keeping zobrist_hash in sync.
+        """
+        if side == self.side_to_move:
+            return
+        if self._trail is not None:
+            self._trail.append((_UNDO_SIDE_TO_MOVE, self.side_to_move))
+        self.side_to_move = side
+        self.zobrist_hash ^= SIDE_TO_MOVE_KEY
+
+    def compute_zobrist_hash(self) -> int:
+        """
+        Compute the position hash from scratch (the incrementally maintained
+        zobrist_hash must always equal this).
+        """
+        h = 0
+        for lane_index, row in enumerate(self.tiles):
+            for col_index, tile in enumerate(row):
+                index = tile_index(lane_index, col_index)
+                h ^= tile_state_key(index, tile.owner, tile.rank)
+                if tile.card_id is not None:
+                    h ^= occupant_key(index, tile.card_id)
+                h ^= power_bonus_key(index, tile.power_bonus)
+        for delta in self.pawn_deltas:
+            h ^= _pawn_delta_hash(delta)
+        for aura in self.effect_auras:
+            h ^= _aura_hash(aura)
+        if self.side_to_move == "E":
+            h ^= SIDE_TO_MOVE_KEY
+        return h
 
     # ------------------------------------------------------------------ #
     # Card-side detection (for effect scopes)
@@ -244,27 +786,18 @@ class BoardState:
           None if not found on the board.
 
         If multiple tiles hold the same card_id, we only care about which
-        side (Y/E) it belongs to at all.
+        side (Y/E) it belongs to at all (first copy in row-major order wins).
         """
-        found_neutral = False
-
-        num_lanes = len(self.tiles)
-        num_cols = len(self.tiles[0]) if num_lanes > 0 else 0
+        locations = self._card_locations.get(card_id)
+        if not locations:
+            return None
 
-        for lane in range(num_lanes):
-            for col in range(num_cols):
-                tile = self.tile_at(lane, col)
-                if tile.card_id == card_id:
-                    if tile.owner == "Y":
-                        return "Y"
-                    if tile.owner == "E":
-                        return "E"
-                    found_neutral = True
+        for lane_index, col_index in locations:
+            owner = self.tiles[lane_index][col_index].owner
+            if owner == "Y" or owner == "E":
+                return owner
 
-        if found_neutral:
-            return "N"
-
-        return None
+        return "N"
 
     # ------------------------------------------------------------------ #
     # Effective power helper
@@ -275,3 +808,35 @@ class BoardState:
         Convenience wrapper around EffectEngine.compute_effective_power.
         """
         return effect_engine.compute_effective_power(self, lane, col)
+
+
+def _aura_hash(aura: EffectAura) -> int:
+    return aura_key(
+        tile_index(aura.lane_index, aura.col_index),
+        aura.card_id,
+        aura.source_lane_index,
+        aura.source_col_index,
+    )
+
+
+def _pawn_delta_hash(delta: PawnDelta) -> int:
+    return pawn_delta_key(
+        tile_index(delta.lane_index, delta.col_index),
+        delta.card_id,
+        delta.source_lane_index,
+        delta.source_col_index,
+        delta.delta,
+    )
+
+
+def _remove_identity(items: list, obj: object) -> int:
+    """
+    Remove `obj` from `items` by identity (not ==) and return its position,
+    checking the tail first since the most recently added entry is the
+    usual one to go.
+    """
+    for i in range(len(items) - 1, -1, -1):
+        if items[i] is obj:
+            del items[i]
+            return i
+    raise ValueError("object not present")
@@ -2,8 +2,9 @@
 
 import json
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
+from qb_engine.card_snapshot import load_or_build_snapshot
 from qb_engine.models import Card
 
 
@@ -14,9 +15,14 @@ class CardHydrator:
     Rules/constraints:
     - Never infer data.
     - Use the JSON file in data/qb_DB_Complete_v2.json by default.
+
+    By default the DB is read through a binary snapshot next to the JSON
+    (see qb_engine.card_snapshot): every card comes pre-hydrated, and the
+    snapshot is rebuilt whenever the JSON changes. snapshot_status records
+    how the snapshot was obtained (None when use_snapshot=False).
     """
 
-    def __init__(self, db_path: str | None = None):
+    def __init__(self, db_path: str | None = None, use_snapshot: bool = True):
         # Default path based on your current repo layout
         if db_path is None:
             db_path = "data/qb_DB_Complete_v2.json"
@@ -27,10 +33,17 @@ class CardHydrator:
 
         # Cache of hydrated Card objects, keyed by card id
         self.cache: Dict[str, Card] = {}
-
-        # Load the raw JSON into memory once
-        with self.db_path.open("r", encoding="utf-8") as f:
-            self.db = json.load(f)
+        self.snapshot_status: Optional[str] = None
+
+        if use_snapshot:
+            snapshot = load_or_build_snapshot(self.db_path, self._build_card)
+            self.db = snapshot.records
+            self.cache.update(snapshot.cards)
+            self.snapshot_status = snapshot.status
+        else:
+            # Load the raw JSON into memory once
+            with self.db_path.open("r", encoding="utf-8") as f:
+                self.db = json.load(f)
 
         # Build an index by card id for quick lookup
         self.index: Dict[str, dict] = {
@@ -52,19 +65,24 @@ class CardHydrator:
         if card_id not in self.index:
             raise KeyError(f"Card '{card_id}' not found in database.")
 
-        data = self.index[card_id]
+        card = self._build_card(self.index[card_id])
+        self.cache[card_id] = card
+        return card
 
-        card = Card(
+    @staticmethod
+    def _build_card(data: dict) -> Card:
+        """
+        Construct a Card (bit-plane pattern + projection table) from a raw
+        DB entry.
+        """
+        return Card.from_grid(
+            grid=data["grid"],
             id=data["id"],
             name=data["name"],
             category=data["category"],
             cost=data["cost"],
             power=data["power"],
             pattern=data.get("pattern"),
-            grid=data["grid"],
             effect=data.get("effect"),
             effect_id=data.get("effect_id"), # <-- NEW
         )
-
-        self.cache[card_id] = card
-        return card
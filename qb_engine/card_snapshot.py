@@ -0,0 +1,157 @@
+# qb_engine/card_snapshot.py
+
+import hashlib
+import json
+import os
+import pickle
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from qb_engine.models import Card
+
+
+# Binary snapshot of the card DB (see load_or_build_snapshot).
+#
+# Layout: one fixed header followed by a pickled payload.
+#
+#   magic         8s   b"QBCARDS\0"
+#   version       H    SNAPSHOT_VERSION (bump when Card / payload changes)
+#   json_mtime_ns q    st_mtime_ns of the JSON the snapshot was built from
+#   json_size     q    st_size of that JSON
+#   json_sha256   32s  SHA-256 of the JSON bytes
+#   payload_hash  32s  BLAKE2b-256 of the payload bytes
+#   payload_len   Q    payload length in bytes
+#
+# payload = pickle of {"records": [raw DB entries], "cards": {id: Card}},
+# with every Card's projection_table already built.
+
+SNAPSHOT_MAGIC = b"QBCARDS\0"
+SNAPSHOT_VERSION = 4
+
+_HEADER = struct.Struct("<8sHqq32s32sQ")
+
+
+@dataclass
+class CardSnapshot:
+    """
+    Pre-parsed card DB.
+
+    - records: raw JSON entries, in file order
+    - cards:   id -> fully hydrated Card (projection tables included)
+    - status:  how it was obtained: "loaded" (valid snapshot read),
+               "revalidated" (JSON touched but unchanged; header refreshed)
+               or "rebuilt" (parsed from JSON and written out)
+    """
+    records: List[dict]
+    cards: Dict[str, Card]
+    status: str
+
+
+def snapshot_path_for(db_path: Path) -> Path:
+    """
+    Default snapshot location: next to the JSON, with a .snapshot suffix.
+    """
+    return db_path.with_suffix(".snapshot")
+
+
+def load_or_build_snapshot(
+    db_path: Path,
+    build_card: Callable[[dict], Card],
+    snapshot_path: Optional[Path] = None,
+) -> CardSnapshot:
+    """
+    Return the card DB from its snapshot, rebuilding it from the JSON when
+    the snapshot is missing, corrupt, from another version, or stale.
+
+    A snapshot is current when the JSON's mtime and size match the header;
+    otherwise the JSON is hashed, and a matching SHA-256 only refreshes the
+    header. The snapshot is read with a single read() call, and the payload
+    checksum is verified before unpickling.
+
+    Failing to write the snapshot (e.g. a read-only data directory) is not
+    an error; the freshly parsed DB is returned as usual.
+    """
+    if snapshot_path is None:
+        snapshot_path = snapshot_path_for(db_path)
+    stat = db_path.stat()
+
+    data = _read_all(snapshot_path)
+    header = _parse_header(data) if data is not None else None
+
+    if header is not None:
+        _, _, mtime_ns, size, json_sha256, payload_hash, payload_len = header
+        payload = memoryview(data)[_HEADER.size:]
+        if len(payload) == payload_len and hashlib.blake2b(payload, digest_size=32).digest() == payload_hash:
+            if (mtime_ns, size) == (stat.st_mtime_ns, stat.st_size):
+                return _unpack(payload, "loaded")
+
+            json_bytes = db_path.read_bytes()
+            if hashlib.sha256(json_bytes).digest() == json_sha256:
+                _write(snapshot_path, _HEADER.pack(
+                    SNAPSHOT_MAGIC, SNAPSHOT_VERSION, stat.st_mtime_ns, len(json_bytes),
+                    json_sha256, payload_hash, payload_len,
+                ) + bytes(payload))
+                return _unpack(payload, "revalidated")
+
+    json_bytes = db_path.read_bytes()
+    records = json.loads(json_bytes.decode("utf-8"))
+    cards: Dict[str, Card] = {}
+    for entry in records:
+        if isinstance(entry, dict) and "id" in entry:
+            try:
+                cards[entry["id"]] = build_card(entry)
+            except (KeyError, TypeError, ValueError):
+                # Left to CardHydrator.get_card, which reports it on use
+                continue
+
+    payload = pickle.dumps({"records": records, "cards": cards}, protocol=pickle.HIGHEST_PROTOCOL)
+    _write(snapshot_path, _HEADER.pack(
+        SNAPSHOT_MAGIC,
+        SNAPSHOT_VERSION,
+        stat.st_mtime_ns,
+        len(json_bytes),
+        hashlib.sha256(json_bytes).digest(),
+        hashlib.blake2b(payload, digest_size=32).digest(),
+        len(payload),
+    ) + payload)
+    return CardSnapshot(records=records, cards=cards, status="rebuilt")
+
+
+def _read_all(path: Path) -> Optional[bytes]:
+    try:
+        with path.open("rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _parse_header(data: bytes) -> Optional[tuple]:
+    if len(data) < _HEADER.size:
+        return None
+    header = _HEADER.unpack_from(data)
+    if header[0] != SNAPSHOT_MAGIC or header[1] != SNAPSHOT_VERSION:
+        return None
+    return header
+
+
+def _unpack(payload: memoryview, status: str) -> CardSnapshot:
+    content = pickle.loads(payload)
+    return CardSnapshot(records=content["records"], cards=content["cards"], status=status)
+
+
+def _write(path: Path, data: bytes) -> None:
+    """
+    Write atomically (temp file + rename) so readers never see a torn file.
+    """
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,212 @@
+# qb_engine/deck_model.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from math import comb
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+from qb_engine.bitboard import MAX_RANK
+from qb_engine.models import Card
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from qb_engine.card_hydrator import CardHydrator
+
+
+OPENING_HAND_SIZE = 5
+
+
+@lru_cache(maxsize=None)
+def miss_ratio_table(max_cards: int) -> np.ndarray:
+    """
+    table[m, h, k] = C(m - k, h) / C(m, h): the chance that a uniform
+    h-card hand from m unseen cards contains none of k given cards
+    (0 where k > m or h > m - k).
+    """
+    import numpy as np
+
+    table = np.zeros((max_cards + 1, max_cards + 1, max_cards + 1))
+    for m in range(max_cards + 1):
+        for h in range(m + 1):
+            total = comb(m, h)
+            for k in range(m + 1):
+                table[m, h, k] = comb(m - k, h) / total
+    table.setflags(write=False)
+    return table
+
+
+@dataclass(frozen=True)
+class HandProbabilities:
+    """
+    Likelihoods for one (remaining deck, hand size) state. Arrays are
+    read-only and shared through the model's cache.
+
+    - hold[i]:         P(hand holds >= 1 copy of card_ids[i])
+    - cost_at_most[n]: P(hand holds >= 1 card of cost <= n), n = 0..MAX_RANK
+    - draw[i]:         P(the next card drawn is card_ids[i])
+    """
+    hand_size: int
+    remaining: int
+    hold: np.ndarray
+    cost_at_most: np.ndarray
+    draw: np.ndarray
+
+
+class OpponentDeckModel:
+    """
+    OpponentDeckModel (Epic E §E2.2): what the enemy can still hold.
+
+    The enemy's unseen cards are its deck profile minus every card it has
+    played. From our side its hand and draw pile are indistinguishable, so
+    a hand of h cards is a uniform h-subset of the m unseen cards and
+
+        P(holds >= 1 of k copies) = 1 - C(m - k, h) / C(m, h)
+
+    (hypergeometric). One lookup in miss_ratio_table answers it, so every
+    card type (and every cost bound) is computed at once by array indexing.
+
+    Unseen copies are a count vector over the profile's distinct cards.
+    The state is also packed into a mixed-radix integer (digit i = unseen
+    copies of card i, radix = profile copies + 1), updated in O(1) per
+    observed card; probabilities are memoized per (state key, hand size),
+    so a search that plays and un-plays cards hits the cache.
+
+    NumPy is imported on first use, so importing this module (or
+    qb_engine.expectimax) does not pull it in.
+    """
+
+    def __init__(
+        self,
+        deck: Sequence[str],
+        card_hydrator: CardHydrator,
+        hand_size: int = OPENING_HAND_SIZE,
+    ) -> None:
+        """
+        deck: the enemy's deck profile as card ids (duplicates = copies).
+        """
+        import numpy as np
+
+        copies: Dict[str, int] = {}
+        for card_id in deck:
+            copies[card_id] = copies.get(card_id, 0) + 1
+
+        self.card_ids: Tuple[str, ...] = tuple(sorted(copies))
+        self.cards: Tuple[Card, ...] = tuple(card_hydrator.get_card(card_id) for card_id in self.card_ids)
+        self._index: Dict[str, int] = {card_id: i for i, card_id in enumerate(self.card_ids)}
+        self.costs = np.array([card.cost for card in self.cards], dtype=np.intp)
+        self.costs.setflags(write=False)
+
+        self.counts = np.array([copies[card_id] for card_id in self.card_ids], dtype=np.intp)
+        self.remaining = len(deck)
+        self.hand_size = min(hand_size, self.remaining)
+
+        # Mixed-radix place value per card type
+        places: List[int] = []
+        place = 1
+        for card_id in self.card_ids:
+            places.append(place)
+            place *= copies[card_id] + 1
+        self._places = places
+        self.state_key = sum(n * p for n, p in zip(self.counts.tolist(), places))
+
+        self._miss = miss_ratio_table(len(deck))
+        self._cache: Dict[Tuple[int, int], HandProbabilities] = {}
+
+    # --------------------------------------------------------------------- #
+    # Observations (all O(1))
+    # --------------------------------------------------------------------- #
+
+    def observe_play(self, card_id: str) -> None:
+        """
+        The enemy played `card_id`: one copy leaves the unseen pool and
+        its hand. Exactly undone by unobserve_play (hand sizes are clamped
+        to [0, remaining] only when queried).
+        """
+        i = self._index.get(card_id)
+        if i is None or self.counts[i] == 0:
+            raise ValueError(f"Card '{card_id}' is not left in the enemy's deck profile.")
+        self.counts[i] -= 1
+        self.state_key -= self._places[i]
+        self.remaining -= 1
+        self.hand_size -= 1
+
+    def unobserve_play(self, card_id: str) -> None:
+        """
+        Undo observe_play (e.g. when a search un-plays an enemy move).
+        """
+        i = self._index[card_id]
+        self.counts[i] += 1
+        self.state_key += self._places[i]
+        self.remaining += 1
+        self.hand_size += 1
+
+    def observe_draw(self) -> None:
+        """
+        The enemy drew a card (its hand grows, unless the pile is empty).
+        """
+        self.hand_size = min(self.hand_size + 1, self.remaining)
+
+    # --------------------------------------------------------------------- #
+    # Queries
+    # --------------------------------------------------------------------- #
+
+    def remaining_count(self, card_id: str) -> int:
+        i = self._index.get(card_id)
+        return 0 if i is None else int(self.counts[i])
+
+    def probabilities(self, hand_size: Optional[int] = None) -> HandProbabilities:
+        """
+        All likelihoods for the current unseen pool and `hand_size`
+        (default: the tracked hand size), memoized per state.
+        """
+        h = self.hand_size if hand_size is None else hand_size
+        h = max(0, min(h, self.remaining))
+        key = (self.state_key, h)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        import numpy as np
+
+        m = self.remaining
+        miss = self._miss[m, h]
+        hold = 1.0 - miss[self.counts]
+        by_cost = np.bincount(self.costs, weights=self.counts, minlength=MAX_RANK + 1)
+        cost_at_most = 1.0 - miss[np.cumsum(by_cost[: MAX_RANK + 1]).astype(np.intp)]
+        draw = self.counts / m if m else np.zeros(len(self.counts))
+        for array in (hold, cost_at_most, draw):
+            array.setflags(write=False)
+
+        result = HandProbabilities(
+            hand_size=h, remaining=m, hold=hold, cost_at_most=cost_at_most, draw=draw
+        )
+        self._cache[key] = result
+        return result
+
+    def p_holds(self, card_id: str, next_turn: bool = False) -> float:
+        """
+        P(enemy holds >= 1 copy of card_id), now or after its next draw.
+        """
+        i = self._index.get(card_id)
+        if i is None:
+            return 0.0
+        return float(self.probabilities(self._hand_size_for(next_turn)).hold[i])
+
+    def p_cost_at_most(self, max_cost: int, next_turn: bool = False) -> float:
+        """
+        P(enemy holds >= 1 card of cost <= max_cost), now or after its
+        next draw.
+        """
+        if max_cost < 0:
+            return 0.0
+        max_cost = min(max_cost, MAX_RANK)
+        return float(self.probabilities(self._hand_size_for(next_turn)).cost_at_most[max_cost])
+
+    def cache_size(self) -> int:
+        return len(self._cache)
+
+    def _hand_size_for(self, next_turn: bool) -> int:
+        return self.hand_size + 1 if next_turn else self.hand_size
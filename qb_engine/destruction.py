@@ -0,0 +1,195 @@
+# qb_engine/destruction.py
+
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+from qb_engine.bitboard import NUM_COLS, iter_indices
+from qb_engine.board_state import BoardState
+from qb_engine.effect_engine import EffectEngine
+from qb_engine.models import Card
+from qb_engine.projection import compute_projection_targets
+from qb_engine.triggers import EventDispatcher
+
+
+@dataclass
+class DestroyedCard:
+    """
+    A card removed by destruction resolution.
+
+    - side: "Y" / "E" (owner of its tile when it was destroyed)
+    - wave: cascade step it died in (0 = directly destroyed / first check)
+    """
+    card_id: str
+    lane_index: int
+    col_index: int
+    side: str
+    wave: int
+
+
+class CardDestructionEngine:
+    """
+    CardDestructionEngine v2 (qb_engine_v2.1.0 §7, qb_rules §8.5).
+
+    A card whose effective power drops to 0 or below is destroyed:
+      1. It is removed from its tile.
+      2. Its effect auras are removed.
+      3. Its PawnDeltas are removed and the touched tiles re-derived.
+      4. Its on_destroy effect fires, then "destroyed" listeners.
+
+    Resolution runs on a worklist of tile indices rather than board scans.
+    Only tiles whose card may have lost power are pushed: debuff targets,
+    tiles left by removed auras, and occupied tiles whose ownership changed.
+    Each wave destroys every dead card on the worklist at once (steps 1-3),
+    then fires their on_destroy effects in row-major order; whatever those
+    lower forms the next wave. The order is therefore fully deterministic.
+
+    on_play has the same signature as EventDispatcher.on_play, so an
+    instance can be passed to make_move/apply_move as `events` to resolve
+    triggers and destruction for every move.
+    """
+
+    def __init__(
+        self,
+        effect_engine: EffectEngine,
+        events: Optional[EventDispatcher] = None,
+    ) -> None:
+        self._effect_engine = effect_engine
+        self._events = events if events is not None else EventDispatcher(effect_engine)
+
+    @property
+    def events(self) -> EventDispatcher:
+        return self._events
+
+    # --------------------------------------------------------------------- #
+    # Public API
+    # --------------------------------------------------------------------- #
+
+    def on_play(
+        self,
+        board: BoardState,
+        lane_index: int,
+        col_index: int,
+        card: Card,
+        side: str,
+    ) -> List[DestroyedCard]:
+        """
+        Resolve a placement's triggers, then any destruction they cause.
+
+        Besides on_play debuff targets, the played card itself (it may land
+        on debuff auras) and the cards under its new auras are checked.
+        """
+        lowered = self._events.on_play(board, lane_index, col_index, card, side)
+        proj = compute_projection_targets(lane_index, col_index, card, side)
+        candidates = [lane_index * NUM_COLS + col_index]
+        candidates.extend(iter_indices(proj.effect_mask & board.masks.occupied))
+        candidates.extend(lowered)
+        return self.resolve(board, candidates)
+
+    def destroy_card(self, board: BoardState, lane_index: int, col_index: int) -> List[DestroyedCard]:
+        """
+        Destroy the card on a tile outright (e.g. a "destroy" effect) and
+        resolve the resulting cascade. Returns every card destroyed.
+        """
+        if board.tile_at(lane_index, col_index).card_id is None:
+            return []
+        destroyed: List[DestroyedCard] = []
+        worklist = self._destroy_wave(board, [lane_index * NUM_COLS + col_index], 0, destroyed)
+        self._cascade(board, worklist, 1, destroyed)
+        return destroyed
+
+    def resolve(self, board: BoardState, candidates: Iterable[int]) -> List[DestroyedCard]:
+        """
+        Check the candidate tile indices and destroy every card at power
+        <= 0, cascading until no further card dies.
+        """
+        destroyed: List[DestroyedCard] = []
+        self._cascade(board, candidates, 0, destroyed)
+        return destroyed
+
+    # --------------------------------------------------------------------- #
+    # Internals
+    # --------------------------------------------------------------------- #
+
+    def _cascade(
+        self,
+        board: BoardState,
+        worklist: Iterable[int],
+        wave: int,
+        destroyed: List[DestroyedCard],
+    ) -> None:
+        engine = self._effect_engine
+        pending = set(worklist)
+        while pending:
+            dead = []
+            for index in sorted(pending):
+                lane_index, col_index = divmod(index, NUM_COLS)
+                if board.tiles[lane_index][col_index].card_id is None:
+                    continue
+                if engine.compute_effective_power(board, lane_index, col_index) <= 0:
+                    dead.append(index)
+            if not dead:
+                return
+            pending = set(self._destroy_wave(board, dead, wave, destroyed))
+            wave += 1
+
+    def _destroy_wave(
+        self,
+        board: BoardState,
+        dead: List[int],
+        wave: int,
+        destroyed: List[DestroyedCard],
+    ) -> List[int]:
+        """
+        Remove every card in `dead` (row-major) with its auras and pawns,
+        then fire their on_destroy triggers. Returns the next worklist.
+        """
+        hydrator = self._effect_engine.card_hydrator
+        worklist: List[int] = []
+        removed: List[DestroyedCard] = []
+
+        for index in sorted(dead):
+            lane_index, col_index = divmod(index, NUM_COLS)
+            side = board.tiles[lane_index][col_index].owner
+            card_id = board.remove_card(lane_index, col_index)
+
+            for aura in board.remove_auras_for_card(card_id, lane_index, col_index):
+                worklist.append(aura.lane_index * NUM_COLS + aura.col_index)
+
+            for delta in board.pawn_deltas_from_card(card_id):
+                if (delta.source_lane_index, delta.source_col_index) != (lane_index, col_index):
+                    continue
+                tile = board.tiles[delta.lane_index][delta.col_index]
+                owner_before = tile.owner
+                board.remove_pawn_delta(delta)
+                # A card whose tile changes hands may fall under other scopes
+                if tile.owner != owner_before:
+                    touched = delta.lane_index * NUM_COLS + delta.col_index
+                    worklist.append(touched)
+                    worklist.extend(self._aura_targets_of(board, touched))
+
+            removed.append(DestroyedCard(card_id, lane_index, col_index, side, wave))
+
+        for card in removed:
+            worklist.extend(
+                self._events.on_destroy(
+                    board, card.lane_index, card.col_index, hydrator.get_card(card.card_id), card.side
+                )
+            )
+
+        destroyed.extend(removed)
+        return [i for i in worklist if (board.masks.occupied >> i) & 1]
+
+    @staticmethod
+    def _aura_targets_of(board: BoardState, index: int) -> List[int]:
+        """
+        Tiles under the auras of the card on tile `index` (if any).
+        """
+        lane_index, col_index = divmod(index, NUM_COLS)
+        card_id = board.tiles[lane_index][col_index].card_id
+        if card_id is None:
+            return []
+        return [
+            aura.lane_index * NUM_COLS + aura.col_index
+            for aura in board.auras_from_card(card_id)
+            if aura.source_lane_index == lane_index and aura.source_col_index == col_index
+        ]
@@ -1,6 +1,7 @@
 # qb_engine/effect_aura.py
 
 from dataclasses import dataclass
+from typing import Optional
 
 
 @dataclass
@@ -13,8 +14,14 @@ class EffectAura:
       - Any card currently on, or later played onto, this tile is affected.
       - The actual semantics (buff/debuff/destroy/etc.) are defined by the
         source card's effect text and the effect engine, not here.
+
+    source_lane_index / source_col_index record the tile of the card that
+    projected the aura (None when unknown), so duplicate copies of the same
+    card id can be told apart.
     """
     lane_index: int   # 0=TOP, 1=MID, 2=BOT
     col_index: int    # 0..4  (columns 1..5)
     card_id: str      # source card
     description: str  # raw effect text from the card (for reference)
+    source_lane_index: Optional[int] = None
+    source_col_index: Optional[int] = None
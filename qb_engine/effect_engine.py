@@ -4,14 +4,29 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Literal, Optional
+from typing import TYPE_CHECKING, Dict, List, Literal, Optional, Tuple
 
-from qb_engine.board_state import BoardState
-from qb_engine.card_hydrator import CardHydrator
+from qb_engine.bitboard import NUM_COLS, NUM_LANES, NUM_TILES
 from qb_engine.models import Card
 
-
-Trigger = Literal["while_in_play", "on_play", "on_destroy"]
+if TYPE_CHECKING:
+    # Annotation-only: keeps `import qb_engine.effect_engine` off the board
+    # state / Zobrist tables and the DB loader
+    from qb_engine.board_state import BoardState
+    from qb_engine.card_hydrator import CardHydrator
+
+
+Trigger = Literal[
+    "while_in_play",
+    "on_play",
+    "on_destroy",
+    # Reactive triggers: fire on other cards' play/destruction
+    "on_ally_played",
+    "on_enemy_played",
+    "on_ally_destroyed",
+    "on_enemy_destroyed",
+    "on_any_destroyed",
+]
 
 Scope = Literal[
     "self",
@@ -25,6 +40,64 @@ Scope = Literal[
 
 EffectOpType = Literal["modify_power"]
 
+# Integer codes used by the compiled registry (see CompiledRegistry)
+TRIGGER_WHILE_IN_PLAY = 0
+TRIGGER_ON_PLAY = 1
+TRIGGER_ON_DESTROY = 2
+TRIGGER_ON_ALLY_PLAYED = 3
+TRIGGER_ON_ENEMY_PLAYED = 4
+TRIGGER_ON_ALLY_DESTROYED = 5
+TRIGGER_ON_ENEMY_DESTROYED = 6
+TRIGGER_ON_ANY_DESTROYED = 7
+
+TRIGGER_CODES: Dict[str, int] = {
+    "while_in_play": TRIGGER_WHILE_IN_PLAY,
+    "on_play": TRIGGER_ON_PLAY,
+    "on_destroy": TRIGGER_ON_DESTROY,
+    "on_ally_played": TRIGGER_ON_ALLY_PLAYED,
+    "on_enemy_played": TRIGGER_ON_ENEMY_PLAYED,
+    "on_ally_destroyed": TRIGGER_ON_ALLY_DESTROYED,
+    "on_enemy_destroyed": TRIGGER_ON_ENEMY_DESTROYED,
+    "on_any_destroyed": TRIGGER_ON_ANY_DESTROYED,
+}
+
+# Events a reactive card can listen to (bit positions in CompiledRegistry.listens),
+# relative to the listening card's side
+EVENT_ALLY_PLAYED = 0
+EVENT_ENEMY_PLAYED = 1
+EVENT_ALLY_DESTROYED = 2
+EVENT_ENEMY_DESTROYED = 3
+NUM_EVENTS = 4
+
+TRIGGER_LISTENS: Dict[int, int] = {
+    TRIGGER_ON_ALLY_PLAYED: 1 << EVENT_ALLY_PLAYED,
+    TRIGGER_ON_ENEMY_PLAYED: 1 << EVENT_ENEMY_PLAYED,
+    TRIGGER_ON_ALLY_DESTROYED: 1 << EVENT_ALLY_DESTROYED,
+    TRIGGER_ON_ENEMY_DESTROYED: 1 << EVENT_ENEMY_DESTROYED,
+    TRIGGER_ON_ANY_DESTROYED: (1 << EVENT_ALLY_DESTROYED) | (1 << EVENT_ENEMY_DESTROYED),
+}
+
+SCOPE_SELF = 0
+SCOPE_ALLIES_ON_AFFECTED_TILES = 1
+SCOPE_ENEMIES_ON_AFFECTED_TILES = 2
+SCOPE_ALL_CARDS_ON_AFFECTED_TILES = 3
+SCOPE_ALLIES_IN_LANE = 4
+SCOPE_ENEMIES_IN_LANE = 5
+SCOPE_ALL_CARDS_IN_LANE = 6
+
+SCOPE_CODES: Dict[str, int] = {
+    "self": SCOPE_SELF,
+    "allies_on_affected_tiles": SCOPE_ALLIES_ON_AFFECTED_TILES,
+    "enemies_on_affected_tiles": SCOPE_ENEMIES_ON_AFFECTED_TILES,
+    "all_cards_on_affected_tiles": SCOPE_ALL_CARDS_ON_AFFECTED_TILES,
+    "allies_in_lane": SCOPE_ALLIES_IN_LANE,
+    "enemies_in_lane": SCOPE_ENEMIES_IN_LANE,
+    "all_cards_in_lane": SCOPE_ALL_CARDS_IN_LANE,
+}
+
+# Row index for cards without a (registered) effect
+NO_EFFECT = -1
+
 
 @dataclass
 class EffectOp:
@@ -42,6 +115,47 @@ class EffectDef:
     operations: List[EffectOp]
 
 
+@dataclass
+class CompiledRegistry:
+    """
+    The effect registry as parallel integer tables, one row per effect:
+
+    - effect_ids:   row -> effect id (for reporting only)
+    - triggers:     row -> TRIGGER_* code
+    - scopes:       row -> SCOPE_* code
+    - power_deltas: row -> net modify_power amount of the effect's operations
+    - listens:      row -> bitmask of EVENT_* kinds a reactive effect
+                    listens to (0 for non-reactive effects)
+    - card_rows:    card id -> row (cards without a registered effect are
+                    absent; use row_for)
+    """
+    effect_ids: List[str]
+    triggers: List[int]
+    scopes: List[int]
+    power_deltas: List[int]
+    listens: List[int]
+    card_rows: Dict[str, int]
+
+    def row_for(self, card_id: str) -> int:
+        return self.card_rows.get(card_id, NO_EFFECT)
+
+
+@dataclass
+class BoardPowers:
+    """
+    Effective power for the whole board, from one EffectEngine pass.
+
+    - powers:     3x5 grid of effective power (0 on empty tiles)
+    - lane_power: side ("Y"/"E") -> [TOP, MID, BOT] sum of that side's
+                  card powers (a card's side is the owner of its tile)
+    """
+    powers: List[List[int]]
+    lane_power: Dict[str, List[int]]
+
+    def lane_score(self, side: str, lane_index: int) -> int:
+        return self.lane_power[side][lane_index]
+
+
 class EffectEngine:
     """
     Deterministic effect engine.
@@ -50,11 +164,48 @@ class EffectEngine:
       - Load structured effect definitions from qb_effects_v1.json.
       - Given a BoardState and a tile (lane, col), compute the card's
         effective power by applying all relevant while_in_play effects.
+
+    The EffectDefs are also compiled into a CompiledRegistry at load time,
+    keyed directly by card id, so power computations only index integer
+    tables instead of comparing trigger/scope strings.
     """
 
     def __init__(self, registry_path: Path, card_hydrator: CardHydrator) -> None:
         self._card_hydrator = card_hydrator
-        self._effects: Dict[str, EffectDef] = self._load_registry(registry_path)
+        self._registry_path = Path(registry_path)
+        self._effects: Optional[Dict[str, EffectDef]] = self._load_registry(self._registry_path)
+        self._compiled = self._compile_registry()
+
+    @classmethod
+    def from_compiled(
+        cls,
+        registry_path: Path,
+        card_hydrator: CardHydrator,
+        compiled: CompiledRegistry,
+    ) -> "EffectEngine":
+        """
+        Engine over an already compiled registry (e.g. the one stored in
+        SharedCardTables), without parsing the registry JSON. The EffectDefs
+        behind get_effect_for_card are loaded from registry_path on first use.
+        """
+        engine = cls.__new__(cls)
+        engine._card_hydrator = card_hydrator
+        engine._registry_path = Path(registry_path)
+        engine._effects = None
+        engine._compiled = compiled
+        return engine
+
+    @property
+    def card_hydrator(self) -> CardHydrator:
+        return self._card_hydrator
+
+    @property
+    def registry_path(self) -> Path:
+        return self._registry_path
+
+    @property
+    def compiled(self) -> CompiledRegistry:
+        return self._compiled
 
     # --------------------------------------------------------------------- #
     # Registry loading
@@ -94,6 +245,31 @@ class EffectEngine:
 
         return effects
 
+    def _compile_registry(self) -> CompiledRegistry:
+        """
+        Build the integer tables from the EffectDefs and map every card in
+        the DB whose effect_id is registered to its row.
+        """
+        compiled = CompiledRegistry(
+            effect_ids=[], triggers=[], scopes=[], power_deltas=[], listens=[], card_rows={}
+        )
+        rows: Dict[str, int] = {}
+        for effect_id, effect_def in self._effects.items():
+            rows[effect_id] = len(compiled.effect_ids)
+            compiled.effect_ids.append(effect_id)
+            compiled.triggers.append(TRIGGER_CODES[effect_def.trigger])
+            compiled.scopes.append(SCOPE_CODES[effect_def.scope])
+            compiled.power_deltas.append(_net_power_delta(effect_def))
+            compiled.listens.append(TRIGGER_LISTENS.get(compiled.triggers[-1], 0))
+
+        # Raw DB entries: no need to hydrate every card just for its effect_id
+        for card_id, entry in self._card_hydrator.index.items():
+            effect_id = entry.get("effect_id")
+            if effect_id in rows:
+                compiled.card_rows[card_id] = rows[effect_id]
+
+        return compiled
+
     def get_effect_for_card(self, card: Card) -> Optional[EffectDef]:
         """
         Returns the EffectDef for a given card, if it has effect_id and
@@ -102,6 +278,8 @@ class EffectEngine:
         effect_id = getattr(card, "effect_id", None)
         if not effect_id:
             return None
+        if self._effects is None:
+            self._effects = self._load_registry(self._registry_path)
         return self._effects.get(effect_id)
 
     # --------------------------------------------------------------------- #
@@ -118,106 +296,148 @@ class EffectEngine:
         Returns the effective power for the card (if any) currently on (lane, col),
         after applying all relevant while_in_play effects from EffectAuras.
 
-        For v0.1, we:
-          - Ignore on_play / on_destroy triggers here.
-          - Focus only on while_in_play effects (e.g. Mindflayer / 027).
+        Triggered effects (on_play / on_destroy / reactive) are not evaluated
+        here: qb_engine.triggers resolves them when they fire and records
+        the result as the tile's power_bonus, which is included.
         """
         tile = board.tile_at(lane, col)
         if tile.card_id is None:
             # No card on this tile; effective power is not meaningful.
             return 0
 
-        card = self._card_hydrator.get_card(tile.card_id)
-        base_power = card.power
-
-        # Gather all effect definitions that apply to this tile/card
-        effect_defs = self._effects_applying_to_tile(board, lane, col, card)
+        base_power = self._card_hydrator.get_card(tile.card_id).power
+        compiled = self._compiled
 
-        delta_power = 0
-        for effect_def in effect_defs:
-            for op in effect_def.operations:
-                if op.type == "modify_power" and op.stat == "power":
-                    delta_power += op.amount
+        delta_power = tile.power_bonus
+        for aura in board.auras_at(lane, col):
+            row = compiled.row_for(aura.card_id)
+            if row == NO_EFFECT or compiled.triggers[row] != TRIGGER_WHILE_IN_PLAY:
+                continue
+            if self.scope_code_applies(
+                compiled.scopes[row],
+                tile.owner,
+                self._aura_source_side(board, aura),
+                tile.card_id,
+                aura.card_id,
+            ):
+                delta_power += compiled.power_deltas[row]
 
         return base_power + delta_power
 
-    # --------------------------------------------------------------------- #
-    # Internals
-    # --------------------------------------------------------------------- #
-
-    def _effects_applying_to_tile(
-        self,
-        board: BoardState,
-        lane: int,
-        col: int,
-        target_card: Card,
-    ) -> List[EffectDef]:
+    def compute_board_powers(self, board: BoardState) -> BoardPowers:
         """
-        Find all EffectDef instances whose auras + scope/trigger conditions
-        match the card currently at (lane, col).
+        Effective power of every card on the board in a single pass.
 
-        v0.1: only while_in_play triggers are considered.
+        Equivalent to calling compute_effective_power on all 15 tiles, but
+        each aura's effect and source side are resolved once and deltas are
+        accumulated straight into a per-tile array.
         """
-        applicable: List[EffectDef] = []
-
-        # 1) Look at all auras present on this tile
-        auras = board.auras_at(lane, col)
-        for aura in auras:
-            source_card = self._card_hydrator.get_card(aura.card_id)
-            effect_def = self.get_effect_for_card(source_card)
-            if effect_def is None:
+        occupied = board.masks.occupied
+        compiled = self._compiled
+        card_rows = compiled.card_rows
+        triggers = compiled.triggers
+        deltas = [0] * NUM_TILES
+        source_sides: Dict[Tuple[str, Optional[int], Optional[int]], Optional[str]] = {}
+
+        for aura in board.effect_auras:
+            index = aura.lane_index * NUM_COLS + aura.col_index
+            if not (occupied >> index) & 1:
                 continue
 
-            # v0.1: only apply while_in_play effects in this pipeline
-            if effect_def.trigger != "while_in_play":
+            row = card_rows.get(aura.card_id, NO_EFFECT)
+            if row == NO_EFFECT or triggers[row] != TRIGGER_WHILE_IN_PLAY:
                 continue
 
-            if self._scope_matches(effect_def.scope, board, lane, col, aura, target_card):
-                applicable.append(effect_def)
+            source_key = (aura.card_id, aura.source_lane_index, aura.source_col_index)
+            if source_key in source_sides:
+                source_side = source_sides[source_key]
+            else:
+                source_side = self._aura_source_side(board, aura)
+                source_sides[source_key] = source_side
+
+            target_tile = board.tiles[aura.lane_index][aura.col_index]
+            if self.scope_code_applies(
+                compiled.scopes[row],
+                target_tile.owner,
+                source_side,
+                target_tile.card_id,
+                aura.card_id,
+            ):
+                deltas[index] += compiled.power_deltas[row]
+
+        powers = [[0] * NUM_COLS for _ in range(NUM_LANES)]
+        lane_power = {"Y": [0] * NUM_LANES, "E": [0] * NUM_LANES}
+        for lane_index, row in enumerate(board.tiles):
+            for col_index, tile in enumerate(row):
+                if tile.card_id is None:
+                    continue
+                power = (
+                    self._card_hydrator.get_card(tile.card_id).power
+                    + tile.power_bonus
+                    + deltas[lane_index * NUM_COLS + col_index]
+                )
+                powers[lane_index][col_index] = power
+                if tile.owner in lane_power:
+                    lane_power[tile.owner][lane_index] += power
 
-        # 2) Optionally: handle self-targeted effects without an aura in the future.
-        #    For now we assume all continuous effects are delivered via auras.
+        return BoardPowers(powers=powers, lane_power=lane_power)
 
-        return applicable
+    # --------------------------------------------------------------------- #
+    # Internals
+    # --------------------------------------------------------------------- #
 
-    def _scope_matches(
-        self,
-        scope: Scope,
-        board: BoardState,
-        lane: int,
-        col: int,
-        aura,
-        target_card: Card,
+    def _aura_source_side(self, board: BoardState, aura) -> Optional[str]:
+        """
+        Determine which side the source card of an aura belongs to.
+
+        We infer it from the tile that holds the source card: the aura's
+        own source tile when known, otherwise the card-location index.
+        """
+        if aura.source_lane_index is not None:
+            source_tile = board.tile_at(aura.source_lane_index, aura.source_col_index)
+            if source_tile.card_id == aura.card_id:
+                return source_tile.owner
+        return board.get_card_side(aura.card_id)  # "Y" or "E" (or "N"/None if not found)
+
+    @staticmethod
+    def scope_code_applies(
+        scope: int,
+        tile_owner: str,
+        source_side: Optional[str],
+        target_card_id: Optional[str],
+        source_card_id: str,
     ) -> bool:
         """
-        Determine if the given scope applies to the card at (lane, col),
-        given an EffectAura coming from aura.card_id.
+        Scope test on plain values: scope is a SCOPE_* code, tile_owner the
+        owner of the target tile ("Y", "E", or "N"), source_side the side
+        of the aura's source.
         """
-        tile = board.tile_at(lane, col)
-        tile_owner = tile.owner  # "Y", "E", or "N"
-
-        # Determine which side the source card belongs to.
-        # For now, we infer from the tile that holds the source card.
-        source_side = board.get_card_side(aura.card_id)  # "Y" or "E" (or "N"/None if not found)
-
-        if scope == "all_cards_on_affected_tiles":
+        if scope == SCOPE_ALL_CARDS_ON_AFFECTED_TILES:
             return True
 
-        if scope == "allies_on_affected_tiles":
+        if scope == SCOPE_ALLIES_ON_AFFECTED_TILES:
             # Allies = cards on tiles owned by the same side as the source
             return tile_owner == source_side
 
-        if scope == "enemies_on_affected_tiles":
+        if scope == SCOPE_ENEMIES_ON_AFFECTED_TILES:
             # Enemies = cards on tiles owned by the opposite side (non-neutral)
             return tile_owner != "N" and tile_owner != source_side
 
-        if scope == "self":
+        if scope == SCOPE_SELF:
             # The effect only applies to the source card itself
-            return target_card.id == aura.card_id
+            return target_card_id == source_card_id
 
         # Lane-wide scopes are reserved for future work (when rules require).
-        if scope in {"allies_in_lane", "enemies_in_lane", "all_cards_in_lane"}:
-            # TODO: implement when lane-wide effects are needed.
-            return False
-
+        # TODO: implement SCOPE_*_IN_LANE when lane-wide effects are needed.
         return False
+
+
+def _net_power_delta(effect_def: EffectDef) -> int:
+    """
+    Sum of all modify_power amounts in an effect's operations.
+    """
+    delta = 0
+    for op in effect_def.operations:
+        if op.type == "modify_power" and op.stat == "power":
+            delta += op.amount
+    return delta
@@ -0,0 +1,409 @@
+# qb_engine/expectimax.py
+
+from __future__ import annotations
+
+from typing import List, Optional, Sequence, Tuple
+
+from qb_engine.board_state import BoardState
+from qb_engine.deck_model import OpponentDeckModel
+from qb_engine.destruction import CardDestructionEngine
+from qb_engine.effect_engine import EffectEngine
+from qb_engine.legality import generate_legal_moves
+from qb_engine.models import Card
+from qb_engine.moves import Move
+from qb_engine.scoring import score_board
+from qb_engine.search import Evaluator, SearchResult, SearchState, static_move_priority
+
+
+# Evaluations are clamped to [-DEFAULT_SCORE_BOUND, DEFAULT_SCORE_BOUND];
+# Star1/Star2 need finite bounds on every leaf value
+DEFAULT_SCORE_BOUND = 100.0
+
+# Chance outcome: (card, probability)
+Outcome = Tuple[Card, float]
+
+
+class ExpectimaxEngine:
+    """
+    Probabilistic predictor (Epic E §E2.3): expectiminimax over the
+    enemy's hidden cards.
+
+    YOU maximises and ENEMY minimises, as in PredictorEngine. Before each
+    ENEMY turn a chance node picks the one unseen card the enemy may play
+    besides its known cards, weighted by the OpponentDeckModel's draw
+    distribution. If the enemy plays it, the model observes the card for
+    the rest of the line; otherwise it goes back to the unseen pool, and
+    the next ENEMY turn draws again. A side with no legal placement
+    passes, and two passes in a row end the line.
+
+    Chance nodes are pruned with Star1 and Star2 (Ballard 1983). Every
+    leaf value is clamped to score_bounds = (L, U), so each outcome's
+    value lies in [L, U]:
+    - Star2 first probes each outcome with the enemy's first reply only.
+      The enemy minimises, so that reply's value is an upper bound on the
+      outcome. If the probability-weighted bounds cannot exceed alpha,
+      the chance node is cut without further search.
+    - Star1 then searches the outcomes in turn, each with the narrowest
+      window that can still change the result. It cuts as soon as the
+      searched values plus the remaining bounds prove the node falls
+      outside (alpha, beta).
+    Probed values are reused as the first reply's exact value.
+
+    The pruning is exact: search() returns the same score as the
+    unpruned expectimax() reference with the same clamped evaluator.
+    """
+
+    def __init__(
+        self,
+        effect_engine: EffectEngine,
+        evaluator: Optional[Evaluator] = None,
+        score_bounds: Tuple[float, float] = (-DEFAULT_SCORE_BOUND, DEFAULT_SCORE_BOUND),
+        star2: bool = True,
+    ) -> None:
+        self._effect_engine = effect_engine
+        self.events = CardDestructionEngine(effect_engine)
+        self._raw_evaluate = evaluator or self.match_margin
+        self.lower, self.upper = score_bounds
+        self.star2 = star2
+        self.nodes = 0
+        self._model: Optional[OpponentDeckModel] = None
+
+    @property
+    def effect_engine(self) -> EffectEngine:
+        return self._effect_engine
+
+    # --------------------------------------------------------------------- #
+    # Public API
+    # --------------------------------------------------------------------- #
+
+    def match_margin(self, board: BoardState) -> float:
+        return score_board(board, self._effect_engine).margin
+
+    def evaluate(self, board: BoardState) -> float:
+        """
+        The evaluator, clamped to score_bounds.
+        """
+        return min(self.upper, max(self.lower, self._raw_evaluate(board)))
+
+    def search(
+        self,
+        board: BoardState,
+        your_hand: Sequence[Card],
+        deck_model: OpponentDeckModel,
+        depth: int,
+        enemy_known: Sequence[Card] = (),
+    ) -> SearchResult:
+        """
+        Expected value of the best YOU move, searching `depth` placements
+        (chance nodes take no depth). enemy_known are enemy cards known to
+        be in hand; the rest of its hand is drawn from deck_model.
+
+        With ENEMY to move the root is a chance node and best_move is None.
+        Ties go to the first move in generation order. The board and the
+        deck model are restored before returning.
+        """
+        self.nodes = 0
+        self._model = deck_model
+        state = SearchState.create(board, your_hand, enemy_known, self.events)
+        try:
+            if board.side_to_move != "Y":
+                return SearchResult(None, self._value(state, depth, self.lower, self.upper, 0), self.nodes)
+
+            moves = generate_legal_moves(board, state.hands["Y"], "Y")
+            if depth <= 0 or not moves:
+                return SearchResult(None, self._value(state, depth, self.lower, self.upper, 0), self.nodes)
+
+            best_move: Optional[Move] = None
+            best_score = self.lower
+            for move in moves:
+                # Later moves must beat best_score outright
+                alpha = self.lower if best_move is None else best_score
+                score = self._after_move(state, move, None, depth, alpha, self.upper)
+                if best_move is None or score > best_score:
+                    best_move, best_score = move, score
+            return SearchResult(best_move, best_score, self.nodes)
+        finally:
+            self._model = None
+
+    # --------------------------------------------------------------------- #
+    # Internals
+    # --------------------------------------------------------------------- #
+
+    def _value(self, state: SearchState, depth: int, alpha: float, beta: float, passes: int) -> float:
+        self.nodes += 1
+        if depth <= 0 or passes >= 2:
+            return self.evaluate(state.board)
+        if state.board.side_to_move == "E":
+            outcomes = _outcomes(self._model)
+            if outcomes:
+                return self._chance(state, outcomes, depth, alpha, beta, passes)
+        return self._choice(state, None, depth, alpha, beta, passes)
+
+    def _chance(
+        self,
+        state: SearchState,
+        outcomes: List[Outcome],
+        depth: int,
+        alpha: float,
+        beta: float,
+        passes: int,
+    ) -> float:
+        lower = self.lower
+        uppers = [self.upper] * len(outcomes)
+        probes: List[Optional[Tuple[Optional[Move], float]]] = [None] * len(outcomes)
+
+        # Star2: one enemy reply per outcome bounds that outcome from above
+        if self.star2:
+            for i, (card, _) in enumerate(outcomes):
+                with _Drawn(state, card):
+                    probes[i] = self._probe(state, card.id, depth, passes)
+                uppers[i] = probes[i][1]
+            bound = sum(p * u for (_, p), u in zip(outcomes, uppers))
+            if bound <= alpha:
+                return bound
+
+        # Star1 over the outcomes, with per-outcome upper bounds
+        done = 0.0
+        rest_upper = sum(p * u for (_, p), u in zip(outcomes, uppers))
+        rest_lower = sum(p for _, p in outcomes) * lower
+        for i, (card, p) in enumerate(outcomes):
+            rest_upper -= p * uppers[i]
+            rest_lower -= p * lower
+            a = (alpha - done - rest_upper) / p
+            b = (beta - done - rest_lower) / p
+            if uppers[i] <= a:
+                return done + p * uppers[i] + rest_upper
+            if lower >= b:
+                return done + p * lower + rest_lower
+
+            with _Drawn(state, card):
+                v = self._choice(
+                    state, card.id, depth, max(a, lower), min(b, uppers[i]), passes, probe=probes[i]
+                )
+            if v <= a:
+                return done + p * v + rest_upper
+            if v >= b:
+                return done + p * v + rest_lower
+            done += p * v
+        return done
+
+    def _probe(
+        self,
+        state: SearchState,
+        drawn: str,
+        depth: int,
+        passes: int,
+    ) -> Tuple[Optional[Move], float]:
+        """
+        Exact value of the enemy's first reply (in search order), or of its
+        pass when it has none.
+        """
+        moves = self._ordered_moves(state)
+        if not moves:
+            return None, self._after_pass(state, drawn, depth, passes, self.lower, self.upper)
+        return moves[0], self._after_move(state, moves[0], drawn, depth, self.lower, self.upper)
+
+    def _choice(
+        self,
+        state: SearchState,
+        drawn: Optional[str],
+        depth: int,
+        alpha: float,
+        beta: float,
+        passes: int,
+        probe: Optional[Tuple[Optional[Move], float]] = None,
+    ) -> float:
+        """
+        Fail-soft alpha-beta MAX (YOU) / MIN (ENEMY) node. `drawn` is the
+        chance card in the enemy's hand; `probe` a reply already searched
+        with a full window.
+        """
+        moves = self._ordered_moves(state)
+        if not moves:
+            if probe is not None:
+                return probe[1]
+            return self._after_pass(state, drawn, depth, passes, alpha, beta)
+
+        maximizing = state.board.side_to_move == "Y"
+        best = -float("inf") if maximizing else float("inf")
+        for move in moves:
+            if probe is not None and move.key == probe[0].key:
+                score = probe[1]
+            else:
+                score = self._after_move(state, move, drawn, depth, alpha, beta)
+            if maximizing:
+                best = max(best, score)
+                alpha = max(alpha, score)
+            else:
+                best = min(best, score)
+                beta = min(beta, score)
+            if alpha >= beta:
+                break
+        return best
+
+    def _after_move(
+        self,
+        state: SearchState,
+        move: Move,
+        drawn: Optional[str],
+        depth: int,
+        alpha: float,
+        beta: float,
+    ) -> float:
+        handle = state.play(move)
+        try:
+            with _Returned(state, self._model, drawn, move):
+                return self._value(state, depth - 1, alpha, beta, 0)
+        finally:
+            state.undo(handle)
+
+    def _after_pass(
+        self,
+        state: SearchState,
+        drawn: Optional[str],
+        depth: int,
+        passes: int,
+        alpha: float,
+        beta: float,
+    ) -> float:
+        with _Returned(state, self._model, drawn, None):
+            mark = state.pass_turn()
+            try:
+                return self._value(state, depth - 1, alpha, beta, passes + 1)
+            finally:
+                state.undo_pass(mark)
+
+    def _ordered_moves(self, state: SearchState) -> List[Move]:
+        board = state.board
+        side = board.side_to_move
+        moves = generate_legal_moves(board, state.hands[side], side)
+        return sorted(moves, key=lambda m: static_move_priority(board, m), reverse=True)
+
+
+def expectimax(
+    state: SearchState,
+    model: OpponentDeckModel,
+    depth: int,
+    evaluate: Evaluator,
+    passes: int = 0,
+) -> Tuple[Optional[Move], float]:
+    """
+    Unpruned reference for ExpectimaxEngine (same chance model, pass rules
+    and first-in-generation-order tie-break). `evaluate` should be the
+    engine's clamped evaluator.
+    """
+    return _reference(state, model, depth, evaluate, passes, chance_done=False, drawn=None)
+
+
+def _reference(
+    state: SearchState,
+    model: OpponentDeckModel,
+    depth: int,
+    evaluate: Evaluator,
+    passes: int,
+    chance_done: bool,
+    drawn: Optional[str],
+) -> Tuple[Optional[Move], float]:
+    board = state.board
+    if depth <= 0 or passes >= 2:
+        return None, evaluate(board)
+
+    side = board.side_to_move
+    if side == "E" and not chance_done:
+        outcomes = _outcomes(model)
+        if outcomes:
+            total = 0.0
+            for card, p in outcomes:
+                with _Drawn(state, card):
+                    total += p * _reference(state, model, depth, evaluate, passes, True, card.id)[1]
+            return None, total
+
+    def recurse(next_depth: int, next_passes: int) -> float:
+        return _reference(state, model, next_depth, evaluate, next_passes, False, None)[1]
+
+    moves = generate_legal_moves(board, state.hands[side], side)
+    if not moves:
+        with _Returned(state, model, drawn, None):
+            mark = state.pass_turn()
+            try:
+                return None, recurse(depth - 1, passes + 1)
+            finally:
+                state.undo_pass(mark)
+
+    best_move: Optional[Move] = None
+    best_score = 0.0
+    for move in moves:
+        handle = state.play(move)
+        try:
+            with _Returned(state, model, drawn, move):
+                score = recurse(depth - 1, 0)
+        finally:
+            state.undo(handle)
+        if best_move is None or (score > best_score if side == "Y" else score < best_score):
+            best_move, best_score = move, score
+    return best_move, best_score
+
+
+# ------------------------------------------------------------------------- #
+# Shared chance-card bookkeeping
+# ------------------------------------------------------------------------- #
+
+def _outcomes(model: OpponentDeckModel) -> List[Outcome]:
+    draw = model.probabilities().draw
+    return [(card, float(p)) for card, p in zip(model.cards, draw) if p > 0]
+
+
+class _Drawn:
+    """
+    Put the chance card into the enemy's hand for the duration of a block.
+    """
+
+    def __init__(self, state: SearchState, card: Card) -> None:
+        self._state = state
+        self._card = card
+
+    def __enter__(self) -> None:
+        self._state.add_card("E", self._card)
+
+    def __exit__(self, *exc) -> None:
+        # Everything played inside the block has been undone, so the
+        # chance card is last again
+        self._state.remove_card("E", len(self._state.hands["E"]) - 1)
+
+
+class _Returned:
+    """
+    After the enemy's move (or pass) on a chance branch: if it played the
+    chance card, the deck model observes it; otherwise the card leaves its
+    hand again (back to the unseen pool) for the rest of the line.
+    """
+
+    def __init__(
+        self,
+        state: SearchState,
+        model: Optional[OpponentDeckModel],
+        drawn: Optional[str],
+        move: Optional[Move],
+    ) -> None:
+        self._state = state
+        self._model = model
+        self._drawn = drawn
+        self._observed = drawn is not None and move is not None and move.card.id == drawn
+        self._removed: Optional[Tuple[int, Card]] = None
+
+    def __enter__(self) -> None:
+        if self._drawn is None:
+            return
+        if self._observed:
+            self._model.observe_play(self._drawn)
+            return
+        hand = self._state.hands["E"]
+        position = max(i for i, c in enumerate(hand) if c.id == self._drawn)
+        self._removed = (position, self._state.remove_card("E", position))
+
+    def __exit__(self, *exc) -> None:
+        if self._observed:
+            self._model.unobserve_play(self._drawn)
+        elif self._removed is not None:
+            position, card = self._removed
+            self._state.add_card("E", card, position)
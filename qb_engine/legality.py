@@ -1,7 +1,11 @@
 # qb_engine/legality.py
 
+from typing import List, Sequence, Set
+
+from qb_engine.bitboard import MAX_RANK, NUM_COLS, NUM_LANES, iter_indices, tile_bit
 from qb_engine.board_state import BoardState
 from qb_engine.models import Card
+from qb_engine.moves import Move
 
 
 def is_legal_placement(
@@ -9,6 +13,7 @@ def is_legal_placement(
     lane_index: int,
     col_index: int,
     card: Card,
+    side: str = "Y",
 ) -> bool:
     """
     Basic placement legality check (LegalityChecker v2, simplified):
@@ -19,26 +24,55 @@ def is_legal_placement(
       3. Tile's rank >= card.cost.
 
     For now, we treat Tile.rank as the visibleRank for the owning side.
+    Pass side="E" to check an ENEMY placement (tile must be owned by "E").
+
+    All three tests are answered from the board's bitmask view:
+      legal_tiles = owner_y & ~occupied & rank_at_least(card.cost)
     """
 
     # Bounds check: lane_index ∈ {0,1,2}, col_index ∈ {0..4}
-    if lane_index < 0 or lane_index >= len(board.tiles):
+    if lane_index < 0 or lane_index >= NUM_LANES:
         return False
-    if col_index < 0 or col_index >= len(board.tiles[0]):
+    if col_index < 0 or col_index >= NUM_COLS:
         return False
 
-    tile = board.tiles[lane_index][col_index]
+    return bool(board.legal_tiles_mask(card.cost, side) & tile_bit(lane_index, col_index))
 
-    # 1. Must be empty
-    if tile.card_id is not None:
-        return False
 
-    # 2. Must be owned by YOU
-    if tile.owner != "Y":
-        return False
+def legal_tiles_by_cost(board: BoardState, side: str = "Y") -> List[int]:
+    """
+    Legal-tile masks for every card cost 0..3 (index = cost), computed once
+    per position: empty & owned-by-side, narrowed by visible rank.
+    """
+    masks = board.masks
+    open_tiles = masks.owner_mask(side) & ~masks.occupied
+    return [open_tiles & masks.rank_at_least(cost) for cost in range(MAX_RANK + 1)]
 
-    # 3. Tile rank must be sufficient for card cost
-    if tile.rank < card.cost:
-        return False
 
-    return True
+def generate_legal_moves(
+    board: BoardState,
+    hand: Sequence[Card],
+    side: str = "Y",
+) -> List[Move]:
+    """
+    Return every legal placement of every card in `hand` for `side`.
+
+    Duplicate copies of a card in hand produce a single set of moves.
+    Moves are ordered by first appearance in hand, then row-major tile.
+    """
+    by_cost = legal_tiles_by_cost(board, side)
+    moves: List[Move] = []
+    seen: Set[str] = set()
+
+    for card in hand:
+        if card.id in seen:
+            continue
+        seen.add(card.id)
+
+        if card.cost > MAX_RANK:
+            continue
+        for index in iter_indices(by_cost[max(card.cost, 0)]):
+            lane_index, col_index = divmod(index, NUM_COLS)
+            moves.append(Move(card, lane_index, col_index, side))
+
+    return moves
@@ -0,0 +1,384 @@
+# qb_engine/mcts.py
+
+from __future__ import annotations
+
+import math
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from qb_engine.board_state import BoardState
+from qb_engine.destruction import CardDestructionEngine
+from qb_engine.effect_engine import EffectEngine
+from qb_engine.legality import generate_legal_moves
+from qb_engine.models import Card
+from qb_engine.moves import Move
+from qb_engine.scoring import score_board
+from qb_engine.search import Evaluator, SearchState, _other, static_move_priority
+
+
+# Picks the next rollout move from the (non-empty) legal moves
+RolloutPolicy = Callable[[BoardState, List[Move], random.Random], Move]
+
+DEFAULT_ITERATIONS = 1000
+
+# UCT exploration constant (rewards are in [0, 1])
+DEFAULT_EXPLORATION = math.sqrt(2)
+
+# How many plies below the previous root a new root is looked for
+REUSE_DEPTH = 2
+
+
+def random_rollout(board: BoardState, moves: List[Move], rng: random.Random) -> Move:
+    """
+    Uniformly random legal move.
+    """
+    return rng.choice(moves)
+
+
+def pawn_gain_rollout(board: BoardState, moves: List[Move], rng: random.Random) -> Move:
+    """
+    Cheap greedy rollout: the move with the best static_move_priority
+    (the features PredictorEngine orders moves by). Ties are broken at
+    random.
+    """
+    best: List[Move] = []
+    best_priority = -1
+    for move in moves:
+        priority = static_move_priority(board, move)
+        if priority > best_priority:
+            best, best_priority = [move], priority
+        elif priority == best_priority:
+            best.append(move)
+    return best[0] if len(best) == 1 else rng.choice(best)
+
+
+@dataclass(eq=False)
+class MCTSNode:
+    """
+    One position in the tree, reached by `move` (None for a pass / root).
+
+    - side:      side that played `move` (rewards are kept for this side)
+    - passes:    consecutive passes leading here (2 ends the game)
+    - board_key: board.zobrist_hash here, used to find reusable subtrees
+    - untried:   moves not expanded yet (None until first visited)
+    - reward:    sum of playout rewards for `side` (1 win, 0.5 draw, 0 loss)
+    """
+    move: Optional[Move]
+    parent: Optional["MCTSNode"]
+    side: Optional[str]
+    passes: int
+    board_key: int
+    children: List["MCTSNode"] = field(default_factory=list)
+    untried: Optional[List[Optional[Move]]] = None
+    visits: int = 0
+    reward: float = 0.0
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.passes >= 2
+
+    def count(self) -> int:
+        total, stack = 0, [self]
+        while stack:
+            node = stack.pop()
+            total += 1
+            stack.extend(node.children)
+        return total
+
+
+@dataclass
+class MoveStats:
+    """
+    A root move with its visit count and mean reward for the side to move.
+    """
+    move: Move
+    visits: int
+    win_rate: float
+
+    def __str__(self) -> str:
+        return f"{self.move}  visits={self.visits}  win={self.win_rate:.3f}"
+
+
+@dataclass
+class MCTSResult:
+    """
+    - moves:      root moves, most visited first (empty if the side must pass)
+    - iterations: playouts run by this search
+    - nodes:      tree size at the end (reused nodes included)
+    - reused:     whether the root came from the previous search's tree
+    - elapsed:    seconds spent
+    """
+    moves: List[MoveStats]
+    iterations: int
+    nodes: int
+    reused: bool
+    elapsed: float
+
+    @property
+    def best_move(self) -> Optional[Move]:
+        return self.moves[0].move if self.moves else None
+
+
+class MCTSEngine:
+    """
+    Anytime Monte Carlo Tree Search over placements (UCT).
+
+    Each iteration selects down the tree by UCT, expands one untried move,
+    plays a rollout with the rollout policy (random by default) and backs
+    the outcome up: 1 for a win of the node's mover, 0.5 for a draw, 0 for
+    a loss, judged by the evaluator's sign (default: the match-score
+    margin, qb_rules §9). As in PredictorEngine, a side with no legal
+    placement passes and two passes end the game; rollouts may be cut off
+    after rollout_depth plies and scored where they stop.
+
+    Hands are taken as given: pass a sampled or estimated enemy hand to
+    search under hidden information.
+
+    The tree is kept between calls. A new search whose board appears
+    within REUSE_DEPTH plies below the previous root continues from that
+    node with its statistics. Hands may have changed meanwhile (draws), so
+    children whose card is no longer in hand are skipped, and the root is
+    topped up with moves for newly drawn cards.
+
+    Budgets: iterations, time_limit (seconds) and max_nodes (tree size);
+    the search stops at whichever is reached first.
+    """
+
+    def __init__(
+        self,
+        effect_engine: EffectEngine,
+        rollout_policy: Optional[RolloutPolicy] = None,
+        evaluator: Optional[Evaluator] = None,
+        exploration: float = DEFAULT_EXPLORATION,
+        rollout_depth: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        self._effect_engine = effect_engine
+        self.events = CardDestructionEngine(effect_engine)
+        self._rollout = rollout_policy or random_rollout
+        self._evaluate = evaluator or self.match_margin
+        self.exploration = exploration
+        self.rollout_depth = rollout_depth
+        self.rng = random.Random(seed)
+        self._root: Optional[MCTSNode] = None
+
+    @property
+    def effect_engine(self) -> EffectEngine:
+        return self._effect_engine
+
+    # --------------------------------------------------------------------- #
+    # Public API
+    # --------------------------------------------------------------------- #
+
+    def match_margin(self, board: BoardState) -> float:
+        return score_board(board, self._effect_engine).margin
+
+    def search(
+        self,
+        board: BoardState,
+        your_hand: Sequence[Card],
+        enemy_hand: Sequence[Card],
+        iterations: Optional[int] = None,
+        time_limit: Optional[float] = None,
+        max_nodes: Optional[int] = None,
+    ) -> MCTSResult:
+        """
+        Search from the board's side_to_move until a budget runs out
+        (DEFAULT_ITERATIONS if none is given). The board is restored
+        before returning.
+        """
+        if iterations is None and time_limit is None and max_nodes is None:
+            iterations = DEFAULT_ITERATIONS
+
+        start = time.perf_counter()
+        deadline = start + time_limit if time_limit is not None else None
+        state = SearchState.create(board, your_hand, enemy_hand, self.events)
+
+        root = self._reusable_root(state)
+        reused = root is not None
+        if root is None:
+            root = MCTSNode(move=None, parent=None, side=None, passes=0, board_key=board.zobrist_hash)
+        self._root = root
+        nodes = root.count()
+
+        done = 0
+        while True:
+            if iterations is not None and done >= iterations:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            if max_nodes is not None and nodes >= max_nodes:
+                break
+            nodes += self._iterate(state, root)
+            done += 1
+
+        moves = [
+            MoveStats(move=child.move, visits=child.visits, win_rate=child.reward / child.visits)
+            for child in root.children
+            if child.move is not None and child.visits and self._playable(state, child.move)
+        ]
+        moves.sort(key=lambda s: (-s.visits, -s.win_rate))
+        return MCTSResult(
+            moves=moves,
+            iterations=done,
+            nodes=nodes,
+            reused=reused,
+            elapsed=time.perf_counter() - start,
+        )
+
+    def reset(self) -> None:
+        """
+        Forget the kept tree.
+        """
+        self._root = None
+
+    # --------------------------------------------------------------------- #
+    # Internals
+    # --------------------------------------------------------------------- #
+
+    def _iterate(self, state: SearchState, root: MCTSNode) -> int:
+        """
+        One select / expand / rollout / backup pass. Returns nodes added.
+        """
+        undo: List[Tuple[bool, object]] = []
+        node = root
+        added = 0
+        try:
+            # Selection, then expansion of one untried move
+            while not node.is_terminal:
+                if node.untried is None:
+                    node.untried = self._expansion_moves(state)
+                move = self._pop_untried(state, node)
+                if move is not _EXHAUSTED:
+                    self._advance(state, move, undo)
+                    child = MCTSNode(
+                        move=move,
+                        parent=node,
+                        side=_other(state.board.side_to_move),
+                        passes=node.passes + 1 if move is None else 0,
+                        board_key=state.board.zobrist_hash,
+                    )
+                    node.children.append(child)
+                    node = child
+                    added = 1
+                    break
+                child = self._select(state, node)
+                if child is None:
+                    break
+                self._advance(state, child.move, undo)
+                node = child
+
+            # Rollout
+            passes = node.passes
+            plies = 0
+            while passes < 2 and (self.rollout_depth is None or plies < self.rollout_depth):
+                side = state.board.side_to_move
+                moves = generate_legal_moves(state.board, state.hands[side], side)
+                if moves:
+                    self._advance(state, self._rollout(state.board, moves, self.rng), undo)
+                    passes = 0
+                else:
+                    self._advance(state, None, undo)
+                    passes += 1
+                plies += 1
+
+            score = self._evaluate(state.board)
+        finally:
+            for is_pass, handle in reversed(undo):
+                if is_pass:
+                    state.undo_pass(handle)
+                else:
+                    state.undo(handle)
+
+        winner = "Y" if score > 0 else "E" if score < 0 else None
+        while node is not None:
+            node.visits += 1
+            if node.side is not None:
+                node.reward += 0.5 if winner is None else float(winner == node.side)
+            node = node.parent
+        return added
+
+    def _select(self, state: SearchState, node: MCTSNode) -> Optional[MCTSNode]:
+        """
+        UCT child of a fully expanded node (None if no child is playable
+        with the current hands).
+        """
+        log_visits = math.log(node.visits) if node.visits > 1 else 0.0
+        best: Optional[MCTSNode] = None
+        best_value = -math.inf
+        for child in node.children:
+            if not self._playable(state, child.move):
+                continue
+            value = child.reward / child.visits + self.exploration * math.sqrt(log_visits / child.visits)
+            if value > best_value:
+                best, best_value = child, value
+        return best
+
+    def _expansion_moves(self, state: SearchState) -> List[Optional[Move]]:
+        side = state.board.side_to_move
+        moves: List[Optional[Move]] = list(generate_legal_moves(state.board, state.hands[side], side))
+        if not moves:
+            return [None]
+        self.rng.shuffle(moves)
+        return moves
+
+    def _pop_untried(self, state: SearchState, node: MCTSNode):
+        """
+        Next untried move still playable with the current hands, or
+        _EXHAUSTED when there is none.
+        """
+        while node.untried:
+            move = node.untried.pop()
+            if self._playable(state, move):
+                return move
+        return _EXHAUSTED
+
+    @staticmethod
+    def _playable(state: SearchState, move: Optional[Move]) -> bool:
+        side = state.board.side_to_move
+        if move is None:
+            return not generate_legal_moves(state.board, state.hands[side], side)
+        return move.side == side and any(c.id == move.card.id for c in state.hands[side])
+
+    @staticmethod
+    def _advance(state: SearchState, move: Optional[Move], undo: List[Tuple[bool, object]]) -> None:
+        if move is None:
+            undo.append((True, state.pass_turn()))
+        else:
+            undo.append((False, state.play(move)))
+
+    def _reusable_root(self, state: SearchState) -> Optional[MCTSNode]:
+        """
+        The node of the kept tree matching the current board, at most
+        REUSE_DEPTH plies below the previous root; detached and with its
+        untried moves refreshed for the current hands.
+        """
+        if self._root is None:
+            return None
+        key = state.board.zobrist_hash
+        queue = deque([(self._root, 0)])
+        while queue:
+            node, depth = queue.popleft()
+            if node.board_key == key and not node.is_terminal:
+                node.parent = None
+                node.move = None
+                node.side = None
+                node.passes = 0
+                expanded = {child.move.key for child in node.children if child.move is not None}
+                node.untried = [
+                    move for move in self._expansion_moves(state)
+                    if move is None or move.key not in expanded
+                ]
+                if node.untried == [None] and any(child.move is None for child in node.children):
+                    node.untried = []
+                return node
+            if depth < REUSE_DEPTH:
+                queue.extend((child, depth + 1) for child in node.children)
+        return None
+
+
+# Marker for "no untried move left" (None already means a pass)
+_EXHAUSTED = object()
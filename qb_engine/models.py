@@ -1,28 +1,156 @@
 # qb_engine/models.py
 
-from dataclasses import dataclass
-from typing import List, Optional
+from __future__ import annotations
 
+import sys
+from dataclasses import InitVar, dataclass, field
+from typing import List, Optional, Sequence, Tuple
 
-@dataclass
+from qb_engine.projection_table import (
+    PATTERN_SIZE,
+    ProjectionLookup,
+    build_projection_table_from_planes,
+)
+
+
+# Bit of the W cell in an unmodified pattern grid (row 2, col 2)
+PATTERN_CENTER_BIT = 1 << (2 * PATTERN_SIZE + 2)
+
+_PLANE_KINDS = ("P", "E", "X", "W")
+
+_INTERNED_FIELDS = ("id", "name", "category", "pattern", "effect", "effect_id")
+
+
+class _PatternGrid(list):
+    """
+    The list type of a card's own grid view, so a view handed back to the
+    constructor (as dataclasses.replace does) is told apart from a new grid.
+    """
+
+    __slots__ = ()
+
+
+class _GridView:
+    """
+    Card.grid: the pattern as a 5x5 list of one-character strings
+    ("W"/"P"/"E"/"X"/"."). On the class it reads as None, which dataclass
+    takes as the default of the grid= constructor argument.
+    """
+
+    def __get__(self, card: Optional["Card"], owner: type = None) -> Optional[List[List[str]]]:
+        return None if card is None else card._grid
+
+
+@dataclass(frozen=True, slots=True)
 class Card:
     """
     Fundamental card data model, loaded directly from data/qb_DB_Complete_v2.json.
 
     All fields must match the JSON database exactly.
+
+    Cards are immutable and slotted. The 5x5 pattern grid is stored as
+    25-bit planes (bit = row * 5 + col), one per cell kind:
+
+    - p_mask: "P" cells (pawn)
+    - e_mask: "E" cells (effect)
+    - x_mask: "X" cells (pawn + effect)
+    - w_mask: the "W" cell (the card itself)
+
+    `grid` is the JSON-style list-of-lists view, built from the planes at
+    construction (the list is shared: treat it as read-only, as with the
+    original stored attribute). The constructor still accepts grid= as an
+    init-only alias; when given, it sets all four planes. String fields
+    are interned, so cards share one copy of each name/effect text.
+
+    projection_table is derived (not part of the JSON): it is built from
+    the planes at construction, or taken from the init-only `projection`
+    argument when one is supplied. Both derived fields are rebuilt by
+    dataclasses.replace, so a replaced pattern never keeps a stale table.
     """
     id: str
     name: str
     category: str
     cost: int
     power: int
-    pattern: str
-    grid: List[List[str]]
+    pattern: Optional[str]
+    p_mask: int = 0
+    e_mask: int = 0
+    x_mask: int = 0
+    w_mask: int = PATTERN_CENTER_BIT
     effect: Optional[str] = None
-    effect_id: Optional[str] = None  # <-- NEW
+    effect_id: Optional[str] = None
+    projection_table: ProjectionLookup = field(init=False, repr=False, compare=False)
+    _grid: List[List[str]] = field(init=False, repr=False, compare=False)
+    # Init-only; reading card.grid goes through _GridView (None on the class)
+    grid: InitVar[Optional[Sequence[Sequence[str]]]] = _GridView()
+    projection: InitVar[Optional[ProjectionLookup]] = None
+
+    def __post_init__(
+        self,
+        grid: Optional[Sequence[Sequence[str]]],
+        projection: Optional[ProjectionLookup],
+    ) -> None:
+        # A _PatternGrid is some card's own view (dataclasses.replace passes
+        # it back): the plane fields already describe the pattern.
+        if grid is not None and not isinstance(grid, _PatternGrid):
+            planes = grid_to_planes(grid)
+            for name, mask in zip(("p_mask", "e_mask", "x_mask", "w_mask"), planes):
+                object.__setattr__(self, name, mask)
+        for name in _INTERNED_FIELDS:
+            value = getattr(self, name)
+            if isinstance(value, str):
+                object.__setattr__(self, name, sys.intern(value))
+        if projection is None:
+            projection = build_projection_table_from_planes(self.p_mask, self.e_mask, self.x_mask)
+        object.__setattr__(self, "projection_table", projection)
+        object.__setattr__(
+            self,
+            "_grid",
+            _PatternGrid(planes_to_grid(self.p_mask, self.e_mask, self.x_mask, self.w_mask)),
+        )
+
+    @classmethod
+    def from_grid(cls, grid: Sequence[Sequence[str]], **fields) -> "Card":
+        """
+        Build a Card from a JSON-style 5x5 grid plus the other fields.
+        """
+        return cls(grid=grid, **fields)
+
+    @property
+    def pattern_mask(self) -> int:
+        """
+        All projecting cells (P | E | X) as one 25-bit plane.
+        """
+        return self.p_mask | self.e_mask | self.x_mask
 
     def __str__(self) -> str:
         """
         Simplified human-readable representation.
         """
         return f"<Card {self.id} {self.name} (cost={self.cost}, power={self.power})>"
+
+
+def planes_to_grid(p_mask: int, e_mask: int, x_mask: int, w_mask: int) -> List[List[str]]:
+    """
+    Convert (P, E, X, W) 25-bit planes back into a 5x5 pattern grid.
+    """
+    grid = [["."] * PATTERN_SIZE for _ in range(PATTERN_SIZE)]
+    for kind, mask in zip(_PLANE_KINDS, (p_mask, e_mask, x_mask, w_mask)):
+        while mask:
+            low = mask & -mask
+            row, col = divmod(low.bit_length() - 1, PATTERN_SIZE)
+            grid[row][col] = kind
+            mask ^= low
+    return grid
+
+
+def grid_to_planes(grid: Sequence[Sequence[str]]) -> Tuple[int, int, int, int]:
+    """
+    Convert a 5x5 pattern grid into (P, E, X, W) 25-bit planes.
+    """
+    planes = dict.fromkeys(_PLANE_KINDS, 0)
+    for row_index, row in enumerate(grid):
+        for col_index, cell in enumerate(row):
+            if cell in planes:
+                planes[cell] |= 1 << (row_index * PATTERN_SIZE + col_index)
+    return planes["P"], planes["E"], planes["X"], planes["W"]
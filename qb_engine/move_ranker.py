@@ -0,0 +1,209 @@
+# qb_engine/move_ranker.py
+
+from __future__ import annotations
+
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+from qb_engine.board_state import BoardEncoding, BoardState
+from qb_engine.effect_engine import EffectEngine
+from qb_engine.legality import generate_legal_moves
+from qb_engine.models import Card
+from qb_engine.moves import Move
+from qb_engine.search import PredictorEngine
+from qb_engine.shared_tables import SharedCardTables
+
+
+# A root move as sent to workers: (canonical_index, card_id, lane_index, col_index)
+MoveSpec = Tuple[int, str, int, int]
+
+
+@dataclass
+class RankedMove:
+    """
+    One root candidate with its search score (YOU's point of view).
+    """
+    move: Move
+    score: float
+
+    def __str__(self) -> str:
+        return f"{self.move}  score={self.score:+g}"
+
+
+class MoveRanker:
+    """
+    Ranks every legal move for the side to move by searching each one with
+    PredictorEngine (qb_engine_v2.1.0 §2, item 9).
+
+    With workers > 1 the root moves are split across a ProcessPoolExecutor.
+    The card DB, its projection masks and the compiled effect registry are
+    exported once into SharedCardTables; each worker maps that block
+    read-only and builds its engine on it (pool initializer), then
+    receives only BoardState.encode() plus card ids. Every
+    root move is searched with a full window, so its score does not depend
+    on which worker handled it, and the merged ranking is sorted by
+    (score, generation order): identical to the serial result.
+    """
+
+    def __init__(
+        self,
+        effect_engine: EffectEngine,
+        depth: int = 2,
+        workers: Optional[int] = 1,
+    ) -> None:
+        """
+        workers: number of processes; None means os.cpu_count(), and 1
+                 searches in-process without a pool.
+        """
+        self._effect_engine = effect_engine
+        self._predictor = PredictorEngine(effect_engine)
+        self.depth = depth
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._tables: Optional[SharedCardTables] = None
+        self._finalizer: Optional[weakref.finalize] = None
+
+    # --------------------------------------------------------------------- #
+    # Public API
+    # --------------------------------------------------------------------- #
+
+    def rank(
+        self,
+        board: BoardState,
+        your_hand: Sequence[Card],
+        enemy_hand: Sequence[Card],
+        top_n: Optional[int] = None,
+    ) -> List[RankedMove]:
+        """
+        Return the legal moves for board.side_to_move, best first.
+        Ties keep generation order (hand order, then row-major tiles).
+        """
+        side = board.side_to_move
+        hand = your_hand if side == "Y" else enemy_hand
+        moves = generate_legal_moves(board, hand, side)
+
+        if self.workers > 1 and len(moves) > 1:
+            scores = self._scores_parallel(board, your_hand, enemy_hand, moves)
+        else:
+            scores = [
+                self._predictor.score_move(board, your_hand, enemy_hand, move, self.depth)
+                for move in moves
+            ]
+
+        sign = -1 if side == "Y" else 1
+        order = sorted(range(len(moves)), key=lambda i: (sign * scores[i], i))
+        ranked = [RankedMove(move=moves[i], score=scores[i]) for i in order]
+        return ranked if top_n is None else ranked[:top_n]
+
+    def close(self) -> None:
+        """
+        Shut the worker pool down and remove the shared tables file.
+        A ranker dropped without close() does the same when collected.
+        """
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self._pool = None
+        self._tables = None
+
+    def __enter__(self) -> "MoveRanker":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # --------------------------------------------------------------------- #
+    # Internals
+    # --------------------------------------------------------------------- #
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._tables = SharedCardTables.create(self._effect_engine)
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(
+                    str(self._tables.path),
+                    str(self._effect_engine.registry_path.resolve()),
+                ),
+            )
+            self._finalizer = weakref.finalize(self, _release, self._pool, self._tables)
+        return self._pool
+
+    def _scores_parallel(
+        self,
+        board: BoardState,
+        your_hand: Sequence[Card],
+        enemy_hand: Sequence[Card],
+        moves: List[Move],
+    ) -> List[float]:
+        encoding = board.encode()
+        your_ids = tuple(card.id for card in your_hand)
+        enemy_ids = tuple(card.id for card in enemy_hand)
+
+        # Round-robin so each chunk gets a mix of early and late moves
+        num_chunks = min(self.workers, len(moves))
+        chunks: List[List[MoveSpec]] = [[] for _ in range(num_chunks)]
+        for i, move in enumerate(moves):
+            chunks[i % num_chunks].append((i, move.card.id, move.lane_index, move.col_index))
+
+        pool = self._get_pool()
+        futures = [
+            pool.submit(_score_chunk, encoding, your_ids, enemy_ids, chunk, self.depth)
+            for chunk in chunks
+        ]
+
+        scores: List[float] = [0.0] * len(moves)
+        for future in futures:
+            for i, score in future.result():
+                scores[i] = score
+        return scores
+
+
+def _release(pool: ProcessPoolExecutor, tables: SharedCardTables) -> None:
+    pool.shutdown()
+    tables.close()
+    tables.unlink()
+
+
+# ------------------------------------------------------------------------- #
+# Worker process side
+# ------------------------------------------------------------------------- #
+
+_worker_predictor: Optional[PredictorEngine] = None
+_worker_tables: Optional[SharedCardTables] = None
+
+
+def _init_worker(tables_path: str, registry_path: str) -> None:
+    """
+    Pool initializer: attach to the shared card tables. Cards, projections
+    and the compiled registry are all read from the block; neither the DB
+    nor the registry JSON is parsed.
+    """
+    global _worker_predictor, _worker_tables
+    _worker_tables = SharedCardTables.attach(Path(tables_path))
+    _worker_predictor = PredictorEngine(_worker_tables.effect_engine(Path(registry_path)))
+
+
+def _score_chunk(
+    encoding: BoardEncoding,
+    your_ids: Sequence[str],
+    enemy_ids: Sequence[str],
+    chunk: Sequence[MoveSpec],
+    depth: int,
+) -> List[Tuple[int, float]]:
+    predictor = _worker_predictor
+    hydrator = predictor.effect_engine.card_hydrator
+    board = BoardState.decode(encoding)
+    your_hand = [hydrator.get_card(card_id) for card_id in your_ids]
+    enemy_hand = [hydrator.get_card(card_id) for card_id in enemy_ids]
+
+    results = []
+    for i, card_id, lane_index, col_index in chunk:
+        move = Move(hydrator.get_card(card_id), lane_index, col_index, board.side_to_move)
+        results.append((i, predictor.score_move(board, your_hand, enemy_hand, move, depth)))
+    return results
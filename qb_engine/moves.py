@@ -0,0 +1,106 @@
+# qb_engine/moves.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, Tuple, Union
+
+from qb_engine.board_state import BoardState
+from qb_engine.models import Card
+from qb_engine.projection import apply_projection, compute_projection_targets
+
+if TYPE_CHECKING:
+    from qb_engine.destruction import CardDestructionEngine
+    from qb_engine.triggers import EventDispatcher
+
+    # Anything with EventDispatcher.on_play's signature
+    PlayEvents = Union[EventDispatcher, CardDestructionEngine]
+
+
+# Hashable identity of a move: (card_id, lane_index, col_index, side)
+MoveKey = Tuple[str, int, int, str]
+
+
+@dataclass(frozen=True)
+class Move:
+    """
+    A single card placement.
+
+    - card:       the hydrated card being played
+    - lane_index: 0=TOP, 1=MID, 2=BOT
+    - col_index:  0..4 (1..5 to the player)
+    - side:       "Y" (YOU) or "E" (ENEMY)
+    """
+    card: Card
+    lane_index: int
+    col_index: int
+    side: str = "Y"
+
+    @property
+    def key(self) -> MoveKey:
+        return (self.card.id, self.lane_index, self.col_index, self.side)
+
+    def __str__(self) -> str:
+        lane_name = ("TOP", "MID", "BOT")[self.lane_index]
+        return f"{self.side}:{self.card.id}@{lane_name}-{self.col_index + 1}"
+
+
+@dataclass(frozen=True)
+class UndoToken:
+    """
+    Handle returned by make_move; pass it back to unmake_move.
+
+    mark is the board's undo-trail length before the move, so unmaking
+    reverts exactly the tiles, pawn deltas and auras the move changed.
+    """
+    move: Move
+    mark: int
+
+
+def apply_move(
+    board: BoardState,
+    move: Move,
+    events: Optional[PlayEvents] = None,
+) -> None:
+    """
+    Play a move on the board (no undo record):
+      1. Place the card on its W tile.
+      2. Apply its P/E/X projections for the moving side.
+      3. If `events` is given, resolve triggered effects (the card's
+         on_play and reactive "played" listeners); a CardDestructionEngine
+         also resolves the destruction they cause.
+      4. Hand the turn to the other side.
+
+    Legality is the caller's responsibility (see legality.is_legal_placement).
+    """
+    board.place_card_at(move.lane_index, move.col_index, move.card.id)
+    proj = compute_projection_targets(move.lane_index, move.col_index, move.card, move.side)
+    apply_projection(board, proj, move.card, move.side)
+    if events is not None:
+        events.on_play(board, move.lane_index, move.col_index, move.card, move.side)
+    board.set_side_to_move("E" if move.side == "Y" else "Y")
+
+
+def make_move(
+    board: BoardState,
+    move: Move,
+    events: Optional[PlayEvents] = None,
+) -> UndoToken:
+    """
+    Play a move and return an UndoToken that reverts it in O(changes).
+
+    Tokens nest (e.g. down a search line) and must be unmade in LIFO order.
+    Every make_move needs its unmake_move: while a frame is open the board
+    records every change. Use apply_move for moves that stay on the board
+    (building positions, playing out a game).
+    """
+    mark = board.push_undo_frame()
+    apply_move(board, move, events)
+    return UndoToken(move=move, mark=mark)
+
+
+def unmake_move(board: BoardState, token: UndoToken) -> None:
+    """
+    Revert the move recorded by `token`, restoring the board exactly.
+    """
+    board.pop_undo_frame(token.mark)
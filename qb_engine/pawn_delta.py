@@ -1,6 +1,7 @@
 # qb_engine/pawn_delta.py
 
 from dataclasses import dataclass
+from typing import Optional
 
 
 @dataclass
@@ -12,8 +13,14 @@ class PawnDelta:
     delta:
       +1 for a pawn contributed by YOU
       -1 for a pawn contributed by ENEMY
+
+    source_lane_index / source_col_index record the tile of the card that
+    projected the pawn (None when unknown), so duplicate copies of the same
+    card id can be told apart.
     """
     lane_index: int   # 0=TOP, 1=MID, 2=BOT
     col_index: int    # 0..4 for columns 1..5
     card_id: str
     delta: int
+    source_lane_index: Optional[int] = None
+    source_col_index: Optional[int] = None
@@ -1,15 +1,16 @@
 # qb_engine/projection.py
 
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Sequence
 
 from qb_engine.board_state import BoardState   # NOW AT TOP
 from qb_engine.models import Card
+from qb_engine.projection_table import (
+    ProjectionLookup,
+    ProjectionTarget,
+)
 
 
-# For clarity: (lane_index, col_index, kind) where kind is "P", "E", or "X"
-ProjectionTarget = Tuple[int, int, str]
-
 LANE_INDEX_TO_NAME = {
     0: "TOP",
     1: "MID",
@@ -28,16 +29,29 @@ class ProjectionResult:
       - lane_index: 0=TOP, 1=MID, 2=BOT
       - col_index:  0..4 (1..5 to the player)
       - kind: "P", "E", or "X"
+
+    pawn_mask / effect_mask hold the same P|X and E|X tiles as 15-bit masks.
     """
     root_lane_index: int
     root_col_index: int
-    targets: List[ProjectionTarget]
+    targets: Sequence[ProjectionTarget]
+    pawn_mask: int = 0
+    effect_mask: int = 0
+
+
+def get_projection_table(card: Card) -> ProjectionLookup:
+    """
+    Return the card's precomputed projection table (Cards build theirs
+    from the pattern planes at construction).
+    """
+    return card.projection_table
 
 
 def compute_projection_targets(
     root_lane_index: int,
     root_col_index: int,
     card: Card,
+    side: str = "Y",
 ) -> ProjectionResult:
     """
     Given a placement tile (root_lane_index, root_col_index) for `card`,
@@ -48,34 +62,23 @@ def compute_projection_targets(
         rowOffset = pRowIndex - 2
         colOffset = pColIndex - 2
         lane'     = lane - rowOffset
-        col'      = col  + colOffset
+        col'      = col  + colOffset     (YOU)
+        col'      = col  - colOffset     (ENEMY, mirrored)
 
     Only cells with "P", "E", or "X" in card.grid are returned.
     Off-board targets are discarded.
-    """
-
-    targets: List[ProjectionTarget] = []
-
-    # card.grid is a 5x5 list of strings like ".", "P", "E", "X", "W"
-    for p_row_index, row in enumerate(card.grid):
-        for p_col_index, cell in enumerate(row):
-            if cell not in ("P", "E", "X"):
-                continue
 
-            row_offset = p_row_index - 2
-            col_offset = p_col_index - 2
-
-            lane_prime = root_lane_index - row_offset
-            col_prime = root_col_index + col_offset
-
-            # Keep only tiles that land on the 3x5 board
-            if 0 <= lane_prime < 3 and 0 <= col_prime < 5:
-                targets.append((lane_prime, col_prime, cell))
+    The mapping is precomputed per (card, root tile, side) at hydration
+    time, so this is a table lookup rather than a 25-cell scan.
+    """
+    root = get_projection_table(card).lookup(root_lane_index, root_col_index, side)
 
     return ProjectionResult(
         root_lane_index=root_lane_index,
         root_col_index=root_col_index,
-        targets=targets,
+        targets=root.targets,
+        pawn_mask=root.pawn_mask,
+        effect_mask=root.effect_mask,
     )
 
 
@@ -85,13 +88,25 @@ def apply_pawns_for_you(board: BoardState, proj: ProjectionResult, card: Card) -
 
     Instead of mutating tiles directly, we:
       - Log PawnDelta entries for each affected EMPTY tile.
-      - Recompute tile owner/rank from base_influence + all PawnDeltas.
+      - Let the board update influence/owner/rank for just those tiles.
 
     Rules:
       - Only apply pawn changes to EMPTY tiles (no hidden stacks under cards).
       - X is treated as including a P component here; E component is handled elsewhere.
     """
 
+    _apply_pawns(board, proj, card, amount=1)
+
+
+def apply_pawns_for_enemy(board: BoardState, proj: ProjectionResult, card: Card) -> None:
+    """
+    Mirror of apply_pawns_for_you: each P/X tile pulls an EMPTY tile's
+    influence one step towards ENEMY (PawnDelta of -1).
+    """
+    _apply_pawns(board, proj, card, amount=-1)
+
+
+def _apply_pawns(board: BoardState, proj: ProjectionResult, card: Card, amount: int) -> None:
     for lane_index, col_index, kind in proj.targets:
         if kind not in ("P", "X"):
             continue  # ignore pure effect-only tiles here
@@ -102,15 +117,15 @@ def apply_pawns_for_you(board: BoardState, proj: ProjectionResult, card: Card) -
         if tile.card_id is not None:
             continue
 
-        board.add_pawn_delta_for_you(
+        board.add_pawn_delta(
             lane_index=lane_index,
             col_index=col_index,
             card_id=card.id,
-            amount=1,
+            amount=amount,
+            source_lane_index=proj.root_lane_index,
+            source_col_index=proj.root_col_index,
         )
 
-    board.recompute_influence_from_deltas()
-
 
 def apply_effects_for_you(board: BoardState, proj: ProjectionResult, card: Card) -> None:
     """
@@ -137,4 +152,24 @@ def apply_effects_for_you(board: BoardState, proj: ProjectionResult, card: Card)
             col_index=col_index,
             card_id=card.id,
             description=description,
+            source_lane_index=proj.root_lane_index,
+            source_col_index=proj.root_col_index,
         )
+
+
+def apply_projection(
+    board: BoardState,
+    proj: ProjectionResult,
+    card: Card,
+    side: str = "Y",
+) -> None:
+    """
+    Apply a full placement projection for `side`: pawns (P/X) then effect
+    auras (E/X). Auras carry no side of their own; scopes resolve it from
+    the source card's tile.
+    """
+    if side == "Y":
+        apply_pawns_for_you(board, proj, card)
+    else:
+        apply_pawns_for_enemy(board, proj, card)
+    apply_effects_for_you(board, proj, card)
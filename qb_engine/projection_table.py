@@ -0,0 +1,183 @@
+# qb_engine/projection_table.py
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Protocol, Sequence, Tuple
+
+from qb_engine.bitboard import NUM_COLS, NUM_LANES, NUM_TILES
+
+
+# For clarity: (lane_index, col_index, kind) where kind is "P", "E", or "X"
+ProjectionTarget = Tuple[int, int, str]
+
+# Pattern cell relative to W: (row_offset, col_offset, kind)
+PatternCell = Tuple[int, int, str]
+
+# Pattern grids are 5x5 with W at the centre (row 2, col 2). As bit planes,
+# cell (row, col) is bit row * PATTERN_SIZE + col.
+PATTERN_SIZE = 5
+
+
+@dataclass(frozen=True)
+class RootProjection:
+    """
+    Ready-made projection for one card placed on one root tile by one side.
+
+    - targets:     on-board (lane_index, col_index, kind) tuples, in
+                   card.grid scan order (same as compute_projection_targets)
+    - pawn_mask:   tiles receiving a pawn (P or X), as a 15-bit mask
+    - effect_mask: tiles receiving an effect aura (E or X), as a 15-bit mask
+    """
+    targets: Tuple[ProjectionTarget, ...]
+    pawn_mask: int
+    effect_mask: int
+
+
+@dataclass(frozen=True)
+class CardProjectionTable:
+    """
+    All projections of a card, for every root tile and both sides.
+
+    `you[i]` / `enemy[i]` hold the RootProjection for root tile index
+    i = lane_index * 5 + col_index. ENEMY placements mirror the pattern
+    left-right (col' = col - colOffset), as seen from the enemy's side.
+    """
+    you: Tuple[RootProjection, ...]
+    enemy: Tuple[RootProjection, ...]
+
+    def lookup(self, lane_index: int, col_index: int, side: str = "Y") -> RootProjection:
+        roots = self.you if side == "Y" else self.enemy
+        return roots[lane_index * NUM_COLS + col_index]
+
+
+class ProjectionLookup(Protocol):
+    """
+    What a Card's projection_table provides: CardProjectionTable, or a
+    view with the same interface (shared_tables.SharedProjectionTable).
+    """
+
+    def lookup(self, lane_index: int, col_index: int, side: str = "Y") -> RootProjection: ...
+
+    @property
+    def you(self) -> Tuple[RootProjection, ...]: ...
+
+    @property
+    def enemy(self) -> Tuple[RootProjection, ...]: ...
+
+
+def pattern_cells(grid: Sequence[Sequence[str]]) -> List[PatternCell]:
+    """
+    Extract the P/E/X cells of a 5x5 pattern grid as offsets from W (C,3).
+    """
+    cells: List[PatternCell] = []
+    for p_row_index, row in enumerate(grid):
+        for p_col_index, cell in enumerate(row):
+            if cell in ("P", "E", "X"):
+                cells.append((p_row_index - 2, p_col_index - 2, cell))
+    return cells
+
+
+def pattern_cells_from_planes(p_mask: int, e_mask: int, x_mask: int) -> List[PatternCell]:
+    """
+    Same as pattern_cells, from P/E/X bit planes (same row-major order).
+    """
+    cells: List[PatternCell] = []
+    remaining = p_mask | e_mask | x_mask
+    while remaining:
+        low = remaining & -remaining
+        bit = low.bit_length() - 1
+        remaining ^= low
+        if p_mask & low:
+            kind = "P"
+        elif e_mask & low:
+            kind = "E"
+        else:
+            kind = "X"
+        p_row_index, p_col_index = divmod(bit, PATTERN_SIZE)
+        cells.append((p_row_index - 2, p_col_index - 2, kind))
+    return cells
+
+
+def _build_root(
+    cells: Sequence[PatternCell],
+    root_lane_index: int,
+    root_col_index: int,
+    mirror: bool,
+) -> RootProjection:
+    targets: List[ProjectionTarget] = []
+    pawn_mask = 0
+    effect_mask = 0
+
+    for row_offset, col_offset, kind in cells:
+        lane_prime = root_lane_index - row_offset
+        if mirror:
+            col_prime = root_col_index - col_offset
+        else:
+            col_prime = root_col_index + col_offset
+
+        # Keep only tiles that land on the 3x5 board
+        if not (0 <= lane_prime < NUM_LANES and 0 <= col_prime < NUM_COLS):
+            continue
+
+        targets.append((lane_prime, col_prime, kind))
+        bit = 1 << (lane_prime * NUM_COLS + col_prime)
+        if kind in ("P", "X"):
+            pawn_mask |= bit
+        if kind in ("E", "X"):
+            effect_mask |= bit
+
+    return RootProjection(
+        targets=tuple(targets),
+        pawn_mask=pawn_mask,
+        effect_mask=effect_mask,
+    )
+
+
+@lru_cache(maxsize=None)
+def root_projection_from_masks(pawn_mask: int, effect_mask: int, mirror: bool) -> RootProjection:
+    """
+    Rebuild a RootProjection from its 15-bit masks (P = pawn only, E =
+    effect only, X = both). Targets follow _build_root's pattern scan:
+    lanes from BOT up, columns left to right (right to left when
+    mirrored for ENEMY).
+
+    The result depends only on the arguments, so every card and root tile
+    with the same masks shares one RootProjection.
+    """
+    targets: List[ProjectionTarget] = []
+    covered = pawn_mask | effect_mask
+    cols = range(NUM_COLS - 1, -1, -1) if mirror else range(NUM_COLS)
+    for lane_index in range(NUM_LANES - 1, -1, -1):
+        for col_index in cols:
+            bit = 1 << (lane_index * NUM_COLS + col_index)
+            if not covered & bit:
+                continue
+            if pawn_mask & bit:
+                kind = "X" if effect_mask & bit else "P"
+            else:
+                kind = "E"
+            targets.append((lane_index, col_index, kind))
+    return RootProjection(targets=tuple(targets), pawn_mask=pawn_mask, effect_mask=effect_mask)
+
+
+def build_projection_table(grid: Sequence[Sequence[str]]) -> CardProjectionTable:
+    """
+    Precompute the projection of a pattern grid for all 15 root tiles,
+    for YOU and (mirrored) for ENEMY.
+    """
+    return _build_table(pattern_cells(grid))
+
+
+def build_projection_table_from_planes(p_mask: int, e_mask: int, x_mask: int) -> CardProjectionTable:
+    """
+    build_projection_table for a pattern given as P/E/X bit planes.
+    """
+    return _build_table(pattern_cells_from_planes(p_mask, e_mask, x_mask))
+
+
+def _build_table(cells: Sequence[PatternCell]) -> CardProjectionTable:
+    roots = [divmod(index, NUM_COLS) for index in range(NUM_TILES)]
+    return CardProjectionTable(
+        you=tuple(_build_root(cells, lane, col, mirror=False) for lane, col in roots),
+        enemy=tuple(_build_root(cells, lane, col, mirror=True) for lane, col in roots),
+    )
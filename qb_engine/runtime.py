@@ -0,0 +1,65 @@
+# qb_engine/runtime.py
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from qb_engine.card_hydrator import CardHydrator
+    from qb_engine.effect_engine import EffectEngine
+
+
+# Repo layout: data/ sits next to the qb_engine package, so the defaults
+# do not depend on the caller's working directory.
+DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+DEFAULT_DB_PATH = DATA_DIR / "qb_DB_Complete_v2.json"
+DEFAULT_REGISTRY_PATH = DATA_DIR / "qb_effects_v1.json"
+
+_lock = threading.Lock()
+_hydrator: Optional[CardHydrator] = None
+_effect_engine: Optional[EffectEngine] = None
+
+
+def get_card_hydrator() -> CardHydrator:
+    """
+    Process-wide CardHydrator for the default DB, created on first call.
+
+    Scripts and editor hooks should use this instead of building their own
+    hydrator: nothing is imported or loaded until a card is actually needed.
+    """
+    global _hydrator
+    if _hydrator is None:
+        with _lock:
+            if _hydrator is None:
+                from qb_engine.card_hydrator import CardHydrator
+
+                _hydrator = CardHydrator(DEFAULT_DB_PATH)
+    return _hydrator
+
+
+def get_effect_engine() -> EffectEngine:
+    """
+    Process-wide EffectEngine for the default registry, sharing
+    get_card_hydrator()'s hydrator. Created on first call.
+    """
+    global _effect_engine
+    if _effect_engine is None:
+        hydrator = get_card_hydrator()
+        with _lock:
+            if _effect_engine is None:
+                from qb_engine.effect_engine import EffectEngine
+
+                _effect_engine = EffectEngine(DEFAULT_REGISTRY_PATH, hydrator)
+    return _effect_engine
+
+
+def reset() -> None:
+    """
+    Drop the shared instances (e.g. after the DB or registry changed on disk).
+    """
+    global _hydrator, _effect_engine
+    with _lock:
+        _hydrator = None
+        _effect_engine = None
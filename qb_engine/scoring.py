@@ -0,0 +1,79 @@
+# qb_engine/scoring.py
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from qb_engine.board_state import BoardState
+from qb_engine.effect_engine import EffectEngine
+
+
+# Rules-level scoring (qb_rules §9):
+#
+#   laneScore(player, lane) = sum of the current power of that player's cards
+#                             in that lane, after all active effects.
+#   lane winner             = player with the higher laneScore (tie: none)
+#   matchScore(player)      = sum of laneScore over the lanes that player wins
+#   match winner            = player with the higher matchScore (tie: none)
+
+
+@dataclass
+class ScoreSummary:
+    """
+    Scores for one board.
+
+    - lane_scores:  side ("Y"/"E") -> [TOP, MID, BOT] lane scores
+    - lane_winners: [TOP, MID, BOT] -> "Y", "E", or None for a tied lane
+    - match_scores: side -> match score
+    - winner:       "Y", "E", or None for a tied match
+    """
+    lane_scores: Dict[str, List[int]]
+    lane_winners: List[Optional[str]]
+    match_scores: Dict[str, int]
+    winner: Optional[str]
+
+    @property
+    def margin(self) -> int:
+        """
+        matchScore(YOU) - matchScore(ENEMY); positive favours YOU.
+        """
+        return self.match_scores["Y"] - self.match_scores["E"]
+
+
+def summarize_lane_scores(lane_scores: Dict[str, List[int]]) -> ScoreSummary:
+    """
+    Apply the lane-winner and match-score rules to per-lane scores.
+    """
+    lane_winners: List[Optional[str]] = []
+    match_scores = {"Y": 0, "E": 0}
+
+    for you, enemy in zip(lane_scores["Y"], lane_scores["E"]):
+        if you > enemy:
+            lane_winners.append("Y")
+            match_scores["Y"] += you
+        elif enemy > you:
+            lane_winners.append("E")
+            match_scores["E"] += enemy
+        else:
+            lane_winners.append(None)
+
+    if match_scores["Y"] > match_scores["E"]:
+        winner: Optional[str] = "Y"
+    elif match_scores["E"] > match_scores["Y"]:
+        winner = "E"
+    else:
+        winner = None
+
+    return ScoreSummary(
+        lane_scores={"Y": list(lane_scores["Y"]), "E": list(lane_scores["E"])},
+        lane_winners=lane_winners,
+        match_scores=match_scores,
+        winner=winner,
+    )
+
+
+def score_board(board: BoardState, effect_engine: EffectEngine) -> ScoreSummary:
+    """
+    Lane scores, lane winners and match scores for a single board.
+    """
+    powers = effect_engine.compute_board_powers(board)
+    return summarize_lane_scores(powers.lane_power)
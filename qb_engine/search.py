@@ -0,0 +1,399 @@
+# qb_engine/search.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple
+
+from qb_engine.bitboard import popcount
+from qb_engine.board_state import BoardState
+from qb_engine.destruction import CardDestructionEngine
+from qb_engine.effect_engine import EffectEngine
+from qb_engine.legality import generate_legal_moves
+from qb_engine.models import Card
+from qb_engine.moves import Move, MoveKey, make_move, unmake_move
+from qb_engine.projection import compute_projection_targets
+from qb_engine.scoring import score_board
+from qb_engine.transposition import EXACT, LOWER, UPPER, TranspositionTable
+from qb_engine.zobrist import PASS_KEY, hand_hash, hand_key
+
+if TYPE_CHECKING:
+    from qb_engine.moves import PlayEvents
+
+
+INF = float("inf")
+
+# Evaluation of a board from YOU's point of view (positive favours YOU)
+Evaluator = Callable[[BoardState], float]
+
+
+@dataclass
+class SearchResult:
+    """
+    Outcome of a search from the root position.
+
+    - best_move: best move for the side to move (None if it must pass)
+    - score:     minimax value from YOU's point of view
+    - nodes:     positions visited
+    """
+    best_move: Optional[Move]
+    score: float
+    nodes: int
+
+
+@dataclass
+class SearchState:
+    """
+    Mutable search position: the board plus both hands.
+
+    hashes[side] is the zobrist.hand_hash of hands[side], kept in step as
+    cards are played and restored. events, when set, resolves triggered
+    effects for every move played.
+    """
+    board: BoardState
+    hands: Dict[str, List[Card]]
+    hashes: Dict[str, int]
+    events: Optional[PlayEvents] = None
+
+    @staticmethod
+    def create(
+        board: BoardState,
+        your_hand: Sequence[Card],
+        enemy_hand: Sequence[Card],
+        events: Optional[PlayEvents] = None,
+    ) -> "SearchState":
+        hands = {"Y": list(your_hand), "E": list(enemy_hand)}
+        return SearchState(
+            board=board,
+            hands=hands,
+            hashes={side: hand_hash(side, (c.id for c in cards)) for side, cards in hands.items()},
+            events=events,
+        )
+
+    def key(self, passes: int) -> int:
+        key = self.board.zobrist_hash ^ self.hashes["Y"] ^ self.hashes["E"]
+        return key ^ PASS_KEY if passes else key
+
+    def add_card(self, side: str, card: Card, position: Optional[int] = None) -> None:
+        """
+        Put `card` into side's hand at `position` (default: the end),
+        keeping hashes[side] in step.
+        """
+        hand = self.hands[side]
+        hand.insert(len(hand) if position is None else position, card)
+        copies = sum(1 for c in hand if c.id == card.id)
+        self.hashes[side] ^= hand_key(side, card.id, copies)
+
+    def remove_card(self, side: str, position: int) -> Card:
+        """
+        Take the card at `position` out of side's hand, keeping
+        hashes[side] in step. Undone by add_card(side, card, position).
+        """
+        hand = self.hands[side]
+        copies = sum(1 for c in hand if c.id == hand[position].id)
+        card = hand.pop(position)
+        self.hashes[side] ^= hand_key(side, card.id, copies)
+        return card
+
+    def play(self, move: Move):
+        """
+        Make `move` and take its card out of the mover's hand.
+        Returns an undo handle for `undo`.
+        """
+        hand = self.hands[move.side]
+        position = next(i for i, c in enumerate(hand) if c.id == move.card.id)
+        card = self.remove_card(move.side, position)
+        token = make_move(self.board, move, self.events)
+        return token, position, card
+
+    def undo(self, handle) -> None:
+        token, position, card = handle
+        unmake_move(self.board, token)
+        self.add_card(token.move.side, card, position)
+
+    def pass_turn(self) -> int:
+        """
+        Hand the turn over without playing; returns an undo mark.
+        """
+        mark = self.board.push_undo_frame()
+        self.board.set_side_to_move(_other(self.board.side_to_move))
+        return mark
+
+    def undo_pass(self, mark: int) -> None:
+        self.board.pop_undo_frame(mark)
+
+
+class PredictorEngine:
+    """
+    Depth-limited alternating YOU/ENEMY search with alpha-beta pruning.
+
+    Extends the spec's 1-ply enemy-reply enumeration (qb_engine_v2.1.0 §9)
+    to any depth. YOU maximises and ENEMY minimises the evaluation (by
+    default the match-score margin, qb_rules §9). Each ply is one card
+    placement from the mover's known hand; a side with no legal placement
+    passes, and two passes in a row end the line.
+
+    Triggered effects (on_play, reactive listeners) and the destruction
+    they cause are resolved on every move by a CardDestructionEngine.
+
+    Moves are tried in order of cheap static features (see
+    static_move_priority), with the transposition table's best move first.
+    Root ties are broken towards the first move in generation order, so
+    the best move always equals that of exhaustive minimax.
+
+    The transposition table persists across calls. Its scores are reused
+    only at the depth they were searched to, so searches of different
+    depths on one engine stay exact.
+    """
+
+    def __init__(
+        self,
+        effect_engine: EffectEngine,
+        evaluator: Optional[Evaluator] = None,
+        tt: Optional[TranspositionTable] = None,
+    ) -> None:
+        self._effect_engine = effect_engine
+        self.events = CardDestructionEngine(effect_engine)
+        self._evaluate = evaluator or self.match_margin
+        self.tt = tt if tt is not None else TranspositionTable()
+        self.nodes = 0
+
+    @property
+    def effect_engine(self) -> EffectEngine:
+        return self._effect_engine
+
+    # --------------------------------------------------------------------- #
+    # Public API
+    # --------------------------------------------------------------------- #
+
+    def match_margin(self, board: BoardState) -> float:
+        """
+        Default evaluation: matchScore(YOU) - matchScore(ENEMY).
+        """
+        return score_board(board, self._effect_engine).margin
+
+    def search(
+        self,
+        board: BoardState,
+        your_hand: Sequence[Card],
+        enemy_hand: Sequence[Card],
+        depth: int,
+    ) -> SearchResult:
+        """
+        Search `depth` plies from the board's side_to_move.
+        The board is restored before returning.
+        """
+        self.nodes = 0
+        state = SearchState.create(board, your_hand, enemy_hand, self.events)
+        best_move, score = self._root(state, depth)
+        return SearchResult(best_move=best_move, score=score, nodes=self.nodes)
+
+    def score_move(
+        self,
+        board: BoardState,
+        your_hand: Sequence[Card],
+        enemy_hand: Sequence[Card],
+        move: Move,
+        depth: int,
+    ) -> float:
+        """
+        Exact minimax value of playing `move` and then searching depth - 1
+        plies (used to rank every root candidate, not just the best one).
+        """
+        state = SearchState.create(board, your_hand, enemy_hand, self.events)
+        handle = state.play(move)
+        try:
+            return self._alphabeta(state, depth - 1, -INF, INF, passes=0)
+        finally:
+            state.undo(handle)
+
+    # --------------------------------------------------------------------- #
+    # Internals
+    # --------------------------------------------------------------------- #
+
+    def _root(self, state: SearchState, depth: int) -> Tuple[Optional[Move], float]:
+        board = state.board
+        side = board.side_to_move
+        moves = generate_legal_moves(board, state.hands[side], side)
+
+        if depth <= 0 or not moves:
+            return None, self._alphabeta(state, depth, -INF, INF, passes=0)
+
+        maximizing = side == "Y"
+        canonical = {move.key: i for i, move in enumerate(moves)}
+        entry = self.tt.probe(state.key(0))
+        ordered = self._order_moves(board, moves, entry.best_move if entry else None)
+
+        best_move: Optional[Move] = None
+        best_score = 0.0
+        for move in ordered:
+            handle = state.play(move)
+            try:
+                if best_move is None:
+                    score = self._alphabeta(state, depth - 1, -INF, INF, passes=0)
+                    improved = True
+                else:
+                    # Moves earlier in generation order win ties, so they
+                    # only need to reach best_score; later ones must beat it.
+                    earlier = canonical[move.key] < canonical[best_move.key]
+                    # Anything inside the window is an exact score.
+                    if maximizing:
+                        alpha = best_score - 1 if earlier else best_score
+                        score = self._alphabeta(state, depth - 1, alpha, INF, passes=0)
+                        improved = score > best_score or (earlier and score == best_score)
+                    else:
+                        beta = best_score + 1 if earlier else best_score
+                        score = self._alphabeta(state, depth - 1, -INF, beta, passes=0)
+                        improved = score < best_score or (earlier and score == best_score)
+            finally:
+                state.undo(handle)
+
+            if improved:
+                best_move, best_score = move, score
+
+        self.tt.store(state.key(0), depth, best_score, EXACT, best_move.key)
+        return best_move, best_score
+
+    def _alphabeta(
+        self,
+        state: SearchState,
+        depth: int,
+        alpha: float,
+        beta: float,
+        passes: int,
+    ) -> float:
+        self.nodes += 1
+        board = state.board
+
+        if depth <= 0 or passes >= 2:
+            return self._evaluate(board)
+
+        key = state.key(passes)
+        entry = self.tt.probe(key)
+        # Scores only cut off a search to the same depth: the value is
+        # depth-limited minimax, so a deeper entry is a different value.
+        # Entries of any depth still supply the first move to try.
+        if entry is not None and entry.depth == depth:
+            if entry.bound == EXACT:
+                return entry.score
+            if entry.bound == LOWER and entry.score >= beta:
+                return entry.score
+            if entry.bound == UPPER and entry.score <= alpha:
+                return entry.score
+
+        side = board.side_to_move
+        moves = generate_legal_moves(board, state.hands[side], side)
+        if not moves:
+            mark = state.pass_turn()
+            try:
+                return self._alphabeta(state, depth - 1, alpha, beta, passes + 1)
+            finally:
+                state.undo_pass(mark)
+
+        maximizing = side == "Y"
+        alpha_orig, beta_orig = alpha, beta
+        best_score = -INF if maximizing else INF
+        best_key: Optional[MoveKey] = None
+
+        for move in self._order_moves(board, moves, entry.best_move if entry else None):
+            handle = state.play(move)
+            try:
+                score = self._alphabeta(state, depth - 1, alpha, beta, passes=0)
+            finally:
+                state.undo(handle)
+
+            if maximizing:
+                if score > best_score:
+                    best_score, best_key = score, move.key
+                alpha = max(alpha, score)
+            else:
+                if score < best_score:
+                    best_score, best_key = score, move.key
+                beta = min(beta, score)
+            if alpha >= beta:
+                break
+
+        if best_score <= alpha_orig:
+            bound = UPPER
+        elif best_score >= beta_orig:
+            bound = LOWER
+        else:
+            bound = EXACT
+        self.tt.store(key, depth, best_score, bound, best_key)
+        return best_score
+
+    def _order_moves(
+        self,
+        board: BoardState,
+        moves: List[Move],
+        tt_move: Optional[MoveKey],
+    ) -> List[Move]:
+        """
+        Order moves by static features, best first (stable, so equal keys
+        keep generation order). The transposition-table move goes first.
+        """
+        def priority(move: Move) -> float:
+            if move.key == tt_move:
+                return INF
+            return static_move_priority(board, move)
+
+        return sorted(moves, key=priority, reverse=True)
+
+
+def static_move_priority(board: BoardState, move: Move) -> int:
+    """
+    Cheap static estimate of a move's strength, used for move ordering:
+    pawn gain on new tiles, tiles reinforced, effect reach on cards and
+    the card's base power.
+
+    Base power is a rough stand-in for the lane swing: the real lane-score
+    change depends on auras and triggers and would need a board evaluation
+    per ordered move.
+    """
+    masks = board.masks
+    proj = compute_projection_targets(move.lane_index, move.col_index, move.card, move.side)
+    empty_pawns = proj.pawn_mask & ~masks.occupied
+    flips = popcount(empty_pawns & ~masks.owner_mask(move.side))   # pawn gain on new tiles
+    reinforce = popcount(empty_pawns & masks.owner_mask(move.side))
+    reach = popcount(proj.effect_mask & masks.occupied)            # effect reach on cards
+    return 2 * flips + reinforce + reach + move.card.power
+
+
+def minimax(
+    state: SearchState,
+    depth: int,
+    evaluate: Evaluator,
+    passes: int = 0,
+) -> Tuple[Optional[Move], float]:
+    """
+    Exhaustive minimax reference (no pruning, no table), with the same
+    pass rules and first-in-generation-order tie-break as PredictorEngine.
+    """
+    board = state.board
+    if depth <= 0 or passes >= 2:
+        return None, evaluate(board)
+
+    side = board.side_to_move
+    moves = generate_legal_moves(board, state.hands[side], side)
+    if not moves:
+        mark = state.pass_turn()
+        try:
+            return None, minimax(state, depth - 1, evaluate, passes + 1)[1]
+        finally:
+            state.undo_pass(mark)
+
+    best_move: Optional[Move] = None
+    best_score = 0.0
+    for move in moves:
+        handle = state.play(move)
+        try:
+            score = minimax(state, depth - 1, evaluate)[1]
+        finally:
+            state.undo(handle)
+        if best_move is None or (score > best_score if side == "Y" else score < best_score):
+            best_move, best_score = move, score
+    return best_move, best_score
+
+
+def _other(side: str) -> str:
+    return "E" if side == "Y" else "Y"
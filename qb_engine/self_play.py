@@ -0,0 +1,315 @@
+# qb_engine/self_play.py
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence
+
+from qb_engine.board_state import BoardState
+from qb_engine.destruction import CardDestructionEngine
+from qb_engine.effect_engine import EffectEngine
+from qb_engine.legality import generate_legal_moves, is_legal_placement
+from qb_engine.models import Card
+from qb_engine.moves import Move, MoveKey, apply_move, make_move, unmake_move
+from qb_engine.scoring import ScoreSummary, score_board
+from qb_engine.search import PredictorEngine
+
+
+DECK_SIZE = 15
+OPENING_HAND_SIZE = 5
+
+# Safety cap; a real game ends long before (15 tiles, two passes end it)
+MAX_PLIES = 64
+
+# Fifteen low-cost DB cards, used when no deck is given
+DEFAULT_DECK = (
+    "001", "001", "002", "003", "005", "007", "008", "008",
+    "011", "013", "018", "020", "023", "026", "030",
+)
+
+
+# ------------------------------------------------------------------------- #
+# Policies
+# ------------------------------------------------------------------------- #
+
+class Policy(ABC):
+    """
+    Chooses a move for `side` from its hand, or None to pass.
+
+    opponent_hand is the opponent's actual hand: self-play is run with
+    perfect information, which is what bulk evaluation data wants.
+    Subclasses must implement choose (a policy without it cannot be
+    instantiated).
+    """
+    name = "policy"
+
+    @abstractmethod
+    def choose(
+        self,
+        board: BoardState,
+        hand: Sequence[Card],
+        opponent_hand: Sequence[Card],
+        side: str,
+        rng: random.Random,
+    ) -> Optional[Move]:
+        ...
+
+
+class RandomPolicy(Policy):
+    """
+    Uniformly random legal move; passes only when it has none.
+    """
+    name = "random"
+
+    def choose(self, board, hand, opponent_hand, side, rng):
+        moves = generate_legal_moves(board, hand, side)
+        return rng.choice(moves) if moves else None
+
+
+class GreedyPolicy(Policy):
+    """
+    One-ply lookahead: the move with the best match margin for `side`
+    right after it resolves (triggers and destruction included).
+    Ties keep generation order.
+    """
+    name = "greedy"
+
+    def __init__(self, effect_engine: EffectEngine) -> None:
+        self._effect_engine = effect_engine
+        self._events = CardDestructionEngine(effect_engine)
+
+    def choose(self, board, hand, opponent_hand, side, rng):
+        sign = 1 if side == "Y" else -1
+        best_move: Optional[Move] = None
+        best_score = 0
+        for move in generate_legal_moves(board, hand, side):
+            token = make_move(board, move, self._events)
+            score = sign * score_board(board, self._effect_engine).margin
+            unmake_move(board, token)
+            if best_move is None or score > best_score:
+                best_move, best_score = move, score
+        return best_move
+
+
+class SearchPolicy(Policy):
+    """
+    PredictorEngine alpha-beta to a fixed depth over both known hands.
+    """
+    name = "search"
+
+    def __init__(self, effect_engine: EffectEngine, depth: int = 2) -> None:
+        self._predictor = PredictorEngine(effect_engine)
+        self.depth = depth
+
+    def choose(self, board, hand, opponent_hand, side, rng):
+        your_hand, enemy_hand = (hand, opponent_hand) if side == "Y" else (opponent_hand, hand)
+        return self._predictor.search(board, your_hand, enemy_hand, self.depth).best_move
+
+
+# Policy name -> factory(effect_engine)
+POLICIES: Dict[str, Callable[[EffectEngine], Policy]] = {
+    "random": lambda engine: RandomPolicy(),
+    "greedy": GreedyPolicy,
+    "search": SearchPolicy,
+}
+
+
+# ------------------------------------------------------------------------- #
+# Results
+# ------------------------------------------------------------------------- #
+
+@dataclass
+class GameRecord:
+    """
+    One finished game.
+
+    - seed:  the game's RNG seed (replaying with it reproduces the game)
+    - first: side that moved first
+    - plies: MoveKey per turn, None for a pass
+    - score: rules-level scoring of the final board (qb_rules §9)
+    """
+    seed: int
+    first: str
+    plies: List[Optional[MoveKey]]
+    score: ScoreSummary
+    board: BoardState = field(repr=False)
+
+    @property
+    def winner(self) -> Optional[str]:
+        return self.score.winner
+
+
+@dataclass
+class SelfPlayReport:
+    """
+    Totals for a batch of games; wins are counted by side ("Y"/"E").
+    """
+    games: List[GameRecord]
+    wins: Dict[str, int]
+    draws: int
+    elapsed: float
+
+    @property
+    def games_per_sec(self) -> float:
+        return len(self.games) / self.elapsed if self.elapsed > 0 else float("inf")
+
+    def __str__(self) -> str:
+        plies = sum(len(g.plies) for g in self.games)
+        return (
+            f"{len(self.games)} games: Y {self.wins['Y']} / E {self.wins['E']} / draw {self.draws}  "
+            f"({self.games_per_sec:.1f} games/s, {plies / max(self.elapsed, 1e-9):.0f} plies/s)"
+        )
+
+
+# ------------------------------------------------------------------------- #
+# Runner
+# ------------------------------------------------------------------------- #
+
+class SelfPlayRunner:
+    """
+    Headless game loop for two decks and two policies.
+
+    Per game: each DECK_SIZE-card deck is shuffled and deals
+    OPENING_HAND_SIZE cards.
+    Every turn starts with a one-card draw (except the first player's
+    first turn), then the policy places a card or passes; a side with no
+    legal placement must pass. Two passes in a row end the game, which is
+    then scored with the rules-level match score.
+
+    Every move resolves triggers and destruction (CardDestructionEngine).
+    All randomness (shuffles, random policies) comes from one RNG per game
+    seeded from the batch seed, so a batch is fully reproducible.
+    """
+
+    def __init__(self, effect_engine: EffectEngine) -> None:
+        self._effect_engine = effect_engine
+        self._hydrator = effect_engine.card_hydrator
+        self._events = CardDestructionEngine(effect_engine)
+
+    def play_game(
+        self,
+        decks: Dict[str, Sequence[str]],
+        policies: Dict[str, Policy],
+        seed: int,
+        first: str = "Y",
+    ) -> GameRecord:
+        """
+        Play one game. decks / policies are keyed by side ("Y"/"E");
+        decks are lists of card ids.
+        """
+        rng = random.Random(seed)
+        draw_piles: Dict[str, List[Card]] = {}
+        hands: Dict[str, List[Card]] = {}
+        for side in ("Y", "E"):
+            if len(decks[side]) != DECK_SIZE:
+                raise ValueError(
+                    f"Deck for {side} has {len(decks[side])} cards; decks hold {DECK_SIZE}."
+                )
+            pile = [self._hydrator.get_card(card_id) for card_id in decks[side]]
+            rng.shuffle(pile)
+            hands[side] = pile[:OPENING_HAND_SIZE]
+            draw_piles[side] = pile[OPENING_HAND_SIZE:]
+
+        board = BoardState.create_initial_board()
+        board.set_side_to_move(first)
+        plies: List[Optional[MoveKey]] = []
+        passes = 0
+
+        while passes < 2 and len(plies) < MAX_PLIES:
+            side = board.side_to_move
+            other = "E" if side == "Y" else "Y"
+            if plies and draw_piles[side]:
+                hands[side].append(draw_piles[side].pop())
+
+            move = policies[side].choose(board, hands[side], hands[other], side, rng)
+            if move is None:
+                passes += 1
+                plies.append(None)
+                board.set_side_to_move(other)
+                continue
+
+            passes = 0
+            hand = hands[side]
+            position = next((i for i, c in enumerate(hand) if c.id == move.card.id), None)
+            if position is None:
+                raise ValueError(
+                    f"Policy '{policies[side].name}' played {move.card.id}, not in {side}'s hand."
+                )
+            if move.side != side or not is_legal_placement(
+                board, move.lane_index, move.col_index, move.card, side
+            ):
+                raise ValueError(f"Policy '{policies[side].name}' chose an illegal move: {move}.")
+            hand.pop(position)
+            apply_move(board, move, self._events)
+            plies.append(move.key)
+
+        return GameRecord(
+            seed=seed,
+            first=first,
+            plies=plies,
+            score=score_board(board, self._effect_engine),
+            board=board,
+        )
+
+    def run(
+        self,
+        decks: Dict[str, Sequence[str]],
+        policies: Dict[str, Policy],
+        games: int,
+        seed: int = 0,
+        alternate_first: bool = True,
+    ) -> SelfPlayReport:
+        """
+        Play `games` games; with alternate_first, odd-numbered games are
+        started by ENEMY.
+        """
+        seeds = random.Random(seed)
+        records: List[GameRecord] = []
+        wins = {"Y": 0, "E": 0}
+        draws = 0
+
+        start = time.perf_counter()
+        for i in range(games):
+            first = "E" if alternate_first and i % 2 else "Y"
+            record = self.play_game(decks, policies, seeds.getrandbits(63), first)
+            records.append(record)
+            if record.winner is None:
+                draws += 1
+            else:
+                wins[record.winner] += 1
+        elapsed = time.perf_counter() - start
+
+        return SelfPlayReport(games=records, wins=wins, draws=draws, elapsed=elapsed)
+
+
+def main(argv: Sequence[str] = ()) -> int:
+    parser = argparse.ArgumentParser(description="Headless Queen's Blood self-play.")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--policy-y", choices=sorted(POLICIES), default="greedy")
+    parser.add_argument("--policy-e", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--deck-y", help="comma-separated card ids (default: DEFAULT_DECK)")
+    parser.add_argument("--deck-e", help="comma-separated card ids (default: DEFAULT_DECK)")
+    args = parser.parse_args(argv)
+
+    from qb_engine.runtime import get_effect_engine
+
+    engine = get_effect_engine()
+    decks = {
+        "Y": args.deck_y.split(",") if args.deck_y else DEFAULT_DECK,
+        "E": args.deck_e.split(",") if args.deck_e else DEFAULT_DECK,
+    }
+    policies = {"Y": POLICIES[args.policy_y](engine), "E": POLICIES[args.policy_e](engine)}
+
+    report = SelfPlayRunner(engine).run(decks, policies, args.games, args.seed)
+    print(f"{args.policy_y} (Y) vs {args.policy_e} (E): {report}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
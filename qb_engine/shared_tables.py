@@ -0,0 +1,431 @@
+# qb_engine/shared_tables.py
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from qb_engine.bitboard import NUM_COLS, NUM_TILES
+from qb_engine.effect_engine import NO_EFFECT, CompiledRegistry, EffectEngine
+from qb_engine.models import Card
+from qb_engine.projection_table import RootProjection, root_projection_from_masks
+
+
+# Card tables as one read-only struct-of-arrays block (see SharedCardTables).
+#
+# Layout: fixed header, then each section 8-byte aligned, in this order:
+#
+#   header        magic 8s, version H, num_cards I, num_effects I, blob_len Q
+#   power         int32[N]
+#   cost          int32[N]
+#   effect_row    int32[N]      compiled registry row, or NO_EFFECT
+#   p/e/x/w_mask  uint32[N]     25-bit pattern planes (see models.Card)
+#   pawn_masks    uint16[N*2*15]  [(card * 2 + side) * 15 + root tile]
+#   effect_masks  uint16[N*2*15]  side 0 = YOU, 1 = ENEMY (mirrored)
+#   str_spans     int32[N*6*2]  (start, length) into blob per string field;
+#                               length -1 encodes None
+#   trigger       int32[M]      compiled registry columns, one per effect row
+#   scope         int32[M]
+#   power_delta   int32[M]
+#   listens       int32[M]
+#   effect_spans  int32[M*2]    (start, length) of each effect id in blob
+#   blob          UTF-8 bytes[blob_len]
+#
+# Cards are stored in sorted id order; a card's row is its position.
+# Effects keep the compiled registry's row order.
+
+TABLES_MAGIC = b"QBTABLE\0"
+TABLES_VERSION = 2
+
+_HEADER = struct.Struct("<8sHIIQ")
+
+_INT_SECTIONS = ("power", "cost", "effect_row")
+_MASK_SECTIONS = ("p_mask", "e_mask", "x_mask", "w_mask")
+_STRING_FIELDS = ("id", "name", "category", "pattern", "effect", "effect_id")
+_EFFECT_SECTIONS = ("trigger", "scope", "power_delta", "listens")
+
+_SIDES = ("Y", "E")
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _layout(
+    num_cards: int, num_effects: int, blob_len: int
+) -> Tuple[Dict[str, Tuple[int, int, str]], int]:
+    """
+    Section name -> (offset, item count, memoryview format), plus total size.
+    """
+    sections: Dict[str, Tuple[int, int, str]] = {}
+    offset = _align(_HEADER.size)
+    specs: List[Tuple[str, int, str, int]] = []
+    specs += [(name, num_cards, "i", 4) for name in _INT_SECTIONS]
+    specs += [(name, num_cards, "I", 4) for name in _MASK_SECTIONS]
+    specs += [(name, num_cards * 2 * NUM_TILES, "H", 2) for name in ("pawn_masks", "effect_masks")]
+    specs.append(("str_spans", num_cards * len(_STRING_FIELDS) * 2, "i", 4))
+    specs += [(name, num_effects, "i", 4) for name in _EFFECT_SECTIONS]
+    specs.append(("effect_spans", num_effects * 2, "i", 4))
+    specs.append(("blob", blob_len, "B", 1))
+    for name, count, fmt, itemsize in specs:
+        sections[name] = (offset, count, fmt)
+        offset = _align(offset + count * itemsize)
+    return sections, offset
+
+
+def _default_dir() -> str:
+    # tmpfs when available, so the block never touches disk
+    return "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+
+class SharedCardTables:
+    """
+    The card DB as flat typed arrays in one memory-mapped block, shared by
+    every process that maps it.
+
+    The owning process writes the block once (create); workers attach to
+    it by path (attach) and map it read-only. Every array is a typed
+    memoryview straight over the mapping, so attaching copies nothing and
+    all workers share the same physical pages.
+
+    Per card row:
+    - power, cost, effect_row (compiled effect-registry row, NO_EFFECT if none)
+    - p_mask / e_mask / x_mask / w_mask pattern planes
+    - pawn_mask / effect_mask for each (side, root tile), as 15-bit masks
+    - id, name, category, pattern, effect, effect_id strings
+    The compiled effect registry is stored alongside (one row per effect).
+
+    A worker needs nothing else: hydrator() is a CardHydrator stand-in
+    whose cards read their projections from the shared masks
+    (SharedProjectionTable), and effect_engine() builds an EffectEngine on
+    the shared registry columns. Neither the JSON DB, its snapshot nor the
+    registry JSON is read.
+    """
+
+    def __init__(self, path: Path, buffer: mmap.mmap, owner: bool) -> None:
+        self.path = path
+        self._mmap = buffer
+        self._owner = owner
+        self._views: List[memoryview] = []
+
+        view = memoryview(buffer)
+        self._views.append(view)
+        magic, version, num_cards, num_effects, blob_len = _HEADER.unpack_from(view)
+        if magic != TABLES_MAGIC or version != TABLES_VERSION:
+            self.close()
+            raise ValueError(f"Not a card table block (or another version): {path}")
+
+        self.num_cards = num_cards
+        self.num_effects = num_effects
+        sections, _ = _layout(num_cards, num_effects, blob_len)
+        arrays: Dict[str, memoryview] = {}
+        for name, (offset, count, fmt) in sections.items():
+            itemsize = struct.calcsize(fmt)
+            arrays[name] = view[offset:offset + count * itemsize].cast(fmt)
+            self._views.append(arrays[name])
+
+        self.power = arrays["power"]
+        self.cost = arrays["cost"]
+        self.effect_row = arrays["effect_row"]
+        self.p_mask = arrays["p_mask"]
+        self.e_mask = arrays["e_mask"]
+        self.x_mask = arrays["x_mask"]
+        self.w_mask = arrays["w_mask"]
+        self.pawn_masks = arrays["pawn_masks"]
+        self.effect_masks = arrays["effect_masks"]
+        self._str_spans = arrays["str_spans"]
+        self.trigger = arrays["trigger"]
+        self.scope = arrays["scope"]
+        self.power_delta = arrays["power_delta"]
+        self.listens = arrays["listens"]
+        self._effect_spans = arrays["effect_spans"]
+        self._blob = arrays["blob"]
+
+        self.card_ids: Tuple[str, ...] = tuple(
+            self._string(row, 0) for row in range(num_cards)
+        )
+        self._rows: Dict[str, int] = {card_id: row for row, card_id in enumerate(self.card_ids)}
+
+    # --------------------------------------------------------------------- #
+    # Construction
+    # --------------------------------------------------------------------- #
+
+    @classmethod
+    def create(cls, effect_engine: EffectEngine, path: Optional[Path] = None) -> "SharedCardTables":
+        """
+        Export every card of effect_engine's hydrator into a new block and
+        return the owning (writable) handle. The caller is responsible for
+        unlink() once no worker needs the block any more.
+        """
+        hydrator = effect_engine.card_hydrator
+        compiled = effect_engine.compiled
+        cards = [hydrator.get_card(card_id) for card_id in sorted(hydrator.index)]
+
+        blob = bytearray()
+        spans: List[int] = []
+        for card in cards:
+            for name in _STRING_FIELDS:
+                value = getattr(card, name)
+                if value is None:
+                    spans += [0, -1]
+                    continue
+                encoded = value.encode("utf-8")
+                spans += [len(blob), len(encoded)]
+                blob += encoded
+        effect_spans: List[int] = []
+        for effect_id in compiled.effect_ids:
+            encoded = effect_id.encode("utf-8")
+            effect_spans += [len(blob), len(encoded)]
+            blob += encoded
+        num_effects = len(compiled.effect_ids)
+
+        sections, size = _layout(len(cards), num_effects, len(blob))
+        if path is None:
+            fd, name = tempfile.mkstemp(prefix="qb_tables_", suffix=".bin", dir=_default_dir())
+            os.close(fd)
+            path = Path(name)
+
+        with path.open("w+b") as f:
+            f.truncate(size)
+            buffer = mmap.mmap(f.fileno(), size)
+
+        view = memoryview(buffer)
+        _HEADER.pack_into(view, 0, TABLES_MAGIC, TABLES_VERSION, len(cards), num_effects, len(blob))
+
+        columns: Dict[str, List[int]] = {
+            "power": [card.power for card in cards],
+            "cost": [card.cost for card in cards],
+            "effect_row": [compiled.card_rows.get(card.id, NO_EFFECT) for card in cards],
+            "p_mask": [card.p_mask for card in cards],
+            "e_mask": [card.e_mask for card in cards],
+            "x_mask": [card.x_mask for card in cards],
+            "w_mask": [card.w_mask for card in cards],
+            "pawn_masks": [],
+            "effect_masks": [],
+            "str_spans": spans,
+            "trigger": list(compiled.triggers),
+            "scope": list(compiled.scopes),
+            "power_delta": list(compiled.power_deltas),
+            "listens": list(compiled.listens),
+            "effect_spans": effect_spans,
+        }
+        for card in cards:
+            for roots in (card.projection_table.you, card.projection_table.enemy):
+                columns["pawn_masks"].extend(root.pawn_mask for root in roots)
+                columns["effect_masks"].extend(root.effect_mask for root in roots)
+
+        for name, values in columns.items():
+            offset, count, fmt = sections[name]
+            struct.pack_into(f"<{count}{fmt}", view, offset, *values)
+        offset, _, _ = sections["blob"]
+        view[offset:offset + len(blob)] = blob
+        view.release()
+
+        return cls(path, buffer, owner=True)
+
+    @classmethod
+    def attach(cls, path: Path) -> "SharedCardTables":
+        """
+        Map an existing block read-only.
+        """
+        path = Path(path)
+        with path.open("rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(path, buffer, owner=False)
+
+    # --------------------------------------------------------------------- #
+    # Lookups
+    # --------------------------------------------------------------------- #
+
+    def row_for(self, card_id: str) -> int:
+        """
+        Table row of a card id (KeyError if unknown).
+        """
+        return self._rows[card_id]
+
+    def pawn_mask(self, row: int, side: str, root_index: int) -> int:
+        return self.pawn_masks[(row * 2 + _SIDES.index(side)) * NUM_TILES + root_index]
+
+    def effect_mask(self, row: int, side: str, root_index: int) -> int:
+        return self.effect_masks[(row * 2 + _SIDES.index(side)) * NUM_TILES + root_index]
+
+    def build_card(self, row: int) -> Card:
+        """
+        Hydrate the Card stored at `row`. Its projection table is a
+        SharedProjectionTable over this row, so nothing is rebuilt; the
+        card is only usable while the tables stay open.
+        """
+        return Card(
+            cost=self.cost[row],
+            power=self.power[row],
+            p_mask=self.p_mask[row],
+            e_mask=self.e_mask[row],
+            x_mask=self.x_mask[row],
+            w_mask=self.w_mask[row],
+            projection=SharedProjectionTable(self, row),
+            **self.card_strings(row),
+        )
+
+    def card_strings(self, row: int) -> Dict[str, Optional[str]]:
+        """
+        The string fields (id, name, category, pattern, effect, effect_id)
+        of the card at `row`, decoded from the blob.
+        """
+        return {name: self._string(row, field) for field, name in enumerate(_STRING_FIELDS)}
+
+    def hydrator(self) -> "SharedCardHydrator":
+        return SharedCardHydrator(self)
+
+    def compiled_registry(self) -> CompiledRegistry:
+        """
+        The stored effect registry. Its per-effect columns are the shared
+        arrays themselves; card_rows is rebuilt from effect_row.
+        """
+        return CompiledRegistry(
+            effect_ids=[self._effect_id(row) for row in range(self.num_effects)],
+            triggers=self.trigger,
+            scopes=self.scope,
+            power_deltas=self.power_delta,
+            listens=self.listens,
+            card_rows={
+                card_id: row
+                for card_id, row in zip(self.card_ids, self.effect_row)
+                if row != NO_EFFECT
+            },
+        )
+
+    def effect_engine(self, registry_path: Path) -> EffectEngine:
+        """
+        An EffectEngine over hydrator() and compiled_registry().
+        registry_path is only read if EffectDefs are asked for
+        (get_effect_for_card).
+        """
+        return EffectEngine.from_compiled(registry_path, self.hydrator(), self.compiled_registry())
+
+    # --------------------------------------------------------------------- #
+    # Lifetime
+    # --------------------------------------------------------------------- #
+
+    def close(self) -> None:
+        """
+        Release the views and the mapping. Cards built by build_card read
+        their projections from the block and must not be used afterwards.
+        """
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        if not self._mmap.closed:
+            self._mmap.close()
+
+    def unlink(self) -> None:
+        """
+        Remove the backing file (owner only). Processes that still map the
+        block keep their mapping until they close it.
+        """
+        if not self._owner:
+            raise PermissionError("Only the creating process may unlink the card tables.")
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> "SharedCardTables":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    # --------------------------------------------------------------------- #
+    # Internals
+    # --------------------------------------------------------------------- #
+
+    def _string(self, row: int, field: int) -> Optional[str]:
+        i = (row * len(_STRING_FIELDS) + field) * 2
+        start, length = self._str_spans[i], self._str_spans[i + 1]
+        if length < 0:
+            return None
+        return bytes(self._blob[start:start + length]).decode("utf-8")
+
+    def _effect_id(self, row: int) -> str:
+        start, length = self._effect_spans[row * 2], self._effect_spans[row * 2 + 1]
+        return bytes(self._blob[start:start + length]).decode("utf-8")
+
+
+class SharedProjectionTable:
+    """
+    ProjectionLookup over one card row of SharedCardTables (the same
+    interface as CardProjectionTable).
+
+    lookup() reads the shared per-root pawn/effect masks and returns the
+    RootProjection for them (root_projection_from_masks, shared by every
+    card with the same masks), so no per-card table is built.
+    """
+
+    __slots__ = ("_tables", "_row")
+
+    def __init__(self, tables: SharedCardTables, row: int) -> None:
+        self._tables = tables
+        self._row = row
+
+    def lookup(self, lane_index: int, col_index: int, side: str = "Y") -> RootProjection:
+        mirror = side != "Y"
+        i = (self._row * 2 + mirror) * NUM_TILES + lane_index * NUM_COLS + col_index
+        return root_projection_from_masks(
+            self._tables.pawn_masks[i], self._tables.effect_masks[i], mirror
+        )
+
+    @property
+    def you(self) -> Tuple[RootProjection, ...]:
+        return tuple(self.lookup(*divmod(i, NUM_COLS), "Y") for i in range(NUM_TILES))
+
+    @property
+    def enemy(self) -> Tuple[RootProjection, ...]:
+        return tuple(self.lookup(*divmod(i, NUM_COLS), "E") for i in range(NUM_TILES))
+
+
+class SharedCardHydrator:
+    """
+    Read-only CardHydrator stand-in backed by SharedCardTables.
+
+    Provides what the engine uses from a hydrator (get_card, index, cache,
+    db_path). Cards are built from the shared rows on first use and cached;
+    index entries carry the scalar DB fields (no "grid") and are decoded
+    on first access of index.
+    """
+
+    def __init__(self, tables: SharedCardTables) -> None:
+        self.tables = tables
+        self.db_path = tables.path
+        self.snapshot_status: Optional[str] = None
+        self.cache: Dict[str, Card] = {}
+        self._index: Optional[Dict[str, dict]] = None
+
+    @property
+    def index(self) -> Dict[str, dict]:
+        if self._index is None:
+            tables = self.tables
+            index: Dict[str, dict] = {}
+            for row, card_id in enumerate(tables.card_ids):
+                entry: Dict[str, object] = dict(tables.card_strings(row))
+                entry["cost"] = tables.cost[row]
+                entry["power"] = tables.power[row]
+                index[card_id] = entry
+            self._index = index
+        return self._index
+
+    def get_card(self, card_id: str) -> Card:
+        if card_id in self.cache:
+            return self.cache[card_id]
+        try:
+            row = self.tables.row_for(card_id)
+        except KeyError:
+            raise KeyError(f"Card '{card_id}' not found in database.") from None
+        card = self.tables.build_card(row)
+        self.cache[card_id] = card
+        return card
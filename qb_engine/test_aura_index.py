@@ -0,0 +1,63 @@
+# qb_engine/test_aura_index.py
+
+from qb_engine.bitboard import tile_bit
+from qb_engine.board_state import BoardState
+from qb_engine.card_hydrator import CardHydrator
+from qb_engine.projection import compute_projection_targets, apply_effects_for_you
+
+
+def check_index(board: BoardState) -> None:
+    """
+    The per-tile buckets must match a linear filter of effect_auras.
+    """
+    for lane_index in range(3):
+        for col_index in range(5):
+            expected = [
+                aura
+                for aura in board.effect_auras
+                if aura.lane_index == lane_index and aura.col_index == col_index
+            ]
+            assert board.auras_at(lane_index, col_index) == expected
+            has_bit = bool(board.masks.aura & tile_bit(lane_index, col_index))
+            assert has_bit == bool(expected)
+
+
+def main():
+    board = BoardState.create_initial_board()
+    hydrator = CardHydrator()
+    mindflayer = hydrator.get_card("027")
+
+    # Two copies of Mindflayer, on TOP-1 and BOT-1, plus a hand-added aura
+    for lane_index in (0, 2):
+        board.place_card(["TOP", "MID", "BOT"][lane_index], 1, mindflayer)
+        proj = compute_projection_targets(lane_index, 0, mindflayer)
+        apply_effects_for_you(board, proj, mindflayer)
+    board.add_effect_aura(1, 3, "003", "manual aura")
+
+    print("Board with two Mindflayers (★ marks aura tiles):")
+    board.print_board_with_effects()
+    check_index(board)
+
+    total = len(board.effect_auras)
+    from_top = [a for a in board.auras_from_card("027") if a.source_lane_index == 0]
+    print(f"\n{total} auras, {len(from_top)} from the TOP-1 copy")
+
+    # Removing one copy leaves the other copy's auras in place
+    removed = board.remove_auras_for_card("027", source_lane_index=0, source_col_index=0)
+    assert removed == from_top
+    assert len(board.effect_auras) == total - len(from_top)
+    assert all(a.source_lane_index == 2 for a in board.auras_from_card("027"))
+    check_index(board)
+
+    board.remove_auras_for_card("027")
+    assert board.auras_from_card("027") == []
+    assert len(board.effect_auras) == 1
+    check_index(board)
+
+    print("\nBoard after removing both copies' auras:")
+    board.print_board_with_effects()
+    print("test_aura_index: PASS")
+
+
+if __name__ == "__main__":
+    main()
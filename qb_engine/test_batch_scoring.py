@@ -0,0 +1,44 @@
+# qb_engine/test_batch_scoring.py
+
+import random
+
+from qb_engine.batch_scoring import SIDE_ENEMY, SIDE_NONE, SIDE_YOU, boards_to_batch, score_batch
+from qb_engine.scoring import score_board
+from qb_engine.testing import load_engine, random_board
+
+
+SIDE_CODES = {"Y": SIDE_YOU, "E": SIDE_ENEMY, None: SIDE_NONE}
+
+
+def main() -> None:
+    hydrator, engine = load_engine()
+
+    card_ids = ["001", "002", "008", "011", "027", "037", "040"]
+    cards = [hydrator.get_card(card_id) for card_id in card_ids]
+
+    rng = random.Random(21)
+    boards = [random_board(cards, rng, plies=rng.randint(0, 12)) for _ in range(300)]
+
+    scores = score_batch(boards_to_batch(boards, engine))
+
+    for n, board in enumerate(boards):
+        expected = score_board(board, engine)
+        assert list(scores.lane_scores[n, 0]) == expected.lane_scores["Y"], n
+        assert list(scores.lane_scores[n, 1]) == expected.lane_scores["E"], n
+        assert [int(w) for w in scores.lane_winners[n]] == [
+            SIDE_CODES[w] for w in expected.lane_winners
+        ], n
+        assert int(scores.match_scores[n, 0]) == expected.match_scores["Y"], n
+        assert int(scores.match_scores[n, 1]) == expected.match_scores["E"], n
+        assert int(scores.winners[n]) == SIDE_CODES[expected.winner], n
+        assert int(scores.margins[n]) == expected.margin, n
+
+    sample = boards[-1]
+    sample.print_board_with_effects()
+    print("Scores:", score_board(sample, engine))
+    print(f"Scored {len(boards)} boards in one batch.")
+    print("test_batch_scoring: PASS")
+
+
+if __name__ == "__main__":
+    main()
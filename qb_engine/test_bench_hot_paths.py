@@ -0,0 +1,33 @@
+# qb_engine/test_bench_hot_paths.py
+
+import json
+import tempfile
+from pathlib import Path
+
+from tools.bench_hot_paths import BENCHMARKS, POSITIONS, compare, main as bench_main, run_benchmarks
+
+
+def main() -> None:
+    # Smoke run: the canned positions still replay legally and every
+    # benchmark leaves its board untouched (asserted inside)
+    results = run_benchmarks(repeat=1, min_time=0.0)
+    assert set(results) == {f"{p}/{b}" for p in POSITIONS for b in BENCHMARKS}
+    assert all(entry["ns_per_op"] > 0 and entry["ops"] > 0 for entry in results.values())
+
+    slower = {name: dict(entry, ns_per_op=entry["ns_per_op"] * 2) for name, entry in results.items()}
+    assert compare(results, results, threshold=0.1) == []
+    assert compare(slower, results, threshold=0.1) == list(results)
+    assert compare(results, slower, threshold=0.1) == []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "baseline.json"
+        args = ["--repeat", "1", "--min-time", "0", "--only", "is_legal_placement"]
+        assert bench_main(args + ["--save", str(path)]) == 0
+        saved = json.loads(path.read_text(encoding="utf-8"))
+        assert set(saved["results"]) == {f"{p}/is_legal_placement" for p in POSITIONS}
+
+    print("test_bench_hot_paths: PASS")
+
+
+if __name__ == "__main__":
+    main()
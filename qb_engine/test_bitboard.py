@@ -0,0 +1,72 @@
+# qb_engine/test_bitboard.py
+
+from qb_engine.bitboard import iter_tiles, tile_bit
+from qb_engine.board_state import BoardState
+from qb_engine.card_hydrator import CardHydrator
+from qb_engine.projection import (
+    compute_projection_targets,
+    apply_pawns_for_you,
+    apply_effects_for_you,
+)
+
+
+def check_masks_match_tiles(board: BoardState) -> None:
+    """
+    Every bitmask must agree with the Tile objects it mirrors.
+    """
+    for lane_index, row in enumerate(board.tiles):
+        for col_index, tile in enumerate(row):
+            bit = tile_bit(lane_index, col_index)
+            assert bool(board.masks.owner_y & bit) == (tile.owner == "Y")
+            assert bool(board.masks.owner_e & bit) == (tile.owner == "E")
+            assert bool(board.masks.occupied & bit) == (tile.card_id is not None)
+            assert bool(board.masks.rank[tile.rank] & bit)
+            assert bool(board.masks.aura & bit) == bool(board.auras_at(lane_index, col_index))
+
+
+def legal_tiles_by_scan(board: BoardState, cost: int):
+    return [
+        (lane_index, col_index)
+        for lane_index, row in enumerate(board.tiles)
+        for col_index, tile in enumerate(row)
+        if tile.card_id is None and tile.owner == "Y" and tile.rank >= cost
+    ]
+
+
+def main():
+    board = BoardState.create_initial_board()
+    hydrator = CardHydrator()
+
+    print("Initial board masks:")
+    print(f"  owner_y  = {board.masks.owner_y:015b}")
+    print(f"  owner_e  = {board.masks.owner_e:015b}")
+    print(f"  occupied = {board.masks.occupied:015b}")
+    check_masks_match_tiles(board)
+
+    # Play Mindflayer (027, X/E pattern) at MID-1 to touch owner, rank and aura masks
+    card = hydrator.get_card("027")
+    board.place_card("MID", 1, card)
+    proj = compute_projection_targets(1, 0, card)
+    apply_pawns_for_you(board, proj, card)
+    apply_effects_for_you(board, proj, card)
+
+    print("\nBoard after placing 027 at MID-1:")
+    board.print_board_with_effects()
+    check_masks_match_tiles(board)
+
+    for cost in range(4):
+        from_masks = list(iter_tiles(board.legal_tiles_mask(cost)))
+        from_scan = legal_tiles_by_scan(board, cost)
+        print(f"  cost {cost}: legal tiles {from_masks}")
+        assert from_masks == from_scan, f"cost {cost}: {from_masks} != {from_scan}"
+
+    # Full rebuild must reproduce the incrementally maintained masks
+    incremental = board.masks
+    board.rebuild_masks()
+    assert incremental == board.masks
+
+    print("test_bitboard: PASS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# qb_engine/test_board_powers.py
+
+import json
+import random
+import tempfile
+from pathlib import Path
+
+from qb_engine.board_state import BoardState
+from qb_engine.effect_engine import EffectEngine
+from qb_engine.testing import DEFAULT_REGISTRY_PATH, load_engine, random_board
+
+
+def check_engine(engine: EffectEngine, board: BoardState) -> None:
+    result = engine.compute_board_powers(board)
+    lane_power = {"Y": [0, 0, 0], "E": [0, 0, 0]}
+    for lane in range(3):
+        for col in range(5):
+            expected = engine.compute_effective_power(board, lane, col)
+            assert result.powers[lane][col] == expected, (lane, col)
+            owner = board.tile_at(lane, col).owner
+            if board.tile_at(lane, col).card_id is not None and owner in lane_power:
+                lane_power[owner][lane] += expected
+    assert result.lane_power == lane_power
+
+
+def main() -> None:
+    hydrator, engine = load_engine()
+    cards = [hydrator.get_card(card_id) for card_id in ("001", "027", "027", "008", "037")]
+
+    # Exercise every aura scope by re-registering Mindflayer's effect
+    registry = json.loads(DEFAULT_REGISTRY_PATH.read_text(encoding="utf-8"))
+    engines = [engine]
+    with tempfile.TemporaryDirectory() as tmp:
+        for scope in ("allies_on_affected_tiles", "enemies_on_affected_tiles", "self"):
+            variant = dict(registry)
+            variant["027_while_in_play_all_affected_tiles_minus1"] = dict(
+                registry["027_while_in_play_all_affected_tiles_minus1"], scope=scope
+            )
+            path = Path(tmp) / f"effects_{scope}.json"
+            path.write_text(json.dumps(variant), encoding="utf-8")
+            engines.append(EffectEngine(path, hydrator))
+
+    rng = random.Random(3)
+    for trial in range(40):
+        board = random_board(cards, rng, plies=8)
+        for engine in engines:
+            check_engine(engine, board)
+
+    sample = random_board(cards, random.Random(5), plies=8)
+    sample.print_board_with_effects()
+    print("Lane power:", engines[0].compute_board_powers(sample).lane_power)
+    print("test_board_powers: PASS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# qb_engine/test_card_index.py
+
+from qb_engine.board_state import BoardState
+from qb_engine.card_hydrator import CardHydrator
+
+
+def side_by_scan(board: BoardState, card_id: str):
+    """
+    The original get_card_side: walk all 15 tiles.
+    """
+    found_neutral = False
+    for row in board.tiles:
+        for tile in row:
+            if tile.card_id == card_id:
+                if tile.owner in ("Y", "E"):
+                    return tile.owner
+                found_neutral = True
+    return "N" if found_neutral else None
+
+
+def main():
+    board = BoardState.create_initial_board()
+    hydrator = CardHydrator()
+    card = hydrator.get_card("001")
+
+    assert board.get_card_side("001") is None
+
+    # Duplicate copies on a YOU tile, a neutral tile and an ENEMY tile
+    board.place_card("BOT", 5, card)
+    board.place_card("MID", 3, card)
+    board.place_card("TOP", 1, card)
+    board.print_board()
+
+    assert board.locate_card("001") == [(0, 0), (1, 2), (2, 4)]
+    assert board.get_card_side("001") == side_by_scan(board, "001") == "Y"
+
+    board.remove_card(0, 0)
+    assert board.locate_card("001") == [(1, 2), (2, 4)]
+    assert board.get_card_side("001") == side_by_scan(board, "001") == "E"
+
+    board.remove_card(2, 4)
+    assert board.get_card_side("001") == side_by_scan(board, "001") == "N"
+
+    # Replacing an occupant re-indexes both cards
+    board.place_card_at(1, 2, "027")
+    assert board.locate_card("001") == []
+    assert board.locate_card("027") == [(1, 2)]
+    assert board.get_card_side("001") is None
+    assert not board.is_occupied(0, 0) and board.is_occupied(1, 2)
+
+    print("test_card_index: PASS")
+
+
+if __name__ == "__main__":
+    main()
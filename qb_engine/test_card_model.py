@@ -0,0 +1,68 @@
+# qb_engine/test_card_model.py
+
+import dataclasses
+import sys
+from pathlib import Path
+
+from qb_engine.card_hydrator import CardHydrator
+from qb_engine.models import Card, planes_to_grid
+from qb_engine.projection_table import build_projection_table, build_projection_table_from_planes
+
+
+def main() -> None:
+    root = Path(__file__).resolve().parents[1]
+    hydrator = CardHydrator(root / "data" / "qb_DB_Complete_v2.json", use_snapshot=False)
+
+    for card_id, entry in hydrator.index.items():
+        card = hydrator.get_card(card_id)
+
+        # Bit planes reproduce the JSON grid exactly
+        assert card.grid == entry["grid"], card_id
+        assert card.projection_table == build_projection_table(entry["grid"]), card_id
+
+        # Interned strings
+        assert card.name is sys.intern(entry["name"])
+        if entry.get("effect"):
+            assert card.effect is sys.intern(entry["effect"])
+
+    card = hydrator.get_card("001")
+    print(card, f"P={card.p_mask:025b} E={card.e_mask:025b} X={card.x_mask:025b}")
+
+    # Immutable, slotted and hashable
+    assert not hasattr(card, "__dict__")
+    try:
+        card.power = 99
+    except dataclasses.FrozenInstanceError:
+        pass
+    else:
+        raise AssertionError("Card should be frozen")
+    assert {card: 1}[hydrator.get_card("001")] == 1
+
+    # Fresh hydrator (different objects) compares equal
+    other = CardHydrator(root / "data" / "qb_DB_Complete_v2.json", use_snapshot=False).get_card("001")
+    assert other == card and hash(other) == hash(card)
+
+    # Legacy constructor: grid= still works and sets the planes; the grid
+    # view is built once and cached
+    legacy = Card(
+        card.id, card.name, card.category, card.cost, card.power, card.pattern,
+        grid=hydrator.index["001"]["grid"], effect=card.effect, effect_id=card.effect_id,
+    )
+    assert legacy == card and legacy.projection_table == card.projection_table
+    assert legacy.grid is legacy.grid
+
+    # replace() rebuilds the derived projection table and grid view
+    donor = hydrator.get_card("002")
+    assert donor.p_mask != card.p_mask
+    replaced = dataclasses.replace(card, p_mask=donor.p_mask)
+    assert replaced.projection_table is not card.projection_table
+    assert replaced.projection_table == build_projection_table_from_planes(
+        donor.p_mask, card.e_mask, card.x_mask
+    )
+    assert replaced.grid == planes_to_grid(donor.p_mask, card.e_mask, card.x_mask, card.w_mask)
+
+    print("test_card_model: PASS")
+
+
+if __name__ == "__main__":
+    main()
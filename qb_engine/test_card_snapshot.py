@@ -0,0 +1,69 @@
+# qb_engine/test_card_snapshot.py
+
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from qb_engine.card_hydrator import CardHydrator
+from qb_engine.card_snapshot import snapshot_path_for
+
+
+def check_same_cards(hydrator: CardHydrator, reference: CardHydrator) -> None:
+    assert hydrator.db == reference.db
+    assert set(hydrator.index) == set(reference.index)
+    for card_id in reference.index:
+        card = hydrator.get_card(card_id)
+        expected = reference.get_card(card_id)
+        assert card == expected, card_id
+        assert card.projection_table == expected.projection_table, card_id
+
+
+def main() -> None:
+    root = Path(__file__).resolve().parents[1]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "qb_DB_Complete_v2.json"
+        shutil.copyfile(root / "data" / "qb_DB_Complete_v2.json", db_path)
+        snapshot_path = snapshot_path_for(db_path)
+        reference = CardHydrator(db_path, use_snapshot=False)
+
+        first = CardHydrator(db_path)
+        assert first.snapshot_status == "rebuilt"
+        assert snapshot_path.exists()
+        check_same_cards(first, reference)
+
+        start = time.perf_counter()
+        second = CardHydrator(db_path)
+        load_ms = (time.perf_counter() - start) * 1000
+        assert second.snapshot_status == "loaded"
+        check_same_cards(second, reference)
+
+        # mtime changes but content doesn't: header refreshed, no rebuild
+        stat = db_path.stat()
+        os.utime(db_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert CardHydrator(db_path).snapshot_status == "revalidated"
+        assert CardHydrator(db_path).snapshot_status == "loaded"
+
+        # Content changes: rebuilt, and the new data is served
+        text = db_path.read_text(encoding="utf-8")
+        db_path.write_text(text.replace('"name": "Grenadier"', '"name": "Grenadier X"'), encoding="utf-8")
+        os.utime(db_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))   # same mtime as before
+        changed = CardHydrator(db_path)
+        assert changed.snapshot_status == "rebuilt"
+        assert changed.get_card("003").name == "Grenadier X"
+
+        # Corrupt payload: checksum mismatch forces a rebuild
+        data = bytearray(snapshot_path.read_bytes())
+        data[-10] ^= 0xFF
+        snapshot_path.write_bytes(bytes(data))
+        assert CardHydrator(db_path).snapshot_status == "rebuilt"
+        assert CardHydrator(db_path).snapshot_status == "loaded"
+
+    print(f"Snapshot load: {load_ms:.2f} ms")
+    print("test_card_snapshot: PASS")
+
+
+if __name__ == "__main__":
+    main()
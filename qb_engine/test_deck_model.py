@@ -0,0 +1,107 @@
+# qb_engine/test_deck_model.py
+
+import random
+import subprocess
+import sys
+from itertools import combinations
+
+from qb_engine.deck_model import OpponentDeckModel
+from qb_engine.self_play import DEFAULT_DECK
+from qb_engine.testing import PACKAGE_ROOT, load_hydrator
+
+
+def enumerate_hands(pool, hand_size, hydrator):
+    """
+    Brute force over every hand (cards as distinct positions in the pool).
+    """
+    hands = list(combinations(range(len(pool)), hand_size))
+    hold = {card_id: 0 for card_id in set(pool)}
+    cost_at_most = [0] * 4
+    for hand in hands:
+        ids = {pool[i] for i in hand}
+        for card_id in ids:
+            hold[card_id] += 1
+        cheapest = min(hydrator.get_card(card_id).cost for card_id in ids) if ids else 99
+        for n in range(4):
+            cost_at_most[n] += cheapest <= n
+    total = len(hands)
+    return {k: v / total for k, v in hold.items()}, [c / total for c in cost_at_most]
+
+
+def check_against_enumeration(model, pool, hydrator, hand_size) -> None:
+    expected_hold, expected_cost = enumerate_hands(pool, hand_size, hydrator)
+    probs = model.probabilities(hand_size)
+    for i, card_id in enumerate(model.card_ids):
+        expected = expected_hold.get(card_id, 0.0)
+        assert abs(probs.hold[i] - expected) < 1e-12, (card_id, probs.hold[i], expected)
+        assert abs(probs.draw[i] - pool.count(card_id) / len(pool)) < 1e-12
+    for n in range(4):
+        assert abs(probs.cost_at_most[n] - expected_cost[n]) < 1e-12, (n, probs.cost_at_most[n])
+
+
+def main() -> None:
+    hydrator = load_hydrator()
+    rng = random.Random(3)
+
+    deck = list(DEFAULT_DECK)
+    model = OpponentDeckModel(deck, hydrator)
+    pool = list(deck)
+
+    # Exact against enumeration as cards are observed
+    for step in range(6):
+        for hand_size in (0, 1, 3, min(5, len(pool))):
+            check_against_enumeration(model, pool, hydrator, hand_size)
+        played = rng.choice(pool)
+        pool.remove(played)
+        model.observe_play(played)
+        model.observe_draw()
+
+    # The mixed-radix key tracks the counts, and returning to a state hits
+    # the cache instead of adding an entry
+    key = model.state_key
+    model.probabilities()
+    size = model.cache_size()
+    for card_id in ("001", "008", "011"):
+        if model.remaining_count(card_id):
+            model.observe_play(card_id)
+            model.probabilities()
+            model.unobserve_play(card_id)
+    assert model.state_key == key
+    cached = model.probabilities()
+    assert model.probabilities() is cached
+    assert model.cache_size() == size + 3
+    fresh = OpponentDeckModel(deck, hydrator)
+    for card_id in DEFAULT_DECK:
+        if fresh.remaining_count(card_id) > model.remaining_count(card_id):
+            fresh.observe_play(card_id)
+    assert fresh.state_key == model.state_key
+
+    # Scalar queries and edge cases
+    model = OpponentDeckModel(["001", "001", "021"], hydrator, hand_size=1)
+    assert abs(model.p_holds("001") - 2 / 3) < 1e-12
+    assert abs(model.p_holds("001", next_turn=True) - 1.0) < 1e-12
+    assert model.p_holds("999") == 0.0
+    assert abs(model.p_cost_at_most(1) - 2 / 3) < 1e-12
+    assert model.p_cost_at_most(3) == 1.0
+    model.observe_play("001")
+    model.observe_play("001")
+    assert model.p_holds("001") == 0.0
+    try:
+        model.observe_play("001")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("playing an exhausted card should raise")
+
+    # NumPy stays lazy: importing the model and the search that uses it
+    # does not load it
+    code = "import sys, qb_engine.deck_model, qb_engine.expectimax; print('numpy' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], cwd=PACKAGE_ROOT, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False", out.stdout
+
+    print(f"test_deck_model: {size} cached states")
+    print("test_deck_model: PASS")
+
+
+if __name__ == "__main__":
+    main()
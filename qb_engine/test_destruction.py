@@ -0,0 +1,99 @@
+# qb_engine/test_destruction.py
+
+import random
+
+from qb_engine.board_state import BoardState
+from qb_engine.destruction import CardDestructionEngine
+from qb_engine.effect_engine import EffectEngine
+from qb_engine.legality import generate_legal_moves
+from qb_engine.moves import Move, apply_move, make_move, unmake_move
+from qb_engine.triggers import EventDispatcher
+from qb_engine.testing import load_engine
+
+
+def naive_resolve(board: BoardState, engine: EffectEngine, events: EventDispatcher) -> None:
+    """
+    Reference: rescan all 15 tiles after every wave.
+    """
+    while True:
+        dead = [
+            (lane, col)
+            for lane in range(3)
+            for col in range(5)
+            if board.tile_at(lane, col).card_id is not None
+            and engine.compute_effective_power(board, lane, col) <= 0
+        ]
+        if not dead:
+            return
+        removed = []
+        for lane, col in dead:
+            side = board.tile_at(lane, col).owner
+            card_id = board.remove_card(lane, col)
+            board.remove_auras_for_card(card_id, lane, col)
+            board.remove_pawn_deltas_for_card(card_id, lane, col)
+            removed.append((lane, col, card_id, side))
+        for lane, col, card_id, side in removed:
+            events.on_destroy(board, lane, col, engine.card_hydrator.get_card(card_id), side)
+
+
+def main() -> None:
+    hydrator, engine = load_engine()
+    destruction = CardDestructionEngine(engine)
+    card = hydrator.get_card
+
+    # Grenadier (003, -4 to enemies on its E tile) kills a 1-power enemy card;
+    # the victim's pawns vanish and the enemy's "destroyed" listener fires
+    board = BoardState.create_initial_board()
+    apply_move(board, Move(card("037"), 0, 4, "E"), destruction)    # Bloatfloat, power 1
+    apply_move(board, Move(card("058"), 2, 4, "E"), destruction)    # allied-destroyed listener
+    initial = BoardState.create_initial_board()
+    before = board.encode()
+    token = make_move(board, Move(card("003"), 0, 2, "Y"), destruction)
+    assert board.tile_at(0, 4).card_id is None
+    assert board.pawn_deltas_from_card("037") == []
+    assert board.auras_from_card("037") == []
+    assert board.tile_at(1, 4).rank == initial.tile_at(1, 4).rank
+    assert board.tile_at(2, 4).power_bonus == 1
+    assert board.zobrist_hash == board.compute_zobrist_hash()
+    unmake_move(board, token)
+    assert board.encode() == before
+
+    # Explicit destruction with an on_destroy cascade
+    board = BoardState.create_initial_board()
+    apply_move(board, Move(card("001"), 0, 2, "E"), destruction)
+    apply_move(board, Move(card("037"), 0, 0, "Y"), destruction)    # E tile on (0, 2)
+    destroyed = destruction.destroy_card(board, 0, 0)
+    print("Destroyed:", destroyed)
+    assert [(d.card_id, d.wave) for d in destroyed] == [("037", 0), ("001", 1)]
+    assert board.masks.occupied == 0
+
+    # Worklist resolution == repeated full-board scans, on random games
+    pool = [card(card_id) for card_id in ("001", "003", "006", "022", "027", "037", "043", "047", "032")]
+    rng = random.Random(16)
+    events = destruction.events
+    kills = 0
+    for _ in range(300):
+        board = BoardState.create_initial_board()
+        for _ply in range(rng.randint(1, 14)):
+            moves = generate_legal_moves(board, pool, board.side_to_move)
+            if not moves:
+                break
+            move = rng.choice(moves)
+
+            reference = BoardState.decode(board.encode())
+            apply_move(reference, move, events)
+            naive_resolve(reference, engine, events)
+
+            occupied = bin(board.masks.occupied).count("1")
+            apply_move(board, move, destruction)
+            kills += occupied + 1 - bin(board.masks.occupied).count("1")
+            assert board.encode() == reference.encode()
+            assert board.zobrist_hash == board.compute_zobrist_hash()
+
+    print(f"Cards destroyed across random games: {kills}")
+    assert kills > 0
+    print("test_destruction: PASS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# qb_engine/test_effect_registry.py
+
+import random
+from typing import List
+
+from qb_engine.board_state import BoardState
+from qb_engine.effect_engine import (
+    NO_EFFECT,
+    SCOPE_CODES,
+    TRIGGER_CODES,
+    EffectDef,
+    EffectEngine,
+)
+from qb_engine.models import Card
+from qb_engine.testing import load_engine, random_board
+
+
+def effects_applying_to_tile(
+    engine: EffectEngine,
+    board: BoardState,
+    lane: int,
+    col: int,
+    target_card: Card,
+) -> List[EffectDef]:
+    """
+    Reference walk over EffectDefs (the pre-compiled path): every
+    while_in_play effect whose aura is on (lane, col) and whose scope
+    matches the card there.
+    """
+    applicable: List[EffectDef] = []
+    tile = board.tile_at(lane, col)
+    for aura in board.auras_at(lane, col):
+        effect_def = engine.get_effect_for_card(engine.card_hydrator.get_card(aura.card_id))
+        if effect_def is None or effect_def.trigger != "while_in_play":
+            continue
+        source_side = board.get_card_side(aura.card_id)
+        if aura.source_lane_index is not None:
+            source_tile = board.tile_at(aura.source_lane_index, aura.source_col_index)
+            if source_tile.card_id == aura.card_id:
+                source_side = source_tile.owner
+        if EffectEngine.scope_code_applies(
+            SCOPE_CODES[effect_def.scope], tile.owner, source_side, target_card.id, aura.card_id
+        ):
+            applicable.append(effect_def)
+    return applicable
+
+
+def main() -> None:
+    hydrator, engine = load_engine()
+    compiled = engine.compiled
+
+    # Every DB card maps to the row of its EffectDef (or to NO_EFFECT)
+    for card_id in hydrator.index:
+        effect_def = engine.get_effect_for_card(hydrator.get_card(card_id))
+        row = compiled.row_for(card_id)
+        if effect_def is None:
+            assert row == NO_EFFECT, card_id
+            continue
+        assert compiled.effect_ids[row] == effect_def.id
+        assert compiled.triggers[row] == TRIGGER_CODES[effect_def.trigger]
+        assert compiled.scopes[row] == SCOPE_CODES[effect_def.scope]
+        assert compiled.power_deltas[row] == sum(op.amount for op in effect_def.operations)
+
+    print("Compiled rows:")
+    for row, effect_id in enumerate(compiled.effect_ids):
+        print(f"  {row}: trigger={compiled.triggers[row]} scope={compiled.scopes[row]} "
+              f"delta={compiled.power_deltas[row]:+d}  {effect_id}")
+
+    # Integer-table power == the EffectDef-walking path
+    cards = [hydrator.get_card(card_id) for card_id in ("001", "003", "027", "027", "008", "037")]
+    rng = random.Random(14)
+    for _ in range(200):
+        board = random_board(cards, rng, plies=rng.randint(0, 12))
+        for lane in range(3):
+            for col in range(5):
+                tile = board.tile_at(lane, col)
+                if tile.card_id is None:
+                    continue
+                target = hydrator.get_card(tile.card_id)
+                by_defs = target.power + tile.power_bonus + sum(
+                    op.amount
+                    for effect_def in effects_applying_to_tile(engine, board, lane, col, target)
+                    for op in effect_def.operations
+                )
+                assert engine.compute_effective_power(board, lane, col) == by_defs
+
+    print("test_effect_registry: PASS")
+
+
+if __name__ == "__main__":
+    main()
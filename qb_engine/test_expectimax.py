@@ -0,0 +1,96 @@
+# qb_engine/test_expectimax.py
+
+import random
+import time
+
+from qb_engine.board_state import BoardState
+from qb_engine.deck_model import OpponentDeckModel
+from qb_engine.expectimax import ExpectimaxEngine, expectimax
+from qb_engine.scoring import score_board
+from qb_engine.search import SearchState
+from qb_engine.testing import load_engine, play_random_moves
+from qb_engine.zobrist import hand_hash
+
+
+class HashCheckedEngine(ExpectimaxEngine):
+    """
+    Asserts at every node that the hand hashes match the hands, chance
+    cards included.
+    """
+
+    def _value(self, state, depth, alpha, beta, passes):
+        for side, hand in state.hands.items():
+            assert state.hashes[side] == hand_hash(side, (c.id for c in hand)), side
+        return super()._value(state, depth, alpha, beta, passes)
+
+
+def main() -> None:
+    hydrator, engine = load_engine()
+    rng = random.Random(21)
+
+    pool_ids = ("001", "002", "003", "008", "011", "013", "020", "027", "037", "043")
+    pool = [hydrator.get_card(card_id) for card_id in pool_ids]
+    enemy_deck = ["001", "001", "003", "008", "020", "027", "037", "043"]
+
+    leaves = {"n": 0}
+
+    def margin(board: BoardState) -> float:
+        leaves["n"] += 1
+        return score_board(board, engine).margin
+
+    pruned = ExpectimaxEngine(engine, evaluator=margin)
+    star1_only = ExpectimaxEngine(engine, evaluator=margin, star2=False)
+
+    totals = {"pruned": [0, 0.0], "star1": [0, 0.0], "reference": [0, 0.0]}
+
+    def timed(name, fn):
+        leaves["n"] = 0
+        start = time.perf_counter()
+        out = fn()
+        totals[name][0] += leaves["n"]
+        totals[name][1] += time.perf_counter() - start
+        return out
+
+    for trial in range(16):
+        board = play_random_moves(BoardState.create_initial_board(), pool, rng, rng.randint(0, 6))
+        # Mostly YOU to move; every fourth root is a chance node
+        board.set_side_to_move("E" if trial % 4 == 3 else "Y")
+
+        model = OpponentDeckModel(enemy_deck, hydrator)
+        for card_id in rng.sample(enemy_deck, rng.randint(0, 4)):
+            model.observe_play(card_id)
+        key = model.state_key
+        your_hand = rng.sample(pool, 3)
+        enemy_known = rng.sample(pool, rng.randint(0, 1))
+        depth = 3
+        before = board.encode()
+
+        result = timed("pruned", lambda: pruned.search(board, your_hand, model, depth, enemy_known))
+        assert board.encode() == before and model.state_key == key
+
+        state = SearchState.create(board, your_hand, enemy_known, pruned.events)
+        best_move, score = timed("reference", lambda: expectimax(state, model, depth, pruned.evaluate))
+        assert board.encode() == before and model.state_key == key
+
+        # Same value and move as unpruned expectimax (equal scores go to
+        # the first move in generation order in both)
+        assert abs(result.score - score) < 1e-9, (trial, result.score, score)
+        assert (result.best_move is None) == (best_move is None)
+        if best_move is not None:
+            assert result.best_move.key == best_move.key, (trial, result.best_move, best_move)
+
+        checked = HashCheckedEngine(engine, evaluator=margin).search(board, your_hand, model, depth, enemy_known)
+        assert checked.score == result.score
+
+        other = timed("star1", lambda: star1_only.search(board, your_hand, model, depth, enemy_known))
+        assert abs(other.score - score) < 1e-9
+        assert other.best_move == result.best_move
+
+    assert totals["pruned"][0] < totals["reference"][0]
+    for name, (count, seconds) in totals.items():
+        print(f"  {name:<9} {count:6d} leaf evaluations, {seconds * 1000:6.0f} ms")
+    print("test_expectimax: PASS")
+
+
+if __name__ == "__main__":
+    main()
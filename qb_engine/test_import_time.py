@@ -0,0 +1,93 @@
+# qb_engine/test_import_time.py
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Cold-start budgets (ms), measured inside a fresh interpreter so the
+# interpreter's own start-up is excluded. Best of RUNS, to ride out noise.
+# Wall-clock numbers depend on the machine, so they are always printed but
+# only enforced with QB_ENFORCE_IMPORT_BUDGET=1 (e.g. on a quiet box).
+IMPORT_BUDGET_MS = 5.0
+FIRST_ENGINE_BUDGET_MS = 100.0
+RUNS = 3
+
+# Modules that must stay unloaded: none after `import qb_engine`, and no
+# search or NumPy after the first get_effect_engine()
+HEAVY_MODULES = ("numpy", "qb_engine.effect_engine", "qb_engine.search", "qb_engine.batch_scoring")
+ENGINE_HEAVY_MODULES = ("numpy", "qb_engine.search", "qb_engine.batch_scoring")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import qb_engine
+import_ms = (time.perf_counter() - start) * 1000
+loaded = sorted(sys.modules)
+start = time.perf_counter()
+engine = qb_engine.get_effect_engine()
+engine.card_hydrator.get_card("001")
+engine_ms = (time.perf_counter() - start) * 1000
+engine_loaded = sorted(sys.modules)
+print(json.dumps({
+    "import_ms": import_ms, "engine_ms": engine_ms, "loaded": loaded, "engine_loaded": engine_loaded,
+}))
+"""
+
+
+def probe(root: Path) -> dict:
+    # Run from elsewhere: the runtime defaults must not depend on the cwd
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        cwd="/",
+        env={"PYTHONPATH": str(root), "PYTHONDONTWRITEBYTECODE": "1"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(out.stdout)
+
+
+def main() -> None:
+    root = Path(__file__).resolve().parents[1]
+    results = [probe(root) for _ in range(RUNS)]
+
+    # `import qb_engine` must not pull in any engine module (or NumPy), and
+    # the first engine loads only what building it needs
+    result = results[0]
+    engine_modules = [m for m in result["loaded"] if m.startswith("qb_engine.")]
+    assert engine_modules == [], engine_modules
+    for name in HEAVY_MODULES:
+        assert name not in result["loaded"], name
+    for name in ENGINE_HEAVY_MODULES:
+        assert name not in result["engine_loaded"], name
+    assert "qb_engine.effect_engine" in result["engine_loaded"]
+
+    import_ms = min(r["import_ms"] for r in results)
+    engine_ms = min(r["engine_ms"] for r in results)
+    print(f"import qb_engine: {import_ms:.2f} ms (budget {IMPORT_BUDGET_MS:g})")
+    print(f"first get_effect_engine(): {engine_ms:.1f} ms (budget {FIRST_ENGINE_BUDGET_MS:g})")
+    if os.environ.get("QB_ENFORCE_IMPORT_BUDGET") == "1":
+        assert import_ms <= IMPORT_BUDGET_MS, f"import regressed: {import_ms:.2f} ms"
+        assert engine_ms <= FIRST_ENGINE_BUDGET_MS, f"cold start regressed: {engine_ms:.1f} ms"
+
+    # Lazy attributes resolve to the real objects, and the singleton is shared
+    import qb_engine
+    from qb_engine.effect_engine import EffectEngine
+
+    assert qb_engine.EffectEngine is EffectEngine
+    assert "MoveRanker" in dir(qb_engine)
+    assert qb_engine.get_effect_engine() is qb_engine.get_effect_engine()
+    try:
+        qb_engine.no_such_name
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("unknown attribute should raise AttributeError")
+
+    print("test_import_time: PASS")
+
+
+if __name__ == "__main__":
+    main()
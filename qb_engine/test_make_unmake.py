@@ -0,0 +1,78 @@
+# qb_engine/test_make_unmake.py
+
+import copy
+import random
+
+from qb_engine.board_state import BoardState
+from qb_engine.moves import apply_move, make_move, unmake_move
+from qb_engine.testing import load_hydrator, random_move
+
+
+def fingerprint(board: BoardState):
+    """
+    Everything make/unmake must restore: public state plus every index.
+    """
+    return (
+        copy.deepcopy(board.tiles),
+        list(board.pawn_deltas),
+        list(board.effect_auras),
+        copy.deepcopy(board.masks),
+        list(board._influence),
+        {k: list(v) for k, v in board._deltas_by_card.items()},
+        [list(bucket) for bucket in board._auras_by_tile],
+        {k: list(v) for k, v in board._auras_by_card.items()},
+        {k: list(v) for k, v in board._card_locations.items()},
+    )
+
+
+def main():
+    hydrator = load_hydrator()
+    cards = [hydrator.get_card(card_id) for card_id in ("001", "006", "027", "037", "020")]
+    rng = random.Random(7)
+
+    for trial in range(50):
+        board = BoardState.create_initial_board()
+        start = fingerprint(board)
+
+        # Nested line of alternating moves, with a fingerprint per ply
+        tokens = []
+        history = []
+        side = "Y"
+        for _ in range(6):
+            move = random_move(board, cards, side, rng)
+            if move is None:
+                break
+            history.append(fingerprint(board))
+            tokens.append(make_move(board, move))
+            side = "E" if side == "Y" else "Y"
+
+        if trial == 0:
+            print("Line:", " ".join(str(t.move) for t in tokens))
+            board.print_board_with_effects()
+
+        while tokens:
+            unmake_move(board, tokens.pop())
+            assert fingerprint(board) == history.pop()
+
+        assert fingerprint(board) == start
+        assert board._trail is None
+
+    # Permanent moves leave no undo trail behind, and a make/unmake on top
+    # of them closes the trail again
+    board = BoardState.create_initial_board()
+    for _ in range(6):
+        move = random_move(board, cards, board.side_to_move, rng)
+        if move is None:
+            break
+        apply_move(board, move)
+        assert board._trail is None
+    move = random_move(board, cards, board.side_to_move, rng)
+    if move is not None:
+        unmake_move(board, make_move(board, move))
+    assert board._trail is None
+
+    print("test_make_unmake: PASS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# qb_engine/test_mcts.py
+
+import random
+
+from qb_engine.board_state import BoardState
+from qb_engine.legality import generate_legal_moves
+from qb_engine.mcts import MCTSEngine, pawn_gain_rollout
+from qb_engine.moves import apply_move
+from qb_engine.search import PredictorEngine
+from qb_engine.testing import load_engine, play_random_moves
+
+
+def sign(x: float) -> int:
+    return (x > 0) - (x < 0)
+
+
+def main() -> None:
+    hydrator, engine = load_engine()
+
+    pool = [hydrator.get_card(card_id) for card_id in ("001", "002", "003", "008", "011", "013", "027", "037")]
+    your_hand = pool[:5]
+    enemy_hand = pool[3:]
+    board = BoardState.create_initial_board()
+    before = board.encode()
+
+    # Fresh search: one node per iteration, board restored, seeded runs agree
+    mcts = MCTSEngine(engine, seed=5)
+    result = mcts.search(board, your_hand, enemy_hand, iterations=300)
+    assert board.encode() == before
+    assert board.zobrist_hash == board.compute_zobrist_hash()
+    assert result.iterations == 300 and result.nodes == 301 and not result.reused
+    assert sum(s.visits for s in result.moves) == 300
+    assert [s.visits for s in result.moves] == sorted((s.visits for s in result.moves), reverse=True)
+    legal = {m.key for m in generate_legal_moves(board, your_hand, "Y")}
+    assert {s.move.key for s in result.moves} == legal
+
+    again = MCTSEngine(engine, seed=5).search(board, your_hand, enemy_hand, iterations=300)
+    assert [(s.move.key, s.visits) for s in again.moves] == [(s.move.key, s.visits) for s in result.moves]
+
+    # Budgets
+    capped = MCTSEngine(engine, seed=1).search(board, your_hand, enemy_hand, max_nodes=50)
+    assert capped.nodes == 50
+    timed = MCTSEngine(engine, seed=1, rollout_policy=pawn_gain_rollout).search(
+        board, your_hand, enemy_hand, time_limit=0.1
+    )
+    assert timed.iterations > 0 and timed.elapsed < 0.5
+
+    # Node reuse: after YOU's move and ENEMY's reply (and a draw), the
+    # search continues in the kept subtree
+    mcts = MCTSEngine(engine, seed=2)
+    first = mcts.search(board, your_hand, enemy_hand, iterations=400)
+    mine = first.best_move
+    apply_move(board, mine)
+    your_hand = list(your_hand)
+    your_hand.remove(mine.card)
+    reply = generate_legal_moves(board, enemy_hand, "E")[0]
+    apply_move(board, reply)
+    enemy_hand = [c for c in enemy_hand if c is not reply.card]
+    your_hand.append(hydrator.get_card("037"))
+
+    second = mcts.search(board, your_hand, enemy_hand, iterations=200)
+    assert second.reused
+    assert second.nodes > 201
+    assert {s.move.key for s in second.moves} <= {m.key for m in generate_legal_moves(board, your_hand, "Y")}
+    assert any(s.move.card.id == "037" for s in second.moves)
+
+    # End games: the most visited move never has a worse exact outcome
+    # than the best one (rollouts are complete, so the signs agree)
+    rng = random.Random(11)
+    predictor = PredictorEngine(engine)
+    checked = 0
+    while checked < 5:
+        board = play_random_moves(BoardState.create_initial_board(), pool, rng, 10)
+        side = board.side_to_move
+        hands = {"Y": rng.sample(pool, 2), "E": rng.sample(pool, 1)}
+        moves = generate_legal_moves(board, hands[side], side)
+        if len(moves) < 2:
+            continue
+
+        exact = {
+            m.key: predictor.score_move(board, hands["Y"], hands["E"], m, depth=8) for m in moves
+        }
+        best = max(exact.values()) if side == "Y" else min(exact.values())
+        result = MCTSEngine(engine, seed=checked).search(board, hands["Y"], hands["E"], iterations=1500)
+        assert sign(exact[result.best_move.key]) == sign(best), (exact, result.moves[:3])
+        checked += 1
+
+    for stats in first.moves[:3]:
+        print(" ", stats)
+    print(f"  reuse: {second.nodes} nodes after 200 iterations")
+    print("test_mcts: PASS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# qb_engine/test_move_generation.py
+
+import random
+
+from qb_engine.board_state import BoardState
+from qb_engine.card_hydrator import CardHydrator
+from qb_engine.legality import generate_legal_moves, is_legal_placement
+from qb_engine.moves import apply_move
+
+
+def moves_by_scan(board: BoardState, hand, side: str):
+    """
+    The naive way: hand x 15 tiles, one is_legal_placement call per pair.
+    """
+    keys = []
+    seen = set()
+    for card in hand:
+        if card.id in seen:
+            continue
+        seen.add(card.id)
+        for lane in range(3):
+            for col in range(5):
+                if is_legal_placement(board, lane, col, card, side):
+                    keys.append((card.id, lane, col, side))
+    return keys
+
+
+def main():
+    hydrator = CardHydrator()
+    pool = [hydrator.get_card(card_id) for card_id in ("001", "002", "003", "008", "011", "027", "037")]
+    rng = random.Random(5)
+
+    for _ in range(100):
+        board = BoardState.create_initial_board()
+        for _ply in range(rng.randint(0, 10)):
+            side = board.side_to_move
+            hand = [rng.choice(pool) for _ in range(5)]
+            moves = generate_legal_moves(board, hand, side)
+            assert [m.key for m in moves] == moves_by_scan(board, hand, side)
+            if not moves:
+                break
+            apply_move(board, rng.choice(moves))
+
+    # Duplicates in hand are grouped into a single set of placements
+    board = BoardState.create_initial_board()
+    c001 = hydrator.get_card("001")
+    hand = [c001, c001, hydrator.get_card("027")]
+    moves = generate_legal_moves(board, hand)
+    for move in moves:
+        print(" ", move)
+    assert len(moves) == len({m.key for m in moves})
+
+    print("test_move_generation: PASS")
+
+
+if __name__ == "__main__":
+    main()
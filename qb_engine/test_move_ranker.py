@@ -0,0 +1,74 @@
+# qb_engine/test_move_ranker.py
+
+import gc
+import random
+import time
+
+from qb_engine.board_state import BoardState
+from qb_engine.legality import generate_legal_moves
+from qb_engine.move_ranker import MoveRanker
+from qb_engine.moves import apply_move
+from qb_engine.testing import load_engine, play_random_moves
+
+
+def main() -> None:
+    hydrator, engine = load_engine()
+
+    pool = [hydrator.get_card(card_id) for card_id in ("001", "002", "003", "008", "011", "027", "037")]
+    rng = random.Random(13)
+
+    # encode/decode round trip
+    board = play_random_moves(BoardState.create_initial_board(), pool, rng, 6)
+    copy = BoardState.decode(board.encode())
+    assert copy == board
+    assert copy.zobrist_hash == board.zobrist_hash
+    assert copy.masks == board.masks
+    assert copy.encode() == board.encode()
+
+    # A position early enough to have plenty of root moves
+    board = BoardState.create_initial_board()
+    apply_move(board, generate_legal_moves(board, pool, "Y")[0])
+    apply_move(board, generate_legal_moves(board, pool, "E")[0])
+    your_hand = rng.sample(pool, 5)
+    enemy_hand = rng.sample(pool, 5)
+
+    serial = MoveRanker(engine, depth=3, workers=1)
+    start = time.perf_counter()
+    expected = serial.rank(board, your_hand, enemy_hand)
+    serial_time = time.perf_counter() - start
+    assert board.zobrist_hash == board.compute_zobrist_hash()
+
+    with MoveRanker(engine, depth=3, workers=4) as parallel:
+        for _ in range(2):
+            start = time.perf_counter()
+            ranked = parallel.rank(board, your_hand, enemy_hand)
+            parallel_time = time.perf_counter() - start
+            assert [(r.move.key, r.score) for r in ranked] == [
+                (r.move.key, r.score) for r in expected
+            ]
+
+    # The table is kept between positions: ranking another position with
+    # the same ranker matches a fresh one
+    other = BoardState.decode(board.encode())
+    apply_move(other, expected[0].move)
+    reused = serial.rank(other, your_hand, enemy_hand)
+    fresh = MoveRanker(engine, depth=3, workers=1).rank(other, your_hand, enemy_hand)
+    assert [(r.move.key, r.score) for r in reused] == [(r.move.key, r.score) for r in fresh]
+
+    # A ranker dropped without close() still removes its shared tables file
+    dropped = MoveRanker(engine, depth=1, workers=2)
+    dropped.rank(board, your_hand, enemy_hand)
+    tables_path = dropped._tables.path
+    assert tables_path.exists()
+    del dropped
+    gc.collect()
+    assert not tables_path.exists()
+
+    for entry in expected[:5]:
+        print(" ", entry)
+    print(f"serial {serial_time * 1000:.1f} ms, 4 workers {parallel_time * 1000:.1f} ms")
+    print("test_move_ranker: PASS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# qb_engine/test_pawn_delta_index.py
+
+import copy
+
+from qb_engine.board_state import BoardState
+from qb_engine.card_hydrator import CardHydrator
+from qb_engine.projection import compute_projection_targets, apply_pawns_for_you
+
+
+def snapshot(board: BoardState):
+    return [[(tile.owner, tile.rank) for tile in row] for row in board.tiles]
+
+
+def check_against_full_recompute(board: BoardState) -> None:
+    """
+    Incremental owner/rank must equal a from-scratch replay of all deltas.
+    """
+    replayed = copy.deepcopy(board)
+    replayed.recompute_influence_from_deltas()
+    assert snapshot(board) == snapshot(replayed)
+
+    masks = board.masks
+    replayed.rebuild_masks()
+    assert masks == replayed.masks
+
+
+def main():
+    board = BoardState.create_initial_board()
+    hydrator = CardHydrator()
+
+    plays = [("001", "TOP", 1), ("001", "BOT", 1), ("008", "MID", 2)]
+    for card_id, lane_name, col_number in plays:
+        card = hydrator.get_card(card_id)
+        lane_index = ["TOP", "MID", "BOT"].index(lane_name)
+        col_index = col_number - 1
+        if board.tile_at(lane_index, col_index).owner != "Y":
+            continue
+        board.place_card(lane_name, col_number, card)
+        proj = compute_projection_targets(lane_index, col_index, card)
+        apply_pawns_for_you(board, proj, card)
+        check_against_full_recompute(board)
+
+    print("Board after plays:")
+    board.print_board()
+
+    # Remove only the TOP-1 copy of 001; the BOT-1 copy's pawns stay
+    before = len(board.pawn_deltas)
+    removed = board.remove_pawn_deltas_for_card("001", source_lane_index=0, source_col_index=0)
+    assert removed and all(d.source_lane_index == 0 for d in removed)
+    assert len(board.pawn_deltas) == before - len(removed)
+    assert all(d.source_lane_index == 2 for d in board.pawn_deltas_from_card("001"))
+    check_against_full_recompute(board)
+
+    print(f"\nBoard after removing {len(removed)} pawn deltas from 001 at TOP-1:")
+    board.print_board()
+
+    # Enemy-side deltas pull influence the other way
+    board.add_pawn_delta(1, 3, "E01", -2)
+    assert board.influence_at(1, 3) == board.tile_at(1, 3).base_influence + sum(
+        d.delta for d in board.pawn_deltas if (d.lane_index, d.col_index) == (1, 3)
+    )
+    check_against_full_recompute(board)
+
+    print("test_pawn_delta_index: PASS")
+
+
+if __name__ == "__main__":
+    main()
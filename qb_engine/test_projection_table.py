@@ -0,0 +1,61 @@
+# qb_engine/test_projection_table.py
+
+from qb_engine.card_hydrator import CardHydrator
+from qb_engine.models import Card
+from qb_engine.projection import compute_projection_targets
+
+
+def reference_targets(root_lane_index: int, root_col_index: int, card: Card, side: str):
+    """
+    Straight 25-cell scan of card.grid (the original projection loop).
+    """
+    targets = []
+    for p_row_index, row in enumerate(card.grid):
+        for p_col_index, cell in enumerate(row):
+            if cell not in ("P", "E", "X"):
+                continue
+            col_offset = p_col_index - 2
+            if side == "E":
+                col_offset = -col_offset
+            lane_prime = root_lane_index - (p_row_index - 2)
+            col_prime = root_col_index + col_offset
+            if 0 <= lane_prime < 3 and 0 <= col_prime < 5:
+                targets.append((lane_prime, col_prime, cell))
+    return targets
+
+
+def main():
+    hydrator = CardHydrator()
+
+    checked = 0
+    for card_id in hydrator.index:
+        card = hydrator.get_card(card_id)
+        assert card.projection_table is not None, f"{card_id} has no projection table"
+
+        for side in ("Y", "E"):
+            for lane in range(3):
+                for col in range(5):
+                    proj = compute_projection_targets(lane, col, card, side)
+                    expected = reference_targets(lane, col, card, side)
+                    assert list(proj.targets) == expected, (card_id, side, lane, col)
+
+                    pawn_mask = sum(1 << (l * 5 + c) for l, c, k in expected if k in ("P", "X"))
+                    effect_mask = sum(1 << (l * 5 + c) for l, c, k in expected if k in ("E", "X"))
+                    assert proj.pawn_mask == pawn_mask, (card_id, side, lane, col)
+                    assert proj.effect_mask == effect_mask, (card_id, side, lane, col)
+                    checked += 1
+
+    # ENEMY placements are the left-right mirror of YOU placements
+    card = hydrator.get_card("001")
+    you = compute_projection_targets(1, 2, card, "Y")
+    enemy = compute_projection_targets(1, 2, card, "E")
+    print("001 at MID-3, YOU:  ", list(you.targets))
+    print("001 at MID-3, ENEMY:", list(enemy.targets))
+    assert sorted((l, 4 - c, k) for l, c, k in you.targets) == sorted(enemy.targets)
+
+    print(f"Checked {checked} (card, side, root) projections.")
+    print("test_projection_table: PASS")
+
+
+if __name__ == "__main__":
+    main()
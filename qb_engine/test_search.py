@@ -0,0 +1,67 @@
+# qb_engine/test_search.py
+
+import random
+
+from qb_engine.search import PredictorEngine, SearchState, minimax
+from qb_engine.testing import load_engine, random_position
+
+
+def main() -> None:
+    hydrator, engine = load_engine()
+
+    pool = [hydrator.get_card(card_id) for card_id in ("001", "002", "003", "008", "011", "027", "037")]
+    rng = random.Random(12)
+
+    pruned_nodes = 0
+    full_nodes = 0
+    for trial in range(40):
+        board, your_hand, enemy_hand = random_position(pool, rng)
+        depth = 1 + trial % 3
+        before = board.zobrist_hash
+
+        predictor = PredictorEngine(engine)
+        result = predictor.search(board, your_hand, enemy_hand, depth)
+        assert board.zobrist_hash == before == board.compute_zobrist_hash()
+
+        counter = {"nodes": 0}
+
+        def counting_eval(b):
+            counter["nodes"] += 1
+            return predictor.match_margin(b)
+
+        ref_move, ref_score = minimax(
+            SearchState.create(board, your_hand, enemy_hand, predictor.events), depth, counting_eval
+        )
+        assert result.score == ref_score, (trial, result.score, ref_score)
+        assert (result.best_move and result.best_move.key) == (ref_move and ref_move.key), trial
+
+        pruned_nodes += result.nodes
+        full_nodes += counter["nodes"]
+
+        # A second search reuses the table and must agree
+        again = predictor.search(board, your_hand, enemy_hand, depth)
+        assert again.score == result.score
+        assert (again.best_move and again.best_move.key) == (result.best_move and result.best_move.key)
+
+    # One engine searching the same positions at alternating depths: table
+    # entries from a deeper search must not cut off a shallower one
+    predictor = PredictorEngine(engine)
+    for trial in range(30):
+        board, your_hand, enemy_hand = random_position(pool, rng)
+        for depth in (3, 2, 1, 3):
+            result = predictor.search(board, your_hand, enemy_hand, depth)
+            ref_move, ref_score = minimax(
+                SearchState.create(board, your_hand, enemy_hand, predictor.events),
+                depth,
+                predictor.match_margin,
+            )
+            assert result.score == ref_score, (trial, depth, result.score, ref_score)
+            assert (result.best_move and result.best_move.key) == (ref_move and ref_move.key), (trial, depth)
+
+    print(f"alpha-beta nodes: {pruned_nodes}, minimax leaves: {full_nodes}")
+    assert pruned_nodes < full_nodes
+    print("test_search: PASS")
+
+
+if __name__ == "__main__":
+    main()
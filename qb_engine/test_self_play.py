@@ -0,0 +1,116 @@
+# qb_engine/test_self_play.py
+
+
+from qb_engine.board_state import BoardState
+from qb_engine.destruction import CardDestructionEngine
+from qb_engine.effect_engine import EffectEngine
+from qb_engine.legality import is_legal_placement
+from qb_engine.moves import Move, apply_move
+from qb_engine.scoring import score_board
+from qb_engine.self_play import (
+    DEFAULT_DECK,
+    GreedyPolicy,
+    Policy,
+    RandomPolicy,
+    SearchPolicy,
+    SelfPlayRunner,
+)
+from qb_engine.testing import load_engine
+
+
+def replay(engine: EffectEngine, record) -> BoardState:
+    """
+    Rebuild a game from its plies, checking every placement is legal.
+    """
+    hydrator = engine.card_hydrator
+    events = CardDestructionEngine(engine)
+    board = BoardState.create_initial_board()
+    board.set_side_to_move(record.first)
+    for ply in record.plies:
+        if ply is None:
+            board.set_side_to_move("E" if board.side_to_move == "Y" else "Y")
+            continue
+        card_id, lane_index, col_index, side = ply
+        card = hydrator.get_card(card_id)
+        assert side == board.side_to_move
+        assert is_legal_placement(board, lane_index, col_index, card, side)
+        apply_move(board, Move(card, lane_index, col_index, side), events)
+    return board
+
+
+def main() -> None:
+    hydrator, engine = load_engine()
+    runner = SelfPlayRunner(engine)
+    decks = {"Y": DEFAULT_DECK, "E": DEFAULT_DECK}
+
+    # A policy without choose() is rejected up front, not mid-game
+    class Incomplete(Policy):
+        name = "incomplete"
+
+    try:
+        Incomplete()
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("a Policy without choose() should not instantiate")
+
+    # Decks must be full; policies may only play legal moves from hand
+    try:
+        runner.play_game({"Y": DEFAULT_DECK[:-1], "E": DEFAULT_DECK}, {}, seed=0)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("a short deck should be rejected")
+
+    class Cheater(Policy):
+        name = "cheater"
+
+        def __init__(self, card_id, lane_index: int, col_index: int) -> None:
+            self.card = hydrator.get_card(card_id) if card_id else None
+            self.tile = (lane_index, col_index)
+
+        def choose(self, board, hand, opponent_hand, side, rng):
+            return Move(self.card or hand[0], *self.tile, side)
+
+    # A card outside the hand, then a card from hand on an unowned tile
+    outside_deck = next(card_id for card_id in hydrator.index if card_id not in DEFAULT_DECK)
+    for cheater, reason in ((Cheater(outside_deck, 0, 0), "not in"), (Cheater(None, 1, 2), "illegal")):
+        try:
+            runner.play_game(decks, {"Y": cheater, "E": RandomPolicy()}, seed=0)
+        except ValueError as exc:
+            assert "cheater" in str(exc) and reason in str(exc), exc
+        else:
+            raise AssertionError(f"{cheater.tile} should be rejected")
+
+    random_policies = {"Y": RandomPolicy(), "E": RandomPolicy()}
+    report = runner.run(decks, random_policies, games=40, seed=7)
+    again = runner.run(decks, random_policies, games=40, seed=7)
+    assert [g.plies for g in report.games] == [g.plies for g in again.games]
+    assert report.wins["Y"] + report.wins["E"] + report.draws == 40
+    assert {g.first for g in report.games} == {"Y", "E"}
+
+    for record in report.games:
+        # Ends on two consecutive passes; each side plays at most its deck
+        assert record.plies[-2:] == [None, None]
+        for side in ("Y", "E"):
+            assert sum(1 for p in record.plies if p is not None and p[3] == side) <= len(DEFAULT_DECK)
+
+        board = replay(engine, record)
+        assert board.zobrist_hash == record.board.zobrist_hash
+        assert board.zobrist_hash == board.compute_zobrist_hash()
+        assert score_board(board, engine) == record.score
+
+    greedy = runner.run(decks, {"Y": GreedyPolicy(engine), "E": RandomPolicy()}, games=40, seed=3)
+    assert greedy.wins["Y"] > greedy.wins["E"], str(greedy)
+
+    searched = runner.run(decks, {"Y": SearchPolicy(engine, depth=2), "E": RandomPolicy()}, games=6, seed=3)
+    for record in searched.games:
+        assert replay(engine, record).zobrist_hash == record.board.zobrist_hash
+
+    print(" ", report)
+    print(" ", greedy)
+    print("test_self_play: PASS")
+
+
+if __name__ == "__main__":
+    main()
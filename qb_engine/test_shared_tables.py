@@ -0,0 +1,71 @@
+# qb_engine/test_shared_tables.py
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from qb_engine.bitboard import NUM_TILES
+from qb_engine.effect_engine import NO_EFFECT
+from qb_engine.shared_tables import SharedCardTables
+from qb_engine.testing import DEFAULT_REGISTRY_PATH, load_engine
+
+
+def _worker_total_power(path: str) -> int:
+    with SharedCardTables.attach(Path(path)) as tables:
+        return sum(tables.power)
+
+
+def main() -> None:
+    hydrator, engine = load_engine()
+
+    with SharedCardTables.create(engine) as owner:
+        assert owner.card_ids == tuple(sorted(hydrator.index))
+
+        tables = SharedCardTables.attach(owner.path)
+        assert tables.power.readonly
+        shared = tables.hydrator()
+
+        for row, card_id in enumerate(tables.card_ids):
+            card = hydrator.get_card(card_id)
+            assert tables.row_for(card_id) == row
+            assert tables.power[row] == card.power
+            assert tables.cost[row] == card.cost
+            assert tables.effect_row[row] == engine.compiled.card_rows.get(card_id, NO_EFFECT)
+            for side, roots in (("Y", card.projection_table.you), ("E", card.projection_table.enemy)):
+                for index in range(NUM_TILES):
+                    assert tables.pawn_mask(row, side, index) == roots[index].pawn_mask
+                    assert tables.effect_mask(row, side, index) == roots[index].effect_mask
+
+            # Shared cards read their projections from the shared masks
+            rebuilt = shared.get_card(card_id)
+            assert rebuilt == card, card_id
+            assert rebuilt.grid == card.grid
+            assert rebuilt.projection_table.you == card.projection_table.you
+            assert rebuilt.projection_table.enemy == card.projection_table.enemy
+
+        # The stored registry matches the compiled one, and an engine on it
+        # never parses the registry JSON unless EffectDefs are asked for
+        compiled = tables.compiled_registry()
+        expected = engine.compiled
+        assert compiled.effect_ids == expected.effect_ids
+        assert compiled.card_rows == expected.card_rows
+        for name in ("triggers", "scopes", "power_deltas", "listens"):
+            assert list(getattr(compiled, name)) == getattr(expected, name), name
+        worker_engine = tables.effect_engine(DEFAULT_REGISTRY_PATH)
+        assert worker_engine._effects is None
+        card = shared.get_card("027")
+        assert worker_engine.get_effect_for_card(card) == engine.get_effect_for_card(card)
+
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            totals = list(pool.map(_worker_total_power, [str(owner.path)] * 2))
+        assert totals == [sum(hydrator.get_card(c).power for c in hydrator.index)] * 2
+
+        tables.close()
+        path = owner.path
+
+    assert not path.exists()
+    print(f"test_shared_tables: {len(tables.card_ids)} cards")
+    print("test_shared_tables: PASS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# qb_engine/test_transposition.py
+
+from qb_engine.transposition import (
+    ENTRY_SIZE_ESTIMATE,
+    EXACT,
+    LOWER,
+    UPPER,
+    TranspositionTable,
+)
+
+
+def main():
+    # A one-bucket table makes the replacement policy easy to observe
+    tt = TranspositionTable(max_memory_bytes=2 * ENTRY_SIZE_ESTIMATE)
+    assert tt.capacity == 2
+
+    tt.store(key=101, depth=3, score=5.0, bound=EXACT, best_move=("001", 0, 0, "Y"))
+    assert tt.probe(101).score == 5.0
+    assert tt.probe(999) is None
+
+    # Shallower result for another position goes to the always-replace slot
+    tt.store(key=202, depth=1, score=-2.0, bound=UPPER)
+    assert tt.probe(101).depth == 3
+    assert tt.probe(202).bound == UPPER
+
+    # Another shallow result evicts the always-replace slot, not the deep one
+    tt.store(key=303, depth=1, score=1.0, bound=LOWER)
+    assert tt.probe(202) is None
+    assert tt.probe(101) is not None and tt.probe(303) is not None
+    assert tt.stats.evictions == 1
+
+    # A deeper result takes the depth-preferred slot and demotes the old one
+    tt.store(key=404, depth=5, score=9.0, bound=EXACT)
+    assert tt.probe(404).depth == 5
+    assert tt.probe(101).depth == 3
+    assert tt.probe(303) is None
+    assert tt.stats.evictions == 2
+
+    # Re-storing the same position replaces it in place
+    tt.store(key=404, depth=2, score=7.0, bound=LOWER)
+    assert tt.probe(404).score == 7.0
+    assert len(tt) == 2
+
+    print(
+        f"probes={tt.stats.probes} hits={tt.stats.hits} "
+        f"hit_rate={tt.stats.hit_rate:.2f} evictions={tt.stats.evictions}"
+    )
+
+    # The memory cap bounds the table size however many positions are stored
+    big = TranspositionTable(max_memory_bytes=64 * 1024)
+    for key in range(10_000):
+        big.store(key * 2654435761 % (1 << 64), depth=key % 4, score=0.0, bound=EXACT)
+    assert len(big) <= big.capacity
+    assert big.capacity * ENTRY_SIZE_ESTIMATE <= 64 * 1024
+    print(f"capped table: {len(big)} / {big.capacity} slots, {big.stats.evictions} evictions")
+
+    print("test_transposition: PASS")
+
+
+if __name__ == "__main__":
+    main()
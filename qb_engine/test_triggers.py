@@ -0,0 +1,108 @@
+# qb_engine/test_triggers.py
+
+import random
+
+from qb_engine.board_state import BoardState
+from qb_engine.effect_engine import EffectEngine
+from qb_engine.legality import generate_legal_moves
+from qb_engine.moves import Move, apply_move, make_move, unmake_move
+from qb_engine.triggers import EventDispatcher
+from qb_engine.testing import load_engine
+
+
+def bonuses(board: BoardState):
+    return [[tile.power_bonus for tile in row] for row in board.tiles]
+
+
+def naive_played_listeners(board: BoardState, engine: EffectEngine, move: Move):
+    """
+    Reference: scan all 15 tiles for cards reacting to `move`.
+    """
+    fired = []
+    for lane in range(3):
+        for col in range(5):
+            tile = board.tile_at(lane, col)
+            if tile.card_id is None or (lane, col) == (move.lane_index, move.col_index):
+                continue
+            effect_def = engine.get_effect_for_card(engine.card_hydrator.get_card(tile.card_id))
+            if effect_def is None:
+                continue
+            if effect_def.trigger == "on_ally_played" and tile.owner == move.side:
+                fired.append((lane, col))
+            if effect_def.trigger == "on_enemy_played" and tile.owner not in ("N", move.side):
+                fired.append((lane, col))
+    return fired
+
+
+def main() -> None:
+    hydrator, engine = load_engine()
+    events = EventDispatcher(engine)
+    card = hydrator.get_card
+
+    # Reactive "played" listeners: 032 (allied plays), 038 (enemy plays)
+    board = BoardState.create_initial_board()
+    apply_move(board, Move(card("032"), 0, 0, "Y"), events)
+    apply_move(board, Move(card("038"), 0, 4, "E"), events)
+    assert bonuses(board)[0] == [0, 0, 0, 0, 0]      # a card never reacts to itself
+    before = board.zobrist_hash
+    token = make_move(board, Move(card("001"), 1, 0, "Y"), events)
+    assert board.tile_at(0, 0).power_bonus == 1        # allied play
+    assert board.tile_at(0, 4).power_bonus == 1        # enemy play
+    assert engine.compute_effective_power(board, 0, 0) == card("032").power + 1
+    assert board.zobrist_hash == board.compute_zobrist_hash()
+    unmake_move(board, token)
+    assert bonuses(board)[0] == [0, 0, 0, 0, 0]
+    assert board.zobrist_hash == before == board.compute_zobrist_hash()
+
+    # on_play: Grenadier (003) hits enemy cards on its affected tile by -4
+    board = BoardState.create_initial_board()
+    apply_move(board, Move(card("001"), 0, 4, "E"), events)
+    apply_move(board, Move(card("003"), 0, 2, "Y"), events)
+    assert board.tile_at(0, 4).power_bonus == -4
+    assert engine.compute_board_powers(board).powers[0][4] == card("001").power - 4
+
+    # on_destroy: Bloatfloat (037) leaving the board, plus "destroyed" listeners
+    board = BoardState.create_initial_board()
+    apply_move(board, Move(card("043"), 2, 4, "E"), events)   # enemy destroyed -> +1
+    apply_move(board, Move(card("058"), 1, 0, "Y"), events)   # allied destroyed -> +1
+    apply_move(board, Move(card("037"), 0, 0, "Y"), events)
+    apply_move(board, Move(card("011"), 0, 2, "E"), events)   # on 037's E tile
+    removed = board.remove_card(0, 0)
+    lowered = events.on_destroy(board, 0, 0, card(removed), "Y")
+    assert lowered == [2]
+    assert board.tile_at(0, 2).power_bonus == -4
+    assert board.tile_at(2, 4).power_bonus == 1
+    assert board.tile_at(1, 0).power_bonus == 1
+
+    assert events.listener_ids(0) == ("032",)
+
+    # Indexed dispatch fires exactly the listeners a full-board scan finds
+    pool = [card(card_id) for card_id in ("001", "003", "011", "032", "038", "027", "037")]
+    rng = random.Random(15)
+    for _ in range(200):
+        board = BoardState.create_initial_board()
+        for _ply in range(rng.randint(1, 12)):
+            moves = generate_legal_moves(board, pool, board.side_to_move)
+            if not moves:
+                break
+            move = rng.choice(moves)
+            board.place_card_at(move.lane_index, move.col_index, move.card.id)
+            expected = naive_played_listeners(board, engine, move)
+            board.remove_card(move.lane_index, move.col_index)
+
+            previous = bonuses(board)
+            apply_move(board, move, events)
+            changed = [
+                (lane, col)
+                for lane in range(3)
+                for col in range(5)
+                if bonuses(board)[lane][col] > previous[lane][col]
+            ]
+            assert changed == expected, (changed, expected)
+            assert board.zobrist_hash == board.compute_zobrist_hash()
+
+    print("test_triggers: PASS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# qb_engine/test_zobrist.py
+
+import random
+
+from qb_engine.board_state import BoardState
+from qb_engine.moves import Move, apply_move, make_move, unmake_move
+from qb_engine.testing import load_hydrator, random_move
+
+
+def check_hash(board: BoardState) -> None:
+    assert board.zobrist_hash == board.compute_zobrist_hash()
+
+
+def main():
+    hydrator = load_hydrator()
+    cards = [hydrator.get_card(card_id) for card_id in ("001", "006", "027", "037", "020")]
+    rng = random.Random(11)
+
+    # 1) Incremental hash always equals a from-scratch hash, and unmake
+    #    restores the exact key.
+    for _ in range(50):
+        board = BoardState.create_initial_board()
+        start = board.zobrist_hash
+        tokens = []
+        for _ply in range(6):
+            move = random_move(board, cards, board.side_to_move, rng)
+            if move is None:
+                break
+            before = board.zobrist_hash
+            tokens.append((make_move(board, move), before))
+            check_hash(board)
+        while tokens:
+            token, before = tokens.pop()
+            unmake_move(board, token)
+            assert board.zobrist_hash == before
+            check_hash(board)
+        assert board.zobrist_hash == start
+
+    # 2) Transpositions: the same position via two move orders hashes the same
+    c001 = hydrator.get_card("001")
+    line_a = [Move(c001, 0, 0, "Y"), Move(c001, 0, 4, "E"), Move(c001, 2, 0, "Y")]
+    line_b = [Move(c001, 2, 0, "Y"), Move(c001, 0, 4, "E"), Move(c001, 0, 0, "Y")]
+
+    board_a = BoardState.create_initial_board()
+    board_b = BoardState.create_initial_board()
+    for move in line_a:
+        apply_move(board_a, move)
+    for move in line_b:
+        apply_move(board_b, move)
+
+    board_a.print_board()
+    same_tiles = [[(t.owner, t.rank, t.card_id) for t in row] for row in board_a.tiles] == [
+        [(t.owner, t.rank, t.card_id) for t in row] for row in board_b.tiles
+    ]
+    assert same_tiles
+    assert board_a.zobrist_hash == board_b.zobrist_hash
+    print(f"Transposed position key: {board_a.zobrist_hash:016x}")
+
+    # 3) Side to move is part of the key
+    before = board_a.zobrist_hash
+    board_a.set_side_to_move("Y" if board_a.side_to_move == "E" else "E")
+    assert board_a.zobrist_hash != before
+    check_hash(board_a)
+
+    # 4) Pawn-delta provenance is part of the key: equal owner/rank from
+    #    different cards' pawns must not collide, since destroying one of
+    #    those cards later reverts only its own deltas
+    board_a = BoardState.create_initial_board()
+    board_b = BoardState.create_initial_board()
+    board_a.add_pawn_delta(0, 2, "001", 1, 0, 0)
+    board_b.add_pawn_delta(0, 2, "006", 1, 0, 0)
+    assert board_a.tile_at(0, 2).owner == board_b.tile_at(0, 2).owner == "Y"
+    assert board_a.zobrist_hash != board_b.zobrist_hash
+    board_a.remove_pawn_deltas_for_card("001")
+    assert board_a.tile_at(0, 2).owner != board_b.tile_at(0, 2).owner
+    check_hash(board_a)
+    check_hash(board_b)
+
+    print("test_zobrist: PASS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# qb_engine/testing.py
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
+
+from qb_engine.bitboard import iter_tiles
+from qb_engine.board_state import BoardState
+from qb_engine.card_hydrator import CardHydrator
+from qb_engine.effect_engine import EffectEngine
+from qb_engine.legality import generate_legal_moves
+from qb_engine.models import Card
+from qb_engine.moves import Move, apply_move
+from qb_engine.runtime import DATA_DIR, DEFAULT_DB_PATH, DEFAULT_REGISTRY_PATH
+
+if TYPE_CHECKING:
+    from qb_engine.moves import PlayEvents
+
+
+# Shared fixtures for the qb_engine/test_*.py scripts, so every test
+# builds its engine and random positions the same way.
+
+# Repo root (the directory holding qb_engine/ and data/)
+PACKAGE_ROOT = DATA_DIR.parent
+
+
+def load_hydrator() -> CardHydrator:
+    """
+    A fresh CardHydrator on the repo's card DB.
+    """
+    return CardHydrator(DEFAULT_DB_PATH)
+
+
+def load_engine() -> Tuple[CardHydrator, EffectEngine]:
+    """
+    A fresh hydrator and an EffectEngine on the repo's effect registry.
+    """
+    hydrator = load_hydrator()
+    return hydrator, EffectEngine(DEFAULT_REGISTRY_PATH, hydrator)
+
+
+def random_move(
+    board: BoardState,
+    cards: Sequence[Card],
+    side: str,
+    rng: random.Random,
+) -> Optional[Move]:
+    """
+    A uniformly random legal placement of any of `cards` (None if there
+    is none). Options are listed card by card, tiles row-major.
+    """
+    options = [
+        Move(card, lane_index, col_index, side)
+        for card in cards
+        for lane_index, col_index in iter_tiles(board.legal_tiles_mask(card.cost, side))
+    ]
+    return rng.choice(options) if options else None
+
+
+def random_board(cards: Sequence[Card], rng: random.Random, plies: int) -> BoardState:
+    """
+    A board after up to `plies` random_move placements, both sides
+    drawing from `cards` (no triggers).
+    """
+    board = BoardState.create_initial_board()
+    for _ in range(plies):
+        move = random_move(board, cards, board.side_to_move, rng)
+        if move is None:
+            break
+        apply_move(board, move)
+    return board
+
+
+def play_random_moves(
+    board: BoardState,
+    pool: Sequence[Card],
+    rng: random.Random,
+    plies: int,
+    events: Optional[PlayEvents] = None,
+) -> BoardState:
+    """
+    Play up to `plies` random generate_legal_moves placements from `pool`
+    for whichever side is to move, stopping early if it has none.
+    """
+    for _ in range(plies):
+        moves = generate_legal_moves(board, pool, board.side_to_move)
+        if not moves:
+            break
+        apply_move(board, rng.choice(moves), events)
+    return board
+
+
+def random_position(
+    pool: Sequence[Card],
+    rng: random.Random,
+) -> Tuple[BoardState, List[Card], List[Card]]:
+    """
+    A search position: up to 6 random plies, each from a random 3-card
+    hand, then random hands of 2-5 cards for YOU and ENEMY.
+    """
+    board = BoardState.create_initial_board()
+    for _ in range(rng.randint(0, 6)):
+        side = board.side_to_move
+        moves = generate_legal_moves(board, [rng.choice(pool) for _ in range(3)], side)
+        if not moves:
+            break
+        apply_move(board, rng.choice(moves))
+    your_hand = [rng.choice(pool) for _ in range(rng.randint(2, 5))]
+    enemy_hand = [rng.choice(pool) for _ in range(rng.randint(2, 5))]
+    return board, your_hand, enemy_hand
@@ -0,0 +1,149 @@
+# qb_engine/transposition.py
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+from qb_engine.moves import MoveKey
+
+
+# Bound types for stored scores
+EXACT = 0   # score is the exact minimax value
+LOWER = 1   # score is a lower bound (search failed high, value >= score)
+UPPER = 2   # score is an upper bound (search failed low,  value <= score)
+
+# Rough per-entry footprint used to turn a memory cap into a slot count
+# (TTEntry object + its ints + a MoveKey tuple, on 64-bit CPython).
+ENTRY_SIZE_ESTIMATE = 240
+
+DEFAULT_MAX_MEMORY_BYTES = 32 * 1024 * 1024
+
+
+@dataclass
+class TTEntry:
+    """
+    One stored search result.
+
+    - key:       full 64-bit position key (guards against bucket collisions)
+    - depth:     remaining search depth the score was computed with
+    - score:     evaluation from YOU's point of view
+    - bound:     EXACT / LOWER / UPPER
+    - best_move: MoveKey of the best move found, if any
+    """
+    key: int
+    depth: int
+    score: float
+    bound: int
+    best_move: Optional[MoveKey] = None
+
+
+@dataclass
+class TTStats:
+    probes: int = 0
+    hits: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.probes if self.probes else 0.0
+
+
+class TranspositionTable:
+    """
+    Fixed-size transposition table keyed by position hash.
+
+    Each bucket has two slots:
+      - a depth-preferred slot, replaced only by an entry searched at least
+        as deep (or by the same position);
+      - an always-replace slot, which takes whatever the depth-preferred
+        slot refuses.
+
+    The number of buckets is derived from max_memory_bytes, so the table
+    never grows past its cap no matter how long a search runs.
+    """
+
+    def __init__(self, max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES) -> None:
+        num_buckets = max(1, max_memory_bytes // (2 * ENTRY_SIZE_ESTIMATE))
+        self._num_buckets = num_buckets
+        self._deep: List[Optional[TTEntry]] = [None] * num_buckets
+        self._recent: List[Optional[TTEntry]] = [None] * num_buckets
+        self.stats = TTStats()
+
+    # --------------------------------------------------------------------- #
+    # Public API
+    # --------------------------------------------------------------------- #
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of entries held at once."""
+        return 2 * self._num_buckets
+
+    def __len__(self) -> int:
+        return sum(1 for e in self._deep if e is not None) + sum(
+            1 for e in self._recent if e is not None
+        )
+
+    def probe(self, key: int) -> Optional[TTEntry]:
+        """
+        Return the stored entry for `key` (preferring the deeper slot), or None.
+        """
+        self.stats.probes += 1
+        bucket = key % self._num_buckets
+
+        entry = self._deep[bucket]
+        if entry is not None and entry.key == key:
+            self.stats.hits += 1
+            return entry
+
+        entry = self._recent[bucket]
+        if entry is not None and entry.key == key:
+            self.stats.hits += 1
+            return entry
+
+        return None
+
+    def store(
+        self,
+        key: int,
+        depth: int,
+        score: float,
+        bound: int,
+        best_move: Optional[MoveKey] = None,
+    ) -> None:
+        """
+        Store a search result using the depth-preferred / always-replace scheme.
+        """
+        self.stats.stores += 1
+        bucket = key % self._num_buckets
+        entry = TTEntry(key=key, depth=depth, score=score, bound=bound, best_move=best_move)
+
+        deep = self._deep[bucket]
+        if deep is None or deep.key == key or depth >= deep.depth:
+            self._drop_duplicate_recent(bucket, key)
+            if deep is not None and deep.key != key:
+                # Demote the old deep entry rather than dropping it outright
+                self._replace_recent(bucket, deep)
+            self._deep[bucket] = entry
+            return
+
+        self._replace_recent(bucket, entry)
+
+    def clear(self) -> None:
+        self._deep = [None] * self._num_buckets
+        self._recent = [None] * self._num_buckets
+        self.stats = TTStats()
+
+    # --------------------------------------------------------------------- #
+    # Internals
+    # --------------------------------------------------------------------- #
+
+    def _replace_recent(self, bucket: int, entry: TTEntry) -> None:
+        old = self._recent[bucket]
+        if old is not None and old.key != entry.key:
+            self.stats.evictions += 1
+        self._recent[bucket] = entry
+
+    def _drop_duplicate_recent(self, bucket: int, key: int) -> None:
+        recent = self._recent[bucket]
+        if recent is not None and recent.key == key:
+            self._recent[bucket] = None
@@ -0,0 +1,174 @@
+# qb_engine/triggers.py
+
+from typing import List, Optional, Tuple
+
+from qb_engine.bitboard import NUM_COLS, iter_indices
+from qb_engine.board_state import BoardState
+from qb_engine.effect_engine import (
+    EVENT_ALLY_DESTROYED,
+    EVENT_ALLY_PLAYED,
+    EVENT_ENEMY_DESTROYED,
+    EVENT_ENEMY_PLAYED,
+    NO_EFFECT,
+    NUM_EVENTS,
+    TRIGGER_ON_DESTROY,
+    TRIGGER_ON_PLAY,
+    EffectEngine,
+)
+from qb_engine.models import Card
+from qb_engine.projection import compute_projection_targets
+
+
+class EventDispatcher:
+    """
+    Resolves triggered effects as cards are played and destroyed.
+
+    - on_play / on_destroy effects hit the cards on the source card's
+      affected (E/X) tiles that match the effect's scope.
+    - Reactive effects ("when allied/enemy cards are played/destroyed")
+      fire on the listening cards themselves.
+
+    Results are written as BoardState power bonuses, so they are undoable
+    and part of the position hash.
+
+    Listeners are indexed once per event kind (played/destroyed x
+    allied/enemy) by card id from the compiled registry. Their copies in
+    play come from the board's card-location index, so an event only
+    touches its subscribed cards and never scans the board.
+    """
+
+    def __init__(self, effect_engine: EffectEngine) -> None:
+        self._effect_engine = effect_engine
+        self._compiled = effect_engine.compiled
+
+        listener_ids: List[List[str]] = [[] for _ in range(NUM_EVENTS)]
+        for card_id, row in sorted(self._compiled.card_rows.items()):
+            for event in range(NUM_EVENTS):
+                if (self._compiled.listens[row] >> event) & 1:
+                    listener_ids[event].append(card_id)
+        self._listener_ids: Tuple[Tuple[str, ...], ...] = tuple(
+            tuple(ids) for ids in listener_ids
+        )
+
+    @property
+    def effect_engine(self) -> EffectEngine:
+        return self._effect_engine
+
+    # --------------------------------------------------------------------- #
+    # Public API
+    # --------------------------------------------------------------------- #
+
+    def listener_ids(self, event: int) -> Tuple[str, ...]:
+        """
+        Card ids whose effect listens to `event` (an EVENT_* kind).
+        """
+        return self._listener_ids[event]
+
+    def on_play(
+        self,
+        board: BoardState,
+        lane_index: int,
+        col_index: int,
+        card: Card,
+        side: str,
+    ) -> List[int]:
+        """
+        Fire the played card's on_play effect, then notify "played"
+        listeners. Call after the card is placed and projected.
+
+        Returns the tile indices whose card lost power (for destruction
+        checks), in resolution order.
+        """
+        lowered: List[int] = []
+        row = self._compiled.row_for(card.id)
+        if row != NO_EFFECT and self._compiled.triggers[row] == TRIGGER_ON_PLAY:
+            self._apply_to_affected_tiles(board, lane_index, col_index, card, side, row, lowered)
+
+        self._notify(
+            board, EVENT_ALLY_PLAYED, EVENT_ENEMY_PLAYED, side,
+            exclude=(lane_index, col_index), lowered=lowered,
+        )
+        return lowered
+
+    def on_destroy(
+        self,
+        board: BoardState,
+        lane_index: int,
+        col_index: int,
+        card: Card,
+        side: str,
+    ) -> List[int]:
+        """
+        Fire a destroyed card's on_destroy effect from the tile it stood on,
+        then notify "destroyed" listeners. Call after the card has left
+        the board; `side` is the side it belonged to.
+
+        Returns the tile indices whose card lost power.
+        """
+        lowered: List[int] = []
+        row = self._compiled.row_for(card.id)
+        if row != NO_EFFECT and self._compiled.triggers[row] == TRIGGER_ON_DESTROY:
+            self._apply_to_affected_tiles(board, lane_index, col_index, card, side, row, lowered)
+
+        self._notify(
+            board, EVENT_ALLY_DESTROYED, EVENT_ENEMY_DESTROYED, side,
+            exclude=None, lowered=lowered,
+        )
+        return lowered
+
+    # --------------------------------------------------------------------- #
+    # Internals
+    # --------------------------------------------------------------------- #
+
+    def _apply_to_affected_tiles(
+        self,
+        board: BoardState,
+        lane_index: int,
+        col_index: int,
+        card: Card,
+        side: str,
+        row: int,
+        lowered: List[int],
+    ) -> None:
+        compiled = self._compiled
+        scope = compiled.scopes[row]
+        amount = compiled.power_deltas[row]
+
+        proj = compute_projection_targets(lane_index, col_index, card, side)
+        for index in iter_indices(proj.effect_mask & board.masks.occupied):
+            target_lane, target_col = divmod(index, NUM_COLS)
+            tile = board.tiles[target_lane][target_col]
+            if not EffectEngine.scope_code_applies(scope, tile.owner, side, tile.card_id, card.id):
+                continue
+            board.add_power_bonus(target_lane, target_col, amount)
+            if amount < 0:
+                lowered.append(index)
+
+    def _notify(
+        self,
+        board: BoardState,
+        ally_event: int,
+        enemy_event: int,
+        side: str,
+        exclude: Optional[Tuple[int, int]],
+        lowered: List[int],
+    ) -> None:
+        """
+        Fire reactive effects of listeners on `side` (ally_event) and on
+        the opposing side (enemy_event), in row-major tile order.
+        """
+        other = "E" if side == "Y" else "Y"
+        fired: List[Tuple[int, int, str]] = []
+        for event, listener_side in ((ally_event, side), (enemy_event, other)):
+            for card_id in self._listener_ids[event]:
+                for lane_index, col_index in board.locate_card(card_id):
+                    if (lane_index, col_index) == exclude:
+                        continue
+                    if board.tiles[lane_index][col_index].owner == listener_side:
+                        fired.append((lane_index, col_index, card_id))
+
+        for lane_index, col_index, card_id in sorted(fired):
+            amount = self._compiled.power_deltas[self._compiled.row_for(card_id)]
+            board.add_power_bonus(lane_index, col_index, amount)
+            if amount < 0:
+                lowered.append(lane_index * NUM_COLS + col_index)
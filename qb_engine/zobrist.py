@@ -0,0 +1,113 @@
+# qb_engine/zobrist.py
+
+import random
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Iterable, List, Optional
+
+from qb_engine.bitboard import MAX_RANK, NUM_TILES
+
+
+# Zobrist keys for BoardState position hashing.
+#
+# A position hash is the XOR of one 64-bit key per feature present:
+#   - (tile, owner, rank) for every tile
+#   - (tile, occupant card id) for every occupied tile
+#   - (tile, source card id, source tile) for every effect aura
+#   - (tile, power bonus) for every tile with a non-zero power bonus
+#   - (tile, card id, source tile, amount) for every pawn delta
+#   - the side to move, when it is ENEMY
+# so each feature can be toggled in or out of the hash in O(1).
+#
+# Owner/rank alone is not enough: destroying a card reverts its pawn
+# deltas, so two boards with equal owner/rank but different delta
+# provenance can diverge after a later destruction. Hashing the deltas
+# keeps those positions apart. (Two identical deltas would cancel out, but
+# a card projects at most one delta per tile from a given source tile.)
+#
+# Keys are derived deterministically (fixed seed / blake2b, never Python's
+# randomized str hash) so hashes agree across processes and runs.
+
+_SEED = 0x51B0A4D5
+
+_OWNER_CODES = {"Y": 0, "E": 1, "N": 2}
+
+_rng = random.Random(_SEED)
+
+# TILE_STATE_KEYS[index][owner_code][rank]
+TILE_STATE_KEYS: List[List[List[int]]] = [
+    [[_rng.getrandbits(64) for _ in range(MAX_RANK + 1)] for _ in _OWNER_CODES]
+    for _ in range(NUM_TILES)
+]
+
+# XORed in while ENEMY is to move
+SIDE_TO_MOVE_KEY: int = _rng.getrandbits(64)
+
+# XORed in by search code after one side has passed
+PASS_KEY: int = _rng.getrandbits(64)
+
+
+def _derive_key(*parts: object) -> int:
+    digest = blake2b(repr(parts).encode("utf-8"), digest_size=8, key=b"qb-zobrist")
+    return int.from_bytes(digest.digest(), "little")
+
+
+def tile_state_key(index: int, owner: str, rank: int) -> int:
+    return TILE_STATE_KEYS[index][_OWNER_CODES[owner]][min(max(rank, 0), MAX_RANK)]
+
+
+@lru_cache(maxsize=None)
+def occupant_key(index: int, card_id: str) -> int:
+    return _derive_key("occupant", index, card_id)
+
+
+@lru_cache(maxsize=None)
+def aura_key(
+    index: int,
+    card_id: str,
+    source_lane_index: Optional[int],
+    source_col_index: Optional[int],
+) -> int:
+    return _derive_key("aura", index, card_id, source_lane_index, source_col_index)
+
+
+@lru_cache(maxsize=None)
+def pawn_delta_key(
+    index: int,
+    card_id: str,
+    source_lane_index: Optional[int],
+    source_col_index: Optional[int],
+    amount: int,
+) -> int:
+    return _derive_key("pawn_delta", index, card_id, source_lane_index, source_col_index, amount)
+
+
+@lru_cache(maxsize=None)
+def power_bonus_key(index: int, bonus: int) -> int:
+    """
+    Key for a tile's accumulated power bonus (0 for no bonus).
+    """
+    if bonus == 0:
+        return 0
+    return _derive_key("power_bonus", index, bonus)
+
+
+@lru_cache(maxsize=None)
+def hand_key(side: str, card_id: str, copy_number: int) -> int:
+    """
+    Key for holding the copy_number-th copy (1-based) of card_id in a hand.
+    """
+    return _derive_key("hand", side, card_id, copy_number)
+
+
+def hand_hash(side: str, card_ids: Iterable[str]) -> int:
+    """
+    Order-independent hash of a hand. Playing one copy of card_id from a
+    hand holding n copies XORs out hand_key(side, card_id, n).
+    """
+    h = 0
+    counts = {}
+    for card_id in card_ids:
+        counts[card_id] = counts.get(card_id, 0) + 1
+        h ^= hand_key(side, card_id, counts[card_id])
+    return h
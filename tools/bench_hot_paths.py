@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Hot-path benchmarks for qb_engine, with JSON baselines.
+
+    python tools/bench_hot_paths.py                       # print results
+    python tools/bench_hot_paths.py --save base.json      # record a baseline
+    python tools/bench_hot_paths.py --compare base.json   # flag regressions
+
+Every benchmark runs on three canned positions (early / mid / late game)
+replayed from fixed move lists with real DB cards. Each result is the
+best-of-N time per operation in nanoseconds; --compare exits with status
+1 if any benchmark is slower than the baseline by more than --threshold.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Sequence, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from qb_engine.bitboard import ALL_TILES_MASK, NUM_COLS, NUM_LANES, iter_indices  # noqa: E402
+from qb_engine.board_state import BoardState  # noqa: E402
+from qb_engine.destruction import CardDestructionEngine  # noqa: E402
+from qb_engine.effect_engine import EffectEngine  # noqa: E402
+from qb_engine.legality import generate_legal_moves, is_legal_placement  # noqa: E402
+from qb_engine.models import Card  # noqa: E402
+from qb_engine.moves import Move, apply_move, make_move, unmake_move  # noqa: E402
+from qb_engine.projection import apply_pawns_for_you, compute_projection_targets  # noqa: E402
+from qb_engine.runtime import get_effect_engine  # noqa: E402
+
+
+BASELINE_FORMAT = 1
+
+# Cards both sides hold in every position
+HAND_IDS = ("001", "002", "003", "008", "011", "013", "027", "037", "043", "058", "113", "120")
+
+# (side, card_id, lane_index, col_index), from a seeded random game;
+# includes destructions on MID-2 by the late position
+GAME: Tuple[Tuple[str, str, int, int], ...] = (
+    ("Y", "008", 1, 0), ("E", "001", 2, 4), ("Y", "011", 2, 0), ("E", "002", 1, 4),
+    ("Y", "037", 1, 1), ("E", "037", 1, 3), ("Y", "037", 0, 1), ("E", "058", 0, 4),
+    ("Y", "027", 0, 0), ("E", "013", 0, 3), ("Y", "001", 1, 1), ("E", "037", 2, 3),
+    ("Y", "001", 1, 1), ("E", "043", 0, 2), ("Y", "037", 1, 1), ("E", "001", 1, 2),
+)
+
+# Position name -> number of plies of GAME played
+# (the late position is ENEMY to move: YOU has no legal move left there)
+POSITIONS = {"early": 2, "mid": 8, "late": 15}
+
+
+def build_position(engine: EffectEngine, events: CardDestructionEngine, plies: int) -> BoardState:
+    hydrator = engine.card_hydrator
+    board = BoardState.create_initial_board()
+    for side, card_id, lane_index, col_index in GAME[:plies]:
+        card = hydrator.get_card(card_id)
+        assert board.side_to_move == side
+        assert is_legal_placement(board, lane_index, col_index, card, side), (card_id, lane_index, col_index)
+        apply_move(board, Move(card, lane_index, col_index, side), events)
+    return board
+
+
+# ------------------------------------------------------------------------- #
+# Benchmarks: each returns (operation, ops per call) for one position
+# ------------------------------------------------------------------------- #
+
+Bench = Tuple[Callable[[], None], int]
+
+
+def bench_projection(board: BoardState, hand: Sequence[Card], engine, events) -> Bench:
+    roots = [(lane, col) for lane in range(NUM_LANES) for col in range(NUM_COLS)]
+
+    def run() -> None:
+        for card in hand:
+            for lane_index, col_index in roots:
+                compute_projection_targets(lane_index, col_index, card, "Y")
+                compute_projection_targets(lane_index, col_index, card, "E")
+
+    return run, len(hand) * len(roots) * 2
+
+
+def bench_apply_pawns(board: BoardState, hand: Sequence[Card], engine, events) -> Bench:
+    # Every card rooted on every empty tile (pawns do not depend on
+    # legality); includes the undo-frame push/pop that restores the board
+    empty = [divmod(index, NUM_COLS) for index in iter_indices(ALL_TILES_MASK & ~board.masks.occupied)]
+    projections = [
+        (compute_projection_targets(lane_index, col_index, card, "Y"), card)
+        for card in hand
+        for lane_index, col_index in empty
+    ]
+
+    def run() -> None:
+        for proj, card in projections:
+            mark = board.push_undo_frame()
+            apply_pawns_for_you(board, proj, card)
+            board.pop_undo_frame(mark)
+
+    return run, len(projections)
+
+
+def bench_recompute_influence(board: BoardState, hand: Sequence[Card], engine, events) -> Bench:
+    def run() -> None:
+        board.recompute_influence_from_deltas()
+
+    return run, 1
+
+
+def bench_effective_power(board: BoardState, hand: Sequence[Card], engine: EffectEngine, events) -> Bench:
+    occupied = [divmod(index, NUM_COLS) for index in iter_indices(board.masks.occupied)]
+
+    def run() -> None:
+        for lane_index, col_index in occupied:
+            engine.compute_effective_power(board, lane_index, col_index)
+
+    return run, max(len(occupied), 1)
+
+
+def bench_legality(board: BoardState, hand: Sequence[Card], engine, events) -> Bench:
+    tiles = [(lane, col) for lane in range(NUM_LANES) for col in range(NUM_COLS)]
+
+    def run() -> None:
+        for card in hand:
+            for lane_index, col_index in tiles:
+                is_legal_placement(board, lane_index, col_index, card, "Y")
+
+    return run, len(hand) * len(tiles)
+
+
+def bench_move_simulation(board: BoardState, hand: Sequence[Card], engine, events) -> Bench:
+    # Full make (projection, triggers, destruction) + unmake of every legal move
+    moves = generate_legal_moves(board, hand, board.side_to_move)
+
+    def run() -> None:
+        for move in moves:
+            unmake_move(board, make_move(board, move, events))
+
+    return run, max(len(moves), 1)
+
+
+BENCHMARKS: Dict[str, Callable[..., Bench]] = {
+    "compute_projection_targets": bench_projection,
+    "apply_pawns_for_you": bench_apply_pawns,
+    "recompute_influence_from_deltas": bench_recompute_influence,
+    "compute_effective_power": bench_effective_power,
+    "is_legal_placement": bench_legality,
+    "move_simulation": bench_move_simulation,
+}
+
+
+def time_per_op(run: Callable[[], None], ops: int, repeat: int, min_time: float) -> float:
+    """
+    Best-of-`repeat` nanoseconds per op; each sample loops `run` for at
+    least `min_time` seconds.
+    """
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops *= 2
+
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        best = min(best, time.perf_counter() - start)
+    return best / (loops * ops) * 1e9
+
+
+def run_benchmarks(repeat: int, min_time: float, only: Sequence[str] = ()) -> Dict[str, dict]:
+    engine = get_effect_engine()
+    events = CardDestructionEngine(engine)
+    hand = [engine.card_hydrator.get_card(card_id) for card_id in HAND_IDS]
+
+    results: Dict[str, dict] = {}
+    for position, plies in POSITIONS.items():
+        board = build_position(engine, events, plies)
+        fingerprint = board.zobrist_hash
+        for name, factory in BENCHMARKS.items():
+            if only and name not in only:
+                continue
+            run, ops = factory(board, hand, engine, events)
+            ns = time_per_op(run, ops, repeat, min_time)
+            assert board.zobrist_hash == fingerprint, f"{name} left the board modified"
+            results[f"{position}/{name}"] = {"ns_per_op": round(ns, 1), "ops": ops}
+    return results
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[str]:
+    """
+    Print a comparison table; return the names of regressed benchmarks.
+    """
+    regressions: List[str] = []
+    print(f"{'benchmark':<45} {'base ns':>10} {'now ns':>10} {'ratio':>7}")
+    for name, entry in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<45} {'-':>10} {entry['ns_per_op']:>10.1f}     new")
+            continue
+        ratio = entry["ns_per_op"] / base["ns_per_op"]
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            flag = "  faster"
+        print(f"{name:<45} {base['ns_per_op']:>10.1f} {entry['ns_per_op']:>10.1f} {ratio:>7.2f}{flag}")
+    return regressions
+
+
+def main(argv: Sequence[str] = ()) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--save", metavar="PATH", help="write results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare against a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="allowed slowdown before flagging, as a fraction (default 0.10)")
+    parser.add_argument("--repeat", type=int, default=5, help="samples per benchmark (best is kept)")
+    parser.add_argument("--min-time", type=float, default=0.05, help="seconds per sample")
+    parser.add_argument("--only", nargs="*", default=(), choices=sorted(BENCHMARKS),
+                        help="run only these benchmarks")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.repeat, args.min_time, args.only)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("format") != BASELINE_FORMAT:
+            print(f"Unsupported baseline format in {args.compare}")
+            return 2
+        regressions = compare(results, baseline["results"], args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+    else:
+        regressions = []
+        for name, entry in results.items():
+            print(f"{name:<45} {entry['ns_per_op']:>10.1f} ns/op")
+
+    if args.save:
+        payload = {
+            "format": BASELINE_FORMAT,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.platform(),
+            "repeat": args.repeat,
+            "min_time": args.min_time,
+            "results": results,
+        }
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2)
+            f.write("\n")
+        print(f"Baseline written to {args.save}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))